@@ -0,0 +1,124 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+import itertools
+
+import array_api_compat
+import numpy as np
+import pytest
+
+from earthkit.utils.array import array_namespace, convert
+from earthkit.utils.array.convert import convert_dtype
+from earthkit.utils.array.namespace import UnknownPatchedNamespace
+from earthkit.utils.array.testing.testing import ARRAY_NAMES, NAMESPACE_DEVICES, NO_DASK
+
+pytest.importorskip("pytest_benchmark")
+
+SHAPE = (100, 10000)
+
+# every ordered pair of the locally available backends, including identity
+CONVERT_NAMES = ARRAY_NAMES + ([] if NO_DASK else ["dask"])
+CONVERT_PAIRS = list(itertools.product(CONVERT_NAMES, CONVERT_NAMES))
+
+# the generic implementation is benchmarked next to the patched namespaces
+NAMESPACES = NAMESPACE_DEVICES + [(UnknownPatchedNamespace(array_api_compat.numpy), "cpu")]
+
+
+def _id(param):
+    if isinstance(param, UnknownPatchedNamespace):
+        return param._earthkit_array_namespace_name
+    return str(param)
+
+
+@pytest.fixture(params=NAMESPACES, ids=lambda p: "-".join(_id(x) for x in p))
+def data(request):
+    xp, device = request.param
+    rng = np.random.default_rng(0)
+    a = xp.asarray(rng.random(SHAPE), device=device)
+    w = xp.asarray(rng.random(SHAPE) + 0.1, device=device)
+    return xp, a, w
+
+
+def _sync(xp, result):
+    # force the computation on asynchronous backends
+    if isinstance(result, tuple):
+        result = result[0]
+    return float(xp.sum(result))
+
+
+def _source(name, shape=(1000, 1000)):
+    data = np.random.default_rng(0).random(shape)
+    if name == "dask":
+        import dask.array as da
+
+        return da.from_array(data, chunks=250)
+    return convert(data, array_namespace=name)
+
+
+@pytest.mark.benchmark(group="array_namespace")
+@pytest.mark.parametrize("name", CONVERT_NAMES)
+def test_bench_array_namespace(benchmark, name):
+    x = _source(name, (10,))
+    benchmark(array_namespace, x)
+
+
+@pytest.mark.benchmark(group="array_namespace")
+def test_bench_array_namespace_str(benchmark):
+    benchmark(array_namespace, "numpy")
+
+
+@pytest.mark.benchmark(group="convert")
+@pytest.mark.parametrize("source, target", CONVERT_PAIRS, ids=[f"{s}-{t}" for s, t in CONVERT_PAIRS])
+def test_bench_convert(benchmark, source, target):
+    x = _source(source)
+    benchmark(convert, x, array_namespace=target)
+
+
+@pytest.mark.benchmark(group="convert_dtype")
+@pytest.mark.parametrize("name", ARRAY_NAMES)
+def test_bench_convert_dtype(benchmark, name):
+    benchmark(convert_dtype, np.float32, name)
+
+
+@pytest.mark.benchmark(group="percentile")
+def test_bench_percentile(benchmark, data):
+    xp, a, _ = data
+    q = xp.asarray([10.0, 50.0, 90.0], dtype=a.dtype, device=xp.device(a))
+    benchmark(lambda: _sync(xp, xp.percentile(a, q, axis=1)))
+
+
+@pytest.mark.benchmark(group="histogramdd")
+def test_bench_histogramdd(benchmark, data):
+    xp, a, _ = data
+    sample = xp.reshape(a, (-1, 2))
+    benchmark(lambda: _sync(xp, xp.histogramdd(sample, bins=[50, 50])))
+
+
+@pytest.mark.benchmark(group="weighted_mean")
+def test_bench_weighted_mean(benchmark, data):
+    xp, a, w = data
+    benchmark(lambda: _sync(xp, xp.weighted_mean(a, w, axis=1)))
+
+
+@pytest.mark.benchmark(group="weighted_quantile")
+def test_bench_weighted_quantile(benchmark, data):
+    xp, a, w = data
+    q = xp.asarray([0.1, 0.5, 0.9], device=xp.device(a))
+    benchmark(lambda: _sync(xp, xp.weighted_quantile(a, q, w, axis=1)))
+
+
+@pytest.mark.benchmark(group="running_mean")
+def test_bench_running_mean(benchmark, data):
+    xp, a, _ = data
+    benchmark(lambda: _sync(xp, xp.running_mean(a, 24, axis=1)))
+
+
+@pytest.mark.benchmark(group="cumulative_histogram")
+def test_bench_cumulative_histogram(benchmark, data):
+    xp, a, _ = data
+    benchmark(lambda: _sync(xp, xp.cumulative_histogram(a, bins=100)))
@@ -0,0 +1,88 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from earthkit.utils.decorators import _dispatch as dispatch_module
+from earthkit.utils.decorators import dispatch, format_handler, thread_safe_cached_property
+
+pytest.importorskip("pytest_benchmark")
+
+TEST_NUMPY = np.array([1, 2, 3])
+
+
+def _plain(data: np.ndarray, param: int = 1):
+    return data
+
+
+_handled = format_handler()(_plain)
+
+
+@pytest.mark.benchmark(group="format_handler")
+def test_bench_plain_call(benchmark):
+    benchmark(_plain, TEST_NUMPY, param=2)
+
+
+@pytest.mark.benchmark(group="format_handler")
+def test_bench_format_handler_noop(benchmark):
+    benchmark(_handled, TEST_NUMPY, param=2)
+
+
+@pytest.mark.benchmark(group="format_handler")
+def test_bench_format_handler_transform(benchmark):
+    xr = pytest.importorskip("xarray")
+    pytest.importorskip("earthkit.data")
+
+    @format_handler()
+    def _xarray_handler(data: xr.Dataset | xr.DataArray):
+        return data
+
+    benchmark(_xarray_handler, TEST_NUMPY)
+
+
+def _dispatched(data, param=1):
+    return dispatch(_dispatched)(data, param=param)
+
+
+@pytest.mark.benchmark(group="dispatch")
+def test_bench_dispatch_array(benchmark, monkeypatch):
+    # the implementation module is replaced to only measure the routing
+    module = types.SimpleNamespace(_dispatched=_plain)
+    monkeypatch.setattr(dispatch_module, "import_module", lambda name: module)
+    benchmark(_dispatched, TEST_NUMPY, param=2)
+
+
+class _Lazy:
+    @thread_safe_cached_property
+    def data(self):
+        # stands in for I/O bound metadata loading which releases the GIL
+        time.sleep(0.001)
+        return 1
+
+
+def _warm(objects, n_threads):
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        list(executor.map(lambda x: x.data, objects))
+
+
+@pytest.mark.benchmark(group="thread_safe_cached_property")
+@pytest.mark.parametrize("n_threads", [1, 4, 16])
+def test_bench_cached_property_contention(benchmark, n_threads):
+    benchmark.pedantic(_warm, setup=lambda: (([_Lazy() for _ in range(256)], n_threads), {}), rounds=5)
+
+
+@pytest.mark.benchmark(group="thread_safe_cached_property")
+def test_bench_cached_property_cached(benchmark):
+    obj = _Lazy()
+    obj.data
+    benchmark(lambda: obj.data)
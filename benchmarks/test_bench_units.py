@@ -0,0 +1,40 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+import numpy as np
+import pytest
+
+from earthkit.utils.units import Units, convert_array, convert_dataset
+
+pytest.importorskip("pytest_benchmark")
+
+DATA = np.random.default_rng(0).random(100000) + 273.15
+
+
+@pytest.mark.benchmark(group="Units.from_any")
+@pytest.mark.parametrize("units", ["K", "m s**-1", "kg m**-2 s**-1", "unknown_unit"])
+def test_bench_units_from_any(benchmark, units):
+    benchmark(Units.from_any, units)
+
+
+@pytest.mark.benchmark(group="convert_array")
+@pytest.mark.parametrize("source, target", [("K", "degC"), ("m/s", "km/h"), ("m", "m")])
+def test_bench_convert_array(benchmark, source, target):
+    benchmark(convert_array, DATA, target_units=target, source_units=source)
+
+
+@pytest.mark.benchmark(group="convert_dataset")
+def test_bench_convert_dataset(benchmark):
+    xr = pytest.importorskip("xarray")
+
+    ds = xr.Dataset({
+        "t": xr.DataArray(DATA, dims="x", attrs={"units": "K"}),
+        "u": xr.DataArray(DATA, dims="x", attrs={"units": "m/s"}),
+        "z": xr.DataArray(DATA, dims="x", attrs={"units": "m"}),
+    })
+    benchmark(convert_dataset, ds, target_units={"t": "degC", "u": "km/h"})
@@ -15,6 +15,16 @@ except ImportError:  # pragma: no cover
     # Local copy or not installed with setuptools
     __version__ = "999"
 
-from earthkit.utils import array
+import typing as T
+
+from earthkit.utils._lazy import lazy_attributes
+
+if T.TYPE_CHECKING:
+    from earthkit.utils import array
+
+# the submodules are only imported when accessed, so checking the version is cheap
+__getattr__, __dir__ = lazy_attributes(
+    __name__, {}, submodules=["array", "constants", "decorators", "instrumentation", "units"]
+)
 
 __all__ = ["__version__", "array"]
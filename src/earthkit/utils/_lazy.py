@@ -0,0 +1,51 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+"""Lazy loading of the attributes of a package (PEP 562)."""
+
+import importlib
+
+
+def lazy_attributes(package, attributes, submodules=()):
+    """Return the ``__getattr__`` and ``__dir__`` functions of a lazily loaded package.
+
+    Parameters
+    ----------
+    package: str
+        The name of the package, i.e. ``__name__``.
+    attributes: dict
+        Maps the name of an attribute to the name of the submodule, relative to
+        ``package``, defining it. The submodule is only imported when the attribute
+        is accessed for the first time.
+    submodules: list of str, optional
+        Names of the submodules, relative to ``package``, imported when they are
+        accessed as an attribute.
+
+    Returns
+    -------
+    tuple
+        The ``(__getattr__, __dir__)`` functions to be assigned in the package.
+    """
+    package_globals = importlib.import_module(package).__dict__
+    submodules = frozenset(submodules)
+
+    def __getattr__(name):
+        if name in attributes:
+            value = getattr(importlib.import_module(f"{package}.{attributes[name]}"), name)
+        elif name in submodules:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # cache it, so __getattr__ is only called once per name
+        package_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(package_globals) | set(attributes) | submodules)
+
+    return __getattr__, __dir__
@@ -7,6 +7,8 @@
 # nor does it submit to any jurisdiction.
 
 from earthkit.utils.array.array_namespace import array_namespace
-from earthkit.utils.array.convert import convert
+from earthkit.utils.array.backends import Backend, register_backend
+from earthkit.utils.array.capabilities import Capabilities
+from earthkit.utils.array.convert import convert, convert_tiled
 
-__all__ = ["array_namespace", "convert"]
+__all__ = ["Backend", "Capabilities", "array_namespace", "convert", "convert_tiled", "register_backend"]
@@ -8,30 +8,32 @@
 
 import typing as T
 
-import array_api_compat
+from earthkit.utils import instrumentation as _instrumentation
+from earthkit.utils.array.backends import BACKENDS
+from earthkit.utils.array.namespace import _DEFAULT_NAMESPACE, UnknownPatchedNamespace
 
-from earthkit.utils.array.namespace import _DEFAULT_NAMESPACE, _NAMESPACES, UnknownPatchedNamespace
+# patched namespaces of the unregistered backends, keyed by module name
+_UNKNOWN_NAMESPACES = {}
 
 
 def _get_array_name(xp):
-    name = xp.__name__
-    if "jax" in name:
-        return "jax"
-    elif "numpy" in name:
-        return "numpy"
-    elif "cupy" in name:
-        return "cupy"
-    elif "torch" in name:
-        return "torch"
-    else:
-        return name
+    backend = BACKENDS.from_namespace(xp)
+    if backend is not None:
+        return backend.name
+    return xp.__name__
 
 
 def _get_namespace_from_array(*arrays):
+    import array_api_compat
+
     xp = array_api_compat.array_namespace(*arrays)
-    namespace = _NAMESPACES.get(_get_array_name(xp))
+    backend = BACKENDS.from_namespace(xp)
+    if backend is not None:
+        return backend.namespace(xp)
+
+    namespace = _UNKNOWN_NAMESPACES.get(xp.__name__)
     if namespace is None:
-        namespace = UnknownPatchedNamespace(xp)
+        namespace = _UNKNOWN_NAMESPACES.setdefault(xp.__name__, UnknownPatchedNamespace(xp))
     return namespace
 
 
@@ -54,14 +56,28 @@ def array_namespace(*args: T.Any) -> T.Any:
     Notes
     -----
     The array namespace is extended with the following methods when necessary:
-        - polyval: evaluate a polynomial (available in numpy)
+        - polyval, polyval2d, polyval3d: evaluate a polynomial (available in numpy)
         - percentile: compute the n-th percentile of the data along the
           specified axis (available in numpy)
         - histogram2d: compute a 2D histogram (available in numpy)
+        - nanpercentile, nanquantile: compute percentiles ignoring NaNs
+        - weighted_mean, weighted_quantile, running_mean, cumulative_histogram:
+          vectorised statistical reductions
     Some other methods may be reimplemented for a given namespace to ensure correct
     behaviour. E.g. sign() for torch.
 
     """
+    if _instrumentation.ENABLED:
+        with _instrumentation.timer("array_namespace") as attributes:
+            xp = _array_namespace(*args)
+            attributes["namespace"] = xp._earthkit_array_namespace_name
+        return xp
+    return _array_namespace(*args)
+
+
+def _array_namespace(*args):
+    import array_api_compat
+
     arrays = [a for a in args if array_api_compat.is_array_api_obj(a)]
     if not arrays:
         # TODO: decide if we want to support this or not
@@ -70,7 +86,10 @@ def array_namespace(*args: T.Any) -> T.Any:
         if len(args) == 1:
             arg = args[0]
             if isinstance(arg, str):
-                xp = _NAMESPACES[arg]
+                backend = BACKENDS.get(arg)
+                if backend is None:
+                    raise KeyError(arg)
+                xp = backend.namespace()
             else:
                 if hasattr(arg, "asarray"):
                     xp = _get_namespace_from_array(arg.asarray(0))
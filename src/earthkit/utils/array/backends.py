@@ -0,0 +1,211 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import logging
+import threading
+
+from earthkit.utils.array.converter import _CONVERTERS, FromUnknownConverter
+from earthkit.utils.array.namespace import _NAMESPACES, UnknownPatchedNamespace
+
+LOG = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "earthkit.utils.array.backends"
+
+
+class Backend:
+    """An array backend known to earthkit.utils.
+
+    Parameters
+    ----------
+    name: str
+        Name of the backend, e.g. "numpy". It is used to look up the namespace with
+        ``array_namespace(name)`` and as the target name of the converters.
+    modules: list of str
+        Names of the array namespace modules belonging to the backend, e.g.
+        ``["numpy", "array_api_compat.numpy"]``. Submodules of these modules also
+        belong to the backend.
+    namespace: UnknownPatchedNamespace or type
+        The patched namespace of the backend, or a subclass of
+        :class:`UnknownPatchedNamespace` which is instantiated with the array
+        namespace module the first time it is needed.
+    converter: type, optional
+        The converter class used to convert arrays of this backend to other
+        backends. Default is :class:`FromUnknownConverter`.
+
+    """
+
+    def __init__(self, name, modules, namespace, converter=FromUnknownConverter):
+        self.name = name
+        self.modules = tuple(modules)
+        self._namespace = namespace
+        self.converter = converter
+        self._lock = threading.Lock()
+
+    def namespace(self, xp=None):
+        """Return the patched namespace, creating it from ``xp`` when needed."""
+        if isinstance(self._namespace, type):
+            with self._lock:
+                if isinstance(self._namespace, type):
+                    if xp is None:
+                        raise ValueError(f"The namespace of backend {self.name!r} has not been created yet")
+                    self._namespace = self._namespace(xp)
+        return self._namespace
+
+    @property
+    def capabilities(self):
+        return self._namespace.capabilities
+
+    def __repr__(self):
+        return f"{type(self).__name__}(name={self.name!r}, modules={self.modules!r})"
+
+
+class BackendRegistry:
+    """Registry of the known array backends.
+
+    Backends are identified from the name of their array namespace module, e.g.
+    ``array_api_compat.numpy``. Third-party packages can register backends with
+    an entry point in the ``earthkit.utils.array.backends`` group, resolving to a
+    :class:`Backend` object. Entry points are loaded the first time a name or a
+    namespace module is not found among the registered backends.
+    """
+
+    def __init__(self):
+        self._backends = {}
+        self._modules = {}
+        self._lookup = {}
+        self._entry_points_loaded = False
+        self._lock = threading.RLock()
+
+    def register(self, backend, aliases=()):
+        """Register a :class:`Backend`, also under the given alias names."""
+        with self._lock:
+            for name in (backend.name, *aliases):
+                self._backends[name] = backend
+            for module in backend.modules:
+                self._modules[module] = backend
+            self._lookup.clear()
+
+            if not isinstance(backend._namespace, type):
+                for name in (backend.name, *aliases):
+                    _NAMESPACES[name] = backend._namespace
+            for name in (backend.name, *aliases):
+                _CONVERTERS[name] = backend.converter
+
+    def _load_entry_points(self):
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            self._entry_points_loaded = True
+
+            from importlib.metadata import entry_points
+
+            for ep in entry_points(group=ENTRY_POINT_GROUP):
+                try:
+                    backend = ep.load()
+                    self.register(backend)
+                except Exception as e:
+                    LOG.warning(f"Failed to load array backend entry point {ep.name!r}: {e}")
+
+    def get(self, name):
+        """Return the backend registered under ``name``, or None."""
+        backend = self._backends.get(name)
+        if backend is None and not self._entry_points_loaded:
+            self._load_entry_points()
+            backend = self._backends.get(name)
+        return backend
+
+    def from_module_name(self, module_name):
+        """Return the backend of the array namespace module ``module_name``, or None."""
+        try:
+            return self._lookup[module_name]
+        except KeyError:
+            pass
+
+        backend = self._match(module_name)
+        if backend is None and not self._entry_points_loaded:
+            self._load_entry_points()
+            backend = self._match(module_name)
+
+        self._lookup[module_name] = backend
+        return backend
+
+    def _match(self, module_name):
+        # the module or its closest registered parent module
+        name = module_name
+        while name:
+            backend = self._modules.get(name)
+            if backend is not None:
+                return backend
+            name, _, _ = name.rpartition(".")
+        return None
+
+    def from_namespace(self, xp):
+        """Return the backend of an array namespace module or patched namespace, or None."""
+        if isinstance(xp, UnknownPatchedNamespace):
+            backend = self._backends.get(xp._earthkit_array_namespace_name)
+            if backend is not None:
+                return backend
+        return self.from_module_name(xp.__name__)
+
+    def capabilities(self, xp):
+        """Return the :class:`Capabilities` of an array namespace."""
+        if isinstance(xp, UnknownPatchedNamespace):
+            return xp.capabilities
+        backend = self.from_namespace(xp)
+        if backend is None:
+            return UnknownPatchedNamespace.capabilities
+        return backend.capabilities
+
+
+BACKENDS = BackendRegistry()
+
+
+def register_backend(name, modules, namespace, converter=FromUnknownConverter, aliases=()):
+    """Register an array backend.
+
+    Parameters
+    ----------
+    name: str
+        Name of the backend.
+    modules: list of str
+        Names of the array namespace modules belonging to the backend.
+    namespace: UnknownPatchedNamespace or type
+        The patched namespace of the backend, or a subclass of
+        :class:`UnknownPatchedNamespace` to be instantiated with the namespace module.
+    converter: type, optional
+        The converter class of the backend.
+    aliases: list of str, optional
+        Other names for the backend.
+
+    Returns
+    -------
+    Backend
+        The registered backend.
+
+    """
+    backend = Backend(name, modules, namespace, converter)
+    BACKENDS.register(backend, aliases=aliases)
+    return backend
+
+
+register_backend("numpy", ["numpy", "array_api_compat.numpy"], _NAMESPACES["numpy"], _CONVERTERS["numpy"])
+register_backend("cupy", ["cupy", "array_api_compat.cupy"], _NAMESPACES["cupy"], _CONVERTERS["cupy"])
+register_backend(
+    "torch",
+    ["torch", "array_api_compat.torch"],
+    _NAMESPACES["torch"],
+    _CONVERTERS["torch"],
+    aliases=["pytorch"],
+)
+register_backend("jax", ["jax", "jax.numpy"], _NAMESPACES["jax"], _CONVERTERS["jax"])
+register_backend(
+    "dask",
+    ["dask.array", "array_api_compat.dask.array"],
+    _NAMESPACES["dask"],
+    _CONVERTERS["dask"],
+)
@@ -0,0 +1,55 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+
+class Capabilities:
+    """Optional features supported by an array backend.
+
+    The patched namespaces and converters use them to pick native implementations
+    instead of the generic fallbacks.
+
+    Parameters
+    ----------
+    percentile: bool
+        The backend computes percentiles and quantiles natively. For a namespace used
+        through :class:`UnknownPatchedNamespace` this means it provides ``percentile``
+        and ``quantile`` with the numpy signature.
+    histogram: bool
+        The backend computes histograms natively. For a namespace used through
+        :class:`UnknownPatchedNamespace` this means it provides ``histogramdd`` with the
+        numpy signature.
+    dlpack: bool
+        The namespace provides ``from_dlpack`` and its arrays implement ``__dlpack__``.
+    inplace: bool
+        The arrays of the namespace can be modified in place (e.g. ``out=`` arguments
+        and augmented assignment).
+    async_transfer: bool
+        Transfers between devices can be asynchronous (e.g. ``non_blocking`` copies).
+
+    """
+
+    _FIELDS = ("percentile", "histogram", "dlpack", "inplace", "async_transfer")
+
+    def __init__(self, *, percentile=False, histogram=False, dlpack=False, inplace=False, async_transfer=False):
+        self.percentile = percentile
+        self.histogram = histogram
+        self.dlpack = dlpack
+        self.inplace = inplace
+        self.async_transfer = async_transfer
+
+    def __repr__(self):
+        values = ", ".join(f"{k}={getattr(self, k)}" for k in self._FIELDS)
+        return f"{type(self).__name__}({values})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Capabilities):
+            return NotImplemented
+        return all(getattr(self, k) == getattr(other, k) for k in self._FIELDS)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, k) for k in self._FIELDS))
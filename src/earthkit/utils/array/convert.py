@@ -6,17 +6,24 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from earthkit.utils import instrumentation as _instrumentation
 from earthkit.utils.array.array_namespace import _get_array_name
 from earthkit.utils.array.array_namespace import array_namespace as array_namespace_func
-from earthkit.utils.array.converter import _CONVERTERS, FromUnknownConverter
+from earthkit.utils.array.backends import BACKENDS
+from earthkit.utils.array.converter import FromUnknownConverter
 from earthkit.utils.array.namespace import _CUPY_NAMESPACE, _NUMPY_NAMESPACE, UnknownPatchedNamespace
+from earthkit.utils.array.transfer import _explicit, _nbytes, _to_host
 
 
 def _get_converter(source_array_namespace):
     if isinstance(source_array_namespace, UnknownPatchedNamespace):
-        return _CONVERTERS.get(_get_array_name(source_array_namespace), FromUnknownConverter)
+        backend = BACKENDS.from_namespace(source_array_namespace)
+        return FromUnknownConverter if backend is None else backend.converter
     elif isinstance(source_array_namespace, str):
-        return _CONVERTERS[source_array_namespace]
+        backend = BACKENDS.get(source_array_namespace)
+        if backend is None:
+            raise KeyError(source_array_namespace)
+        return backend.converter
     else:
         raise ValueError(f"Unknown array backend: {source_array_namespace._earthkit_array_namespace_name}")
 
@@ -46,6 +53,40 @@ def convert(array, *, device=None, array_namespace=None, **kwargs):
     if array_namespace is None and device is None:
         return array
 
+    if _instrumentation.ENABLED:
+        with _instrumentation.timer("convert", device=str(device)) as attributes:
+            result = _convert(array, device, array_namespace, **kwargs)
+            attributes.update(_transfer_attributes(array, result))
+        return result
+    return _convert(array, device, array_namespace, **kwargs)
+
+
+def _data_ptr(array):
+    try:
+        if hasattr(array, "data_ptr"):
+            return array.data_ptr()
+        if hasattr(array, "__array_interface__"):
+            return array.__array_interface__["data"][0]
+        if hasattr(array, "__cuda_array_interface__"):
+            return array.__cuda_array_interface__["data"][0]
+    except Exception:
+        pass
+    return None
+
+
+def _transfer_attributes(source, result):
+    source_name = _get_array_name(array_namespace_func(source))
+    target_name = _get_array_name(array_namespace_func(result))
+    if result is source:
+        copy = False
+    else:
+        source_ptr, result_ptr = _data_ptr(source), _data_ptr(result)
+        # None when it cannot be determined, e.g. for lazy arrays
+        copy = None if source_ptr is None or result_ptr is None else source_ptr != result_ptr
+    return {"source": source_name, "target": target_name, "nbytes": _nbytes(source), "copy": copy}
+
+
+def _convert(array, device, array_namespace, **kwargs):
     source_xp = array_namespace_func(array)
     source_name = _get_array_name(source_xp)
 
@@ -63,12 +104,26 @@ def convert(array, *, device=None, array_namespace=None, **kwargs):
         converter_instance = converter(target_xp)
         target_name = _get_array_name(target_xp)
         # TODO: decide if we want to pass device here, or later.
-        # Currently, do it later
-        array = converter_instance.to(array, target_name)
+        # Currently, do it later, except for memory-mapped/read-only numpy
+        # arrays that are streamed directly to the target device
+        to_kwargs = {}
+        if device is not None and source_name == "numpy" and target_name in ("torch", "cupy"):
+            from earthkit.utils.array.converter._memmap import needs_streaming
+
+            if needs_streaming(array):
+                to_kwargs["device"] = device
+        # a device to host copy made here is requested by the caller
+        with _explicit(target_name == "numpy" or device == "cpu"):
+            array = converter_instance.to(array, target_name, **to_kwargs)
 
     if device is not None:
         xp = array_namespace_func(array)
-        array = xp.to_device(array, device=device, **kwargs)
+        if device == "cpu":
+            name = _get_array_name(xp)
+            with _explicit():
+                array = _to_host(array, lambda x: xp.to_device(x, device=device, **kwargs), name, target=name)
+        else:
+            array = xp.to_device(array, device=device, **kwargs)
 
     return array
 
@@ -95,3 +150,117 @@ def convert_dtype(dtype, array_namespace):
         target_dtypes_overlapping_subset = np.vectorize(target_dtypes.get)(overlapping_dtypes)
         mapping = dict(zip(source_dtypes_overlapping_subset, target_dtypes_overlapping_subset))
         return mapping[dtype]
+
+
+def _tile_indices(shape, tile_shape):
+    import itertools
+
+    tile_shape = tuple(tile_shape) + tuple(shape[len(tile_shape) :])
+    if len(tile_shape) != len(shape):
+        raise ValueError(f"tile_shape={tile_shape} has more dimensions than the array shape={shape}")
+    if any(t < 1 for t in tile_shape):
+        raise ValueError(f"tile_shape={tile_shape} must be positive")
+
+    ranges = [range(0, n, t) for n, t in zip(shape, tile_shape)]
+    for starts in itertools.product(*ranges):
+        yield tuple(slice(s, min(s + t, n)) for s, t, n in zip(starts, tile_shape, shape))
+
+
+def _concat_tiles(xp, tiles, grid, axis=0):
+    """Assemble the tiles, listed in the order of :func:`_tile_indices`, by concatenation."""
+    if axis == len(grid):
+        return tiles[0]
+    step = len(tiles) // grid[axis]
+    parts = [_concat_tiles(xp, tiles[i : i + step], grid, axis + 1) for i in range(0, len(tiles), step)]
+    return parts[0] if len(parts) == 1 else xp.concat(parts, axis=axis)
+
+
+def convert_tiled(array, tile_shape, fn=None, *, device=None, array_namespace=None, collect="host", **kwargs):
+    """Convert an array tile by tile and apply a function to each tile.
+
+    It allows processing arrays that do not fit into the memory of the target device.
+    While ``fn`` runs on a tile, the next tile is converted in a background thread
+    (double buffering), so at most two input tiles are held on the target device.
+
+    Parameters
+    ----------
+    array : array
+        The array to convert.
+    tile_shape : tuple of int
+        The shape of the tiles. Missing trailing dimensions are not tiled.
+    fn : callable, optional
+        Function applied to each converted tile. It must return an array of the same
+        shape as its input. When None, the tiles are only converted.
+    device : array namespace-specific device spec or str
+        The device to which the tiles are moved. See :func:`convert`.
+    array_namespace : str or array namespace
+        The array namespace of the tiles. See :func:`convert`.
+    collect : str
+        Where the results are collected. When "host", each result tile is converted back
+        to the array namespace and device of ``array``. When "device", the results are
+        collected on the target device. The result tiles are written into a preallocated
+        array, or, when the collecting namespace does not support in-place updates (e.g.
+        jax), kept and concatenated once all the tiles are processed.
+    **kwargs :
+        forwarded to :func:`convert`
+
+    Returns
+    -------
+    array
+        The assembled results.
+
+    """
+    import contextvars
+    from concurrent.futures import ThreadPoolExecutor
+
+    if collect not in ("host", "device"):
+        raise ValueError(f"Invalid collect={collect!r}, must be 'host' or 'device'")
+
+    source_xp = array_namespace_func(array)
+    source_device = source_xp.device(array)
+    shape = tuple(source_xp.shape(array))
+
+    def _upload(index):
+        return convert(array[index], device=device, array_namespace=array_namespace, **kwargs)
+
+    def _submit(index):
+        # run in a copy of the context, so the uploads are seen by trace_transfers()
+        return executor.submit(contextvars.copy_context().run, _upload, index)
+
+    result = None
+    xp = None
+    tiles = []
+    indices = list(_tile_indices(shape, tile_shape))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = _submit(indices[0]) if indices else None
+        for i, index in enumerate(indices):
+            tile = pending.result()
+            # start uploading the next tile before processing this one
+            pending = _submit(indices[i + 1]) if i + 1 < len(indices) else None
+
+            if fn is not None:
+                tile = fn(tile)
+
+            if collect == "host":
+                tile = convert(tile, device=source_device, array_namespace=source_xp)
+                xp, tile_device = source_xp, source_device
+            else:
+                xp = array_namespace_func(tile)
+                tile_device = xp.device(tile)
+
+            if not xp.capabilities.inplace:
+                tiles.append(tile)
+                continue
+            if result is None:
+                result = xp.empty(shape, dtype=tile.dtype, device=tile_device)
+            result[index] = tile
+
+    if tiles:
+        grid = tuple(len(range(0, n, t)) for n, t in zip(shape, tile_shape))
+        result = _concat_tiles(xp, tiles, grid)
+    elif result is None:
+        # empty array, nothing to tile
+        result = convert(array, device=device, array_namespace=array_namespace, **kwargs)
+        if fn is not None:
+            result = fn(result)
+    return result
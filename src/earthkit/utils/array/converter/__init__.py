@@ -7,6 +7,7 @@
 # nor does it submit to any jurisdiction.
 
 from earthkit.utils.array.converter.cupy import FromCupyConverter
+from earthkit.utils.array.converter.dask import FromDaskConverter
 from earthkit.utils.array.converter.jax import FromJaxConverter
 from earthkit.utils.array.converter.numpy import FromNumpyConverter
 from earthkit.utils.array.converter.torch import FromTorchConverter
@@ -17,12 +18,14 @@ _CONVERTERS = {
     "cupy": FromCupyConverter,
     "torch": FromTorchConverter,
     "jax": FromJaxConverter,
+    "dask": FromDaskConverter,
 }
 
 _NUMPY_CONVERTER = _CONVERTERS["numpy"]
 _CUPY_CONVERTER = _CONVERTERS["cupy"]
 _TORCH_CONVERTER = _CONVERTERS["torch"]
 _JAX_CONVERTER = _CONVERTERS["jax"]
+_DASK_CONVERTER = _CONVERTERS["dask"]
 
 _DEFAULT_CONVERTER = _NUMPY_CONVERTER
 
@@ -35,5 +38,6 @@ __all__ = [
     "FromCupyConverter",
     "FromTorchConverter",
     "FromJaxConverter",
+    "FromDaskConverter",
     "FromUnknownConverter",
 ]
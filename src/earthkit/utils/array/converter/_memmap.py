@@ -0,0 +1,125 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+"""Helpers to convert memory-mapped numpy arrays without loading them whole."""
+
+import logging
+import mmap
+
+LOG = logging.getLogger(__name__)
+
+# Maximum size of the host copies made when streaming a memory-mapped array
+MEMMAP_TILE_BYTES = 64 * 1024**2
+
+
+def _find_memmap(array):
+    import numpy as np
+
+    while array is not None:
+        if isinstance(array, (np.memmap, mmap.mmap)):
+            return array
+        array = getattr(array, "base", None)
+    return None
+
+
+def is_memmap(array):
+    """Check if a numpy array is backed by a memory-mapped file."""
+    return _find_memmap(array) is not None
+
+
+def needs_streaming(array):
+    """Check if a numpy array should be copied tile by tile.
+
+    True for memory-mapped arrays and for arrays that cannot be wrapped without a
+    copy, i.e. read-only or non-native byte order arrays.
+    """
+    return is_memmap(array) or not array.flags.writeable or not array.dtype.isnative
+
+
+def native_dtype(array):
+    return array.dtype.newbyteorder("=")
+
+
+def _release(array, tile):
+    """Drop the pages of ``tile`` from the address space of a read-only map.
+
+    The pages of a read-only map are backed by the file, so they are read again
+    when accessed later. This keeps the resident memory bounded while streaming.
+    """
+    import numpy as np
+
+    source = _find_memmap(array)
+    if not isinstance(source, np.memmap) or source.mode != "r" or not hasattr(source, "_mmap"):
+        return
+
+    try:
+        mm = source._mmap
+        base = np.frombuffer(mm, dtype=np.uint8).__array_interface__["data"][0]
+        start = tile.__array_interface__["data"][0] - base
+        stop = start + tile.nbytes
+        start -= start % mmap.PAGESIZE
+        mm.madvise(mmap.MADV_DONTNEED, start, stop - start)
+    except (AttributeError, OSError, ValueError, TypeError) as e:
+        LOG.debug(f"Could not release memory-mapped pages: {e}")
+
+
+def copy_on_write(array):
+    """Return a writable view of a read-only memory-mapped array, without a copy.
+
+    The file is mapped again in copy-on-write mode, so the view shares the pages
+    of the original map and writes to it are private to the process. Returns None
+    when ``array`` is not a view of a read-only :class:`numpy.memmap` of a file.
+    """
+    import numpy as np
+
+    source = _find_memmap(array)
+    if not isinstance(source, np.memmap) or source.mode != "r" or source.filename is None:
+        return None
+
+    try:
+        mm = source._mmap
+        base = np.frombuffer(mm, dtype=np.uint8).__array_interface__["data"][0]
+        # the file offset of the original map, see numpy.memmap
+        start = source.offset - source.offset % mmap.ALLOCATIONGRANULARITY
+        cow = np.memmap(source.filename, dtype=np.uint8, mode="c", offset=start, shape=(len(mm),))
+        return np.ndarray(
+            array.shape,
+            dtype=array.dtype,
+            buffer=cow,
+            offset=array.__array_interface__["data"][0] - base,
+            strides=array.strides,
+        )
+    except (AttributeError, OSError, ValueError, TypeError) as e:
+        LOG.debug(f"Could not map the memory-mapped array in copy-on-write mode: {e}")
+        return None
+
+
+def iter_tiles(array, tile_bytes=None):
+    """Iterate over host copies of ``array`` along its first axis.
+
+    Yields ``(index, tile)`` where ``tile`` is a writable, C-contiguous, native byte
+    order copy of ``array[index]`` of at most ``tile_bytes`` (unless a single row is
+    larger).
+    """
+    import numpy as np
+
+    if tile_bytes is None:
+        tile_bytes = MEMMAP_TILE_BYTES
+
+    dtype = native_dtype(array)
+    if array.ndim == 0:
+        yield (), np.array(array, dtype=dtype)
+        return
+
+    row_bytes = max(1, array.nbytes // max(1, array.shape[0]))
+    rows = max(1, tile_bytes // row_bytes)
+    for start in range(0, array.shape[0], rows):
+        index = slice(start, min(start + rows, array.shape[0]))
+        source = array[index]
+        yield index, np.array(source, dtype=dtype, order="C")
+        _release(array, source)
@@ -7,6 +7,7 @@
 # nor does it submit to any jurisdiction.
 
 from earthkit.utils.array.converter.unknown import FromUnknownConverter
+from earthkit.utils.array.transfer import _to_host
 
 
 class FromCupyConverter(FromUnknownConverter):
@@ -14,7 +15,7 @@ class FromCupyConverter(FromUnknownConverter):
         super().__init__(xp_target)
 
     def to_numpy(self, array, **kwargs):
-        return array.get()
+        return _to_host(array, lambda x: x.get(), "cupy")
 
     def to_cupy(self, array, **kwargs):
         return array
@@ -0,0 +1,36 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+from earthkit.utils.array.converter.unknown import FromUnknownConverter
+
+
+class FromDaskConverter(FromUnknownConverter):
+    def __init__(self, xp_target):
+        super().__init__(xp_target)
+
+    def _compute(self, array, target, **kwargs):
+        # the chunks can be of any array type, convert the computed result
+        from earthkit.utils.array.convert import convert
+
+        return convert(array.compute(), array_namespace=target, **kwargs)
+
+    def to_numpy(self, array, **kwargs):
+        return self._compute(array, "numpy", **kwargs)
+
+    def to_cupy(self, array, **kwargs):
+        return self._compute(array, "cupy", **kwargs)
+
+    def to_torch(self, array, **kwargs):
+        return self._compute(array, "torch", **kwargs)
+
+    def to_jax(self, array, **kwargs):
+        return self._compute(array, "jax", **kwargs)
+
+    def to_dask(self, array, **kwargs):
+        chunks = kwargs.pop("chunks", None)
+        return array if chunks is None else array.rechunk(chunks)
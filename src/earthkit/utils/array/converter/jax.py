@@ -7,6 +7,7 @@
 # nor does it submit to any jurisdiction.
 
 from earthkit.utils.array.converter.unknown import FromUnknownConverter
+from earthkit.utils.array.transfer import _to_host
 
 
 class FromJaxConverter(FromUnknownConverter):
@@ -14,7 +15,7 @@ class FromJaxConverter(FromUnknownConverter):
         super().__init__(xp_target)
 
     def to_numpy(self, array, **kwargs):
-        return self.xp_target.asarray(array, **kwargs)
+        return _to_host(array, lambda x: self.xp_target.asarray(x, **kwargs), "jax")
 
     def to_cupy(self, array, **kwargs):
         import cupy as cp
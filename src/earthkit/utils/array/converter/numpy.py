@@ -6,6 +6,7 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from earthkit.utils.array.converter._memmap import copy_on_write, iter_tiles, native_dtype, needs_streaming
 from earthkit.utils.array.converter.unknown import FromUnknownConverter
 
 
@@ -17,11 +18,44 @@ class FromNumpyConverter(FromUnknownConverter):
         return array
 
     def to_cupy(self, array, **kwargs):
-        return self.xp_target.array(array, **kwargs)
+        device = kwargs.pop("device", None)
+        if not needs_streaming(array):
+            return self.xp_target.array(array, **kwargs)
+
+        # stream memory-mapped/read-only arrays tile by tile to bound host memory
+        from earthkit.utils.array.namespace import _CUPY_NAMESPACE
+
+        with _CUPY_NAMESPACE.device_context(device):
+            result = _CUPY_NAMESPACE.xp.empty(array.shape, dtype=native_dtype(array))
+            for index, tile in iter_tiles(array):
+                result[index].set(tile)
+        return result
 
     def to_torch(self, array, **kwargs):
-        # TODO: add device handling
-        return self.xp_target.from_numpy(array, **kwargs)
+        import numpy as np
+        import torch
+
+        device = kwargs.pop("device", None)
+        on_cpu = device is None or torch.device(device).type == "cpu"
+
+        if not needs_streaming(array):
+            return self.xp_target.from_numpy(array, **kwargs)
+
+        # memory-mapped arrays on cpu are wrapped without a copy, the read-only ones
+        # through a copy-on-write map since torch tensors are always writable
+        if on_cpu and array.dtype.isnative and all(s >= 0 for s in array.strides):
+            if array.flags.writeable:
+                return self.xp_target.from_numpy(array, **kwargs)
+            writable = copy_on_write(array)
+            if writable is not None:
+                return self.xp_target.from_numpy(writable, **kwargs)
+
+        # otherwise stream tile by tile, directly to the target device
+        dtype = torch.from_numpy(np.empty(0, dtype=native_dtype(array))).dtype
+        result = torch.empty(array.shape, dtype=dtype, device=device)
+        for index, tile in iter_tiles(array):
+            result[index].copy_(torch.from_numpy(tile))
+        return result
 
     def to_jax(self, array, **kwargs):
         # TODO: add device handling
@@ -7,6 +7,7 @@
 # nor does it submit to any jurisdiction.
 
 from earthkit.utils.array.converter.unknown import FromUnknownConverter
+from earthkit.utils.array.transfer import _to_host
 
 
 class FromTorchConverter(FromUnknownConverter):
@@ -14,7 +15,7 @@ class FromTorchConverter(FromUnknownConverter):
         super().__init__(xp_target)
 
     def to_numpy(self, array, **kwargs):
-        return array.cpu().numpy()
+        return _to_host(array, lambda x: x.cpu().numpy(), "torch")
 
     def to_cupy(self, array, **kwargs):
         # TODO: add device handling
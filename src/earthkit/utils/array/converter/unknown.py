@@ -6,6 +6,8 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from earthkit.utils.array.transfer import _implicit, _to_host
+
 
 class FromUnknownConverter:
     def __init__(self, xp_target):
@@ -31,7 +33,12 @@ class FromUnknownConverter:
         4. Converts to numpy, then tries to convert using xp.asarray on the new numpy array.
         5. Converts to numpy, then tries to convert using xp.array on the new numpy array.
         """
-        if hasattr(array, "__dlpack__") and hasattr(xp, "from_dlpack"):
+        from earthkit.utils.array.backends import BACKENDS
+
+        backend = BACKENDS.from_namespace(xp)
+        # use the declared capability for known backends instead of probing the namespace
+        dlpack = backend.capabilities.dlpack if backend is not None else hasattr(xp, "from_dlpack")
+        if dlpack and hasattr(array, "__dlpack__"):
             return xp.from_dlpack(array, **kwargs)
         else:
             try:
@@ -40,7 +47,9 @@ class FromUnknownConverter:
                 try:
                     return xp.array(array, **kwargs)
                 except Exception:
-                    numpy_array = self.to_numpy(array)
+                    # the copy through numpy is never requested by the caller
+                    with _implicit():
+                        numpy_array = self.to_numpy(array)
                     try:
                         return xp.asarray(numpy_array, **kwargs)
                     except Exception:
@@ -52,7 +61,8 @@ class FromUnknownConverter:
     def to_numpy(self, array, **kwargs):
         from earthkit.utils.array.namespace import _NUMPY_NAMESPACE
 
-        return self._default_convert(_NUMPY_NAMESPACE, array, **kwargs)
+        source = type(array).__module__.split(".")[0]
+        return _to_host(array, lambda x: self._default_convert(_NUMPY_NAMESPACE, x, **kwargs), source)
 
     def to_torch(self, array, **kwargs):
         from earthkit.utils.array.namespace import _TORCH_NAMESPACE
@@ -66,3 +76,11 @@ class FromUnknownConverter:
 
     def to_jax(self, array, **kwargs):
         return self._default_convert(self.xp_target, array, **kwargs)
+
+    def to_dask(self, array, **kwargs):
+        import dask.array as da
+
+        chunks = kwargs.pop("chunks", "auto")
+        with _implicit():
+            numpy_array = self.to_numpy(array)
+        return da.from_array(numpy_array, chunks=chunks, **kwargs)
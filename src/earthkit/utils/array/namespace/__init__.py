@@ -7,6 +7,7 @@
 # nor does it submit to any jurisdiction.
 
 from earthkit.utils.array.namespace.cupy import PatchedCupyNamespace
+from earthkit.utils.array.namespace.dask import PatchedDaskNamespace
 from earthkit.utils.array.namespace.jax import PatchedJaxNamespace
 from earthkit.utils.array.namespace.numpy import PatchedNumpyNamespace
 from earthkit.utils.array.namespace.torch import PatchedTorchNamespace
@@ -17,12 +18,14 @@ _NAMESPACES = {
     "cupy": PatchedCupyNamespace(),
     "torch": PatchedTorchNamespace(),
     "jax": PatchedJaxNamespace(),
+    "dask": PatchedDaskNamespace(),
 }
 
 _NUMPY_NAMESPACE = _NAMESPACES["numpy"]
 _CUPY_NAMESPACE = _NAMESPACES["cupy"]
 _TORCH_NAMESPACE = _NAMESPACES["torch"]
 _JAX_NAMESPACE = _NAMESPACES["jax"]
+_DASK_NAMESPACE = _NAMESPACES["dask"]
 
 _DEFAULT_NAMESPACE = _NUMPY_NAMESPACE
 
@@ -35,5 +38,6 @@ __all__ = [
     "PatchedCupyNamespace",
     "PatchedTorchNamespace",
     "PatchedJaxNamespace",
+    "PatchedDaskNamespace",
     "UnknownPatchedNamespace",
 ]
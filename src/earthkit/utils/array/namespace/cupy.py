@@ -6,11 +6,16 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import contextlib
+
+from earthkit.utils.array.capabilities import Capabilities
 from earthkit.utils.array.namespace.unknown import UnknownPatchedNamespace
 from earthkit.utils.decorators import thread_safe_cached_property
 
 
 class PatchedCupyNamespace(UnknownPatchedNamespace):
+    capabilities = Capabilities(percentile=True, histogram=True, dlpack=True, inplace=True, async_transfer=True)
+
     def __init__(self):
         super().__init__(None)
 
@@ -24,39 +29,50 @@ class PatchedCupyNamespace(UnknownPatchedNamespace):
     def _earthkit_array_namespace_name(self):
         return "cupy"
 
-    def polyval(self, *args, **kwargs):
-        from cupy.polynomial.polynomial import polyval
-
-        return polyval(*args, **kwargs)
-
-    def percentile(self, a, q, axis=None):
+    def percentile(self, a, q, axis=None, weights=None):
+        if weights is not None:
+            return self.weighted_quantile(a, self._asarray_like(q, a) / 100, weights, axis=axis)
         return self.xp.percentile(a, q, axis=axis)
 
-    def quantile(self, a, q, axis=None):
+    def quantile(self, a, q, axis=None, weights=None):
+        if weights is not None:
+            return self.weighted_quantile(a, q, weights, axis=axis)
         return self.xp.quantile(a, q, axis=axis)
 
-    def histogram2d(self, x, y, *, bins=10):
-        return self.xp.histogram2d(x, y, bins=bins)
+    def histogram2d(self, x, y, *, bins=10, weights=None):
+        return self.xp.histogram2d(x, y, bins=bins, weights=weights)
 
-    def histogramdd(self, x, *, bins=10):
-        return self.xp.histogramdd(x, bins=bins)
+    def histogramdd(self, x, *, bins=10, weights=None):
+        return self.xp.histogramdd(x, bins=bins, weights=weights)
+
+    def device_context(self, device):
+        """Return a context manager making ``device`` the current cupy device."""
+        if device is None:
+            return contextlib.nullcontext()
+        if isinstance(device, str) and device.startswith("cuda"):
+            _, _, idx = device.partition(":")
+            dev_id = int(idx) if idx else 0
+        else:
+            dev_id = device
+        return self.xp.cuda.Device(dev_id)
 
     def asarray(self, *args, **kwargs):
         device = kwargs.pop("device", None)
-        if device is not None:
-            if isinstance(device, str) and device.startswith("cuda"):
-                _, _, idx = device.partition(":")
-                dev_id = int(idx) if idx else 0
-            else:
-                dev_id = device
-            with self.xp.cuda.Device(dev_id):
-                return self.xp.asarray(*args, **kwargs)
-        else:
+        with self.device_context(device):
             return self.xp.asarray(*args, **kwargs)
 
     def to_device(self, x, device, **kwargs):
         return self.asarray(x, device=device, **kwargs)
 
+    def weighted_mean(self, a, weights, axis=None):
+        return self.xp.average(a, axis=axis, weights=self.xp.broadcast_to(weights, a.shape))
+
+    def cumulative_histogram(self, x, bins=10, range=None, weights=None):
+        if weights is not None:
+            weights = self.xp.broadcast_to(weights, x.shape)
+        counts, edges = self.xp.histogram(x, bins=bins, range=range, weights=weights)
+        return self.xp.cumsum(counts), edges
+
     def rad2deg(self, x):
         return self.xp.rad2deg(x)
 
@@ -0,0 +1,177 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+from earthkit.utils.array.capabilities import Capabilities
+from earthkit.utils.array.namespace.unknown import UnknownPatchedNamespace
+from earthkit.utils.decorators import thread_safe_cached_property
+
+
+def _block_percentile(block, q, scalar_q, method="percentile"):
+    from earthkit.utils.array import array_namespace
+
+    xp = array_namespace(block)
+    r = getattr(xp, method)(block, q, axis=-1)
+    # numpy puts the percentile axis first, move it last to match the block layout
+    return r if scalar_q else xp.moveaxis(r, 0, -1)
+
+
+def _block_weighted_quantile(block, weights, q, scalar_q):
+    from earthkit.utils.array import array_namespace
+
+    xp = array_namespace(block)
+    r = xp.weighted_quantile(block, q, weights, axis=-1)
+    return r if scalar_q else xp.moveaxis(r, 0, -1)
+
+
+class PatchedDaskNamespace(UnknownPatchedNamespace):
+    capabilities = Capabilities(percentile=True, histogram=True)
+
+    def __init__(self):
+        super().__init__(None)
+
+    @thread_safe_cached_property
+    def xp(self):
+        import array_api_compat.dask.array as da
+
+        return da
+
+    @property
+    def _earthkit_array_namespace_name(self):
+        return "dask"
+
+    def percentile(self, a, q, axis=None, weights=None):
+        """Compute percentiles chunk by chunk.
+
+        When ``axis`` is None the percentiles of the flattened array are approximated
+        by merging the percentiles of the chunks, see :func:`dask.array.percentile`.
+        Otherwise ``a`` is rechunked to a single chunk along ``axis`` and the exact
+        percentiles are computed in parallel over the chunks of the other axes.
+
+        When ``weights`` is given, the weighted percentiles are computed with
+        :obj:`weighted_quantile`.
+        """
+        import dask.array as da
+        import numpy as np
+
+        q = np.asarray(q)
+        if weights is not None:
+            return self.weighted_quantile(a, q / 100, weights, axis=axis)
+        if axis is None:
+            r = da.percentile(da.ravel(a), q.ravel())
+            return r[0] if q.ndim == 0 else r
+        return self._map_percentile(a, q, axis, "percentile")
+
+    def _map_percentile(self, a, q, axis, method):
+        import dask.array as da
+
+        scalar_q = q.ndim == 0
+        a = da.moveaxis(a, axis, -1).rechunk({-1: -1})
+
+        if scalar_q:
+            return a.map_blocks(_block_percentile, q, scalar_q, method, drop_axis=-1, dtype=float)
+
+        r = a.map_blocks(
+            _block_percentile,
+            q,
+            scalar_q,
+            method,
+            chunks=a.chunks[:-1] + ((q.size,),),
+            dtype=float,
+        )
+        return da.moveaxis(r, -1, 0)
+
+    def quantile(self, a, q, axis=None, weights=None):
+        import numpy as np
+
+        if weights is not None:
+            return self.weighted_quantile(a, q, weights, axis=axis)
+        return self.percentile(a, np.asarray(q) * 100, axis=axis)
+
+    def weighted_quantile(self, a, q, weights, axis=None):
+        """Compute weighted quantiles chunk by chunk.
+
+        ``a`` and ``weights`` are rechunked to a single chunk along ``axis`` and the
+        quantiles are computed in parallel over the chunks of the other axes. When
+        ``axis`` is None the flattened array is processed as a single chunk.
+        """
+        import dask.array as da
+        import numpy as np
+
+        q = np.asarray(q)
+        weights = da.broadcast_to(da.asarray(weights), a.shape)
+        if axis is None:
+            a, weights, axis = da.ravel(a), da.ravel(weights), 0
+
+        scalar_q = q.ndim == 0
+        a = da.moveaxis(a, axis, -1).rechunk({-1: -1})
+        weights = da.moveaxis(weights, axis, -1).rechunk(a.chunks)
+
+        if scalar_q:
+            return da.map_blocks(_block_weighted_quantile, a, weights, q, scalar_q, drop_axis=-1, dtype=a.dtype)
+
+        r = da.map_blocks(
+            _block_weighted_quantile,
+            a,
+            weights,
+            q,
+            scalar_q,
+            chunks=a.chunks[:-1] + ((q.size,),),
+            dtype=a.dtype,
+        )
+        return da.moveaxis(r, -1, 0)
+
+    def nanpercentile(self, a, q, axis=None):
+        """Compute percentiles ignoring NaNs chunk by chunk.
+
+        ``a`` is rechunked to a single chunk along ``axis`` and the percentiles are
+        computed in parallel over the chunks of the other axes. When ``axis`` is None
+        the flattened array is processed as a single chunk.
+        """
+        import dask.array as da
+        import numpy as np
+
+        if axis is None:
+            a, axis = da.ravel(a), 0
+        return self._map_percentile(a, np.asarray(q), axis, "nanpercentile")
+
+    def nanquantile(self, a, q, axis=None):
+        import numpy as np
+
+        return self.nanpercentile(a, np.asarray(q) * 100, axis=axis)
+
+    def histogram2d(self, x, y, *, bins=10, weights=None):
+        H, edges = self.histogramdd(self.xp.stack([x, y]).T, bins=bins, weights=weights)
+        return H, edges[0], edges[1]
+
+    def histogramdd(self, x, *, bins=10, weights=None):
+        """Compute a histogram chunk by chunk.
+
+        The range of the bins is computed in a single pass over ``x``, then the
+        histograms of the chunks are summed up. The histogram is a lazy dask array.
+        """
+        import dask
+        import dask.array as da
+
+        _, D = x.shape
+        if isinstance(bins, int):
+            bins = [bins] * D
+        elif len(bins) != D:
+            raise ValueError("bins must have length equal to number of dimensions")
+
+        x = x.rechunk({1: -1})
+        if weights is not None:
+            # the weights must be chunked like the points
+            weights = da.asarray(weights).rechunk((x.chunks[0],))
+        mins, maxs = dask.compute(x.min(axis=0), x.max(axis=0))
+        return da.histogramdd(x, bins=bins, range=list(zip(mins.tolist(), maxs.tolist())), weights=weights)
+
+    def rad2deg(self, x):
+        return self.xp.rad2deg(x)
+
+    def deg2rad(self, x):
+        return self.xp.deg2rad(x)
@@ -6,11 +6,14 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from earthkit.utils.array.capabilities import Capabilities
 from earthkit.utils.array.namespace.unknown import UnknownPatchedNamespace
 from earthkit.utils.decorators import thread_safe_cached_property
 
 
 class PatchedJaxNamespace(UnknownPatchedNamespace):
+    capabilities = Capabilities(percentile=True, histogram=True, dlpack=True, async_transfer=True)
+
     def __init__(self):
         super().__init__(None)
 
@@ -24,12 +27,31 @@ class PatchedJaxNamespace(UnknownPatchedNamespace):
     def _earthkit_array_namespace_name(self):
         return "jax"
 
-    def percentile(self, a, q, axis=None):
+    def percentile(self, a, q, axis=None, weights=None):
+        if weights is not None:
+            return self.weighted_quantile(a, self._asarray_like(q, a) / 100, weights, axis=axis)
         return self.xp.percentile(a, q, axis=axis)
 
-    def quantile(self, a, q, axis=None):
+    def quantile(self, a, q, axis=None, weights=None):
+        if weights is not None:
+            return self.weighted_quantile(a, q, weights, axis=axis)
         return self.xp.quantile(a, q, axis=axis)
 
+    def nanpercentile(self, a, q, axis=None):
+        return self.xp.nanpercentile(a, q, axis=axis)
+
+    def nanquantile(self, a, q, axis=None):
+        return self.xp.nanquantile(a, q, axis=axis)
+
+    def weighted_mean(self, a, weights, axis=None):
+        return self.xp.average(a, axis=axis, weights=self.xp.broadcast_to(weights, a.shape))
+
+    def cumulative_histogram(self, x, bins=10, range=None, weights=None):
+        if weights is not None:
+            weights = self.xp.broadcast_to(weights, x.shape)
+        counts, edges = self.xp.histogram(x, bins=bins, range=range, weights=weights)
+        return self.xp.cumsum(counts), edges
+
     def rad2deg(self, x):
         return self.xp.rad2deg(x)
 
@@ -6,11 +6,14 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from earthkit.utils.array.capabilities import Capabilities
 from earthkit.utils.array.namespace.unknown import UnknownPatchedNamespace
 from earthkit.utils.decorators import thread_safe_cached_property
 
 
 class PatchedNumpyNamespace(UnknownPatchedNamespace):
+    capabilities = Capabilities(percentile=True, histogram=True, dlpack=True, inplace=True)
+
     def __init__(self):
         super().__init__(None)
 
@@ -24,28 +27,48 @@ class PatchedNumpyNamespace(UnknownPatchedNamespace):
     def _earthkit_array_namespace_name(self):
         return "numpy"
 
-    def polyval(self, *args, **kwargs):
-        from numpy.polynomial.polynomial import polyval
-
-        return polyval(*args, **kwargs)
-
-    def percentile(self, a, q, axis=None):
+    def percentile(self, a, q, axis=None, weights=None):
+        if weights is not None:
+            return self.weighted_quantile(a, self._asarray_like(q, a) / 100, weights, axis=axis)
         return self.xp.percentile(a, q, axis=axis)
 
-    def quantile(self, a, q, axis=None):
+    def quantile(self, a, q, axis=None, weights=None):
+        if weights is not None:
+            return self.weighted_quantile(a, q, weights, axis=axis)
         return self.xp.quantile(a, q, axis=axis)
 
-    def histogram2d(self, x, y, *, bins=10):
-        return self.xp.histogram2d(x, y, bins=bins)
+    def nanpercentile(self, a, q, axis=None):
+        return self.xp.nanpercentile(a, q, axis=axis)
+
+    def nanquantile(self, a, q, axis=None):
+        return self.xp.nanquantile(a, q, axis=axis)
 
-    def histogramdd(self, x, *, bins=10):
-        return self.xp.histogramdd(x, bins=bins)
+    def histogram2d(self, x, y, *, bins=10, weights=None):
+        return self.xp.histogram2d(x, y, bins=bins, weights=weights)
+
+    def histogramdd(self, x, *, bins=10, weights=None):
+        return self.xp.histogramdd(x, bins=bins, weights=weights)
 
     def isclose(self, x, y, *, rtol=1e-5, atol=1e-8, equal_nan=False):
         return self.xp.isclose(x, y, rtol=rtol, atol=atol, equal_nan=equal_nan)
 
-    def allclose(self, x, y, *, rtol=1e-5, atol=1e-8, equal_nan=False):
-        return self.xp.allclose(x, y, rtol=rtol, atol=atol, equal_nan=equal_nan)
+    def weighted_mean(self, a, weights, axis=None):
+        return self.xp.average(a, axis=axis, weights=self.xp.broadcast_to(weights, a.shape))
+
+    def weighted_quantile(self, a, q, weights, axis=None):
+        import numpy as np
+
+        # weights are only supported from numpy 2.0
+        if np.lib.NumpyVersion(np.__version__) < "2.0.0":
+            return super().weighted_quantile(a, q, weights, axis=axis)
+        weights = self.xp.broadcast_to(weights, a.shape)
+        return self.xp.quantile(a, q, axis=axis, weights=weights, method="inverted_cdf")
+
+    def cumulative_histogram(self, x, bins=10, range=None, weights=None):
+        if weights is not None:
+            weights = self.xp.broadcast_to(weights, x.shape)
+        counts, edges = self.xp.histogram(x, bins=bins, range=range, weights=weights)
+        return self.xp.cumsum(counts), edges
 
     def rad2deg(self, x):
         return self.xp.rad2deg(x)
@@ -6,11 +6,14 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from earthkit.utils.array.capabilities import Capabilities
 from earthkit.utils.array.namespace.unknown import UnknownPatchedNamespace
 from earthkit.utils.decorators import thread_safe_cached_property
 
 
 class PatchedTorchNamespace(UnknownPatchedNamespace):
+    capabilities = Capabilities(percentile=True, histogram=True, dlpack=True, inplace=True, async_transfer=True)
+
     def __init__(self):
         super().__init__(None)
 
@@ -34,10 +37,14 @@ class PatchedTorchNamespace(UnknownPatchedNamespace):
         r[self.xp.isnan(x)] = self.xp.nan
         return r
 
-    def percentile(self, a, q, axis=None):
+    def percentile(self, a, q, axis=None, weights=None):
+        if weights is not None:
+            return self.weighted_quantile(a, self._asarray_like(q, a) / 100, weights, axis=axis)
         return self.xp.quantile(a, q / 100, dim=axis)
 
-    def quantile(self, a, q, axis=None):
+    def quantile(self, a, q, axis=None, weights=None):
+        if weights is not None:
+            return self.weighted_quantile(a, q, weights, axis=axis)
         return self.xp.quantile(a, q, dim=axis)
 
     def size(self, x):
@@ -48,8 +55,16 @@ class PatchedTorchNamespace(UnknownPatchedNamespace):
         """Return the shape of an array."""
         return tuple(x.shape)
 
-    def histogramdd(self, x, *, bins=10):
-        return self.xp.histogramdd(x, bins=bins)
+    def histogram2d(self, x, y, *, bins=10, weights=None):
+        """Compute a 2D histogram.
+
+        Unlike the other namespaces, it returns ``(hist, bin_edges)`` like
+        ``torch.histogramdd``, where ``bin_edges`` holds the x and y edges.
+        """
+        return self.histogramdd(self.xp.stack([x, y], axis=1), bins=bins, weights=weights)
+
+    def histogramdd(self, x, *, bins=10, weights=None):
+        return self.xp.histogramdd(x, bins=bins, weight=weights)
 
     def to_device(self, x, device, **kwargs):
         return x.to(device, **kwargs)
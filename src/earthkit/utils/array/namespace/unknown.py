@@ -6,10 +6,57 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import itertools
+import math
+
+from earthkit.utils.array.capabilities import Capabilities
+
+# Maximum number of elements compared at once by allclose
+ALLCLOSE_BLOCK_SIZE = 1 << 22
+
+
+class CloseReport:
+    """Result of :obj:`UnknownPatchedNamespace.allclose` with ``report=True``.
+
+    It evaluates to True if all the elements are close.
+
+    Attributes
+    ----------
+    mismatches: int
+        The number of elements that are not close.
+    size: int
+        The number of elements compared.
+    max_abs_error: float
+        The maximum of ``abs(x - y)`` over the finite differences.
+    max_rel_error: float
+        The maximum of ``abs(x - y) / abs(y)`` over the finite differences where
+        ``y`` is not zero.
+    """
+
+    def __init__(self, mismatches=0, size=0, max_abs_error=0.0, max_rel_error=0.0):
+        self.mismatches = mismatches
+        self.size = size
+        self.max_abs_error = max_abs_error
+        self.max_rel_error = max_rel_error
+
+    def __bool__(self):
+        return self.mismatches == 0
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(mismatches={self.mismatches}, size={self.size}, "
+            f"max_abs_error={self.max_abs_error}, max_rel_error={self.max_rel_error})"
+        )
+
 
 class UnknownPatchedNamespace:
-    def __init__(self, xp):
+    # features of the underlying namespace, nothing is assumed for unknown backends
+    capabilities = Capabilities()
+
+    def __init__(self, xp, capabilities=None):
         self._xp = xp
+        if capabilities is not None:
+            self.capabilities = capabilities
 
     @property
     def xp(self):
@@ -26,7 +73,23 @@ class UnknownPatchedNamespace:
     def _earthkit_array_namespace_name(self):
         return self.xp.__name__
 
-    def polyval(self, x, c):
+    def _asarray_like(self, a, x=None):
+        import array_api_compat
+
+        if array_api_compat.is_array_api_obj(a):
+            return a
+        if x is None:
+            return self.xp.asarray(a)
+        return self.xp.asarray(a, device=self.device(x))
+
+    def _as_floating(self, a):
+        # integer and boolean arrays are converted to the default floating point dtype
+        if self.isdtype(a.dtype, ("real floating", "complex floating")):
+            return a
+        dtype = self.__array_namespace_info__().default_dtypes(device=self.device(a))["real floating"]
+        return self.astype(a, dtype)
+
+    def polyval(self, x, c, tensor=True, *, out=None):
         """Evaluation of a polynomial using Horner's scheme.
 
         If ``c`` is of length ``n + 1``, this function returns the value
@@ -42,12 +105,26 @@ class UnknownPatchedNamespace:
             the elements of ``c``.
         c: array-like
             Array of coefficients ordered so that the coefficients for terms of
-            degree n are contained in c[n].
+            degree n are contained in c[n]. If ``c`` is multidimensional the
+            remaining indices enumerate multiple polynomials, e.g. in the two
+            dimensional case the coefficients of each polynomial are stored in
+            the columns of ``c``.
+        tensor: bool, optional
+            If True, the shape of ``c`` is extended with one dimension for each
+            dimension of ``x``, so every polynomial is evaluated at every value of
+            ``x`` and the result has the shape ``c.shape[1:] + x.shape``. If False,
+            ``x`` is broadcast over the columns of ``c``.
+        out: array-like, optional
+            Array to store the result in. It must have the broadcast shape of the
+            result. The polynomial is then evaluated in-place, without allocating an
+            array for each degree. Only supported by namespaces supporting in-place
+            updates.
 
         Returns
         -------
         values : array-like
-            The value(s) of the polynomial at the given point(s).
+            The value(s) of the polynomial at the given point(s). Integer and boolean
+            inputs are evaluated in the default floating point dtype of the namespace.
 
 
         Comments
@@ -55,33 +132,386 @@ class UnknownPatchedNamespace:
         Based on the ``numpy.polynomal.polynomial.polyval`` function.
 
         """
-        c0 = c[-1] + x * 0
-        for i in range(2, len(c) + 1):
-            c0 = c[-i] + c0 * x
-        return c0
+        x = self._as_floating(self._asarray_like(x))
+        c = self._as_floating(self._asarray_like(c, x))
+
+        if tensor and c.ndim > 1:
+            c = self.reshape(c, tuple(c.shape) + (1,) * x.ndim)
+
+        if out is None and not self.capabilities.inplace:
+            c0 = c[-1] + x * 0
+            for i in range(2, c.shape[0] + 1):
+                c0 = c[-i] + c0 * x
+            return c0
+
+        if not self.capabilities.inplace:
+            raise ValueError(f"out is not supported by {self._earthkit_array_namespace_name}")
+
+        allocated = out is None
+        if allocated:
+            shape = self.broadcast_arrays(c[-1], x)[0].shape
+            out = self.empty(shape, dtype=self.result_type(c, x), device=self.device(x))
+
+        # evaluated in-place to avoid allocating a new array for each degree
+        out[...] = c[-1]
+        for i in range(2, c.shape[0] + 1):
+            out *= x
+            out += c[-i]
+        # a scalar (e.g. np.float64 for numpy) for a scalar result, like numpy.polyval
+        return out[()] if allocated and out.ndim == 0 else out
+
+    def _polyvalnd(self, c, xs, out):
+        if len(set(tuple(self._asarray_like(x).shape) for x in xs)) > 1:
+            raise ValueError("The coordinate arrays must have the same shape")
+
+        c = self.polyval(xs[0], c)
+        for x in xs[1:-1]:
+            c = self.polyval(x, c, tensor=False)
+        return self.polyval(xs[-1], c, tensor=False, out=out)
+
+    def polyval2d(self, x, y, c, *, out=None):
+        r"""Evaluate a 2-D polynomial at points (x, y).
+
+        It returns the value
+
+        .. math:: p(x,y) = \sum_{i,j} c_{i,j} * x^i * y^j
+
+        Parameters
+        ----------
+        x, y: array-like
+            The coordinates of the points, they must have the same shape.
+        c: array-like
+            Array of coefficients ordered so that the coefficient of the term of
+            multi-degree i,j is contained in ``c[i,j]``.
+        out: array-like, optional
+            Array to store the result in. See :obj:`polyval`.
+
+        Returns
+        -------
+        values : array-like
+            The values of the polynomial at the points formed with pairs of
+            corresponding values from ``x`` and ``y``.
+
+        """
+        return self._polyvalnd(c, (x, y), out)
+
+    def polyval3d(self, x, y, z, c, *, out=None):
+        r"""Evaluate a 3-D polynomial at points (x, y, z).
+
+        It returns the value
+
+        .. math:: p(x,y,z) = \sum_{i,j,k} c_{i,j,k} * x^i * y^j * z^k
+
+        Parameters
+        ----------
+        x, y, z: array-like
+            The coordinates of the points, they must have the same shape.
+        c: array-like
+            Array of coefficients ordered so that the coefficient of the term of
+            multi-degree i,j,k is contained in ``c[i,j,k]``.
+        out: array-like, optional
+            Array to store the result in. See :obj:`polyval`.
+
+        Returns
+        -------
+        values : array-like
+            The values of the polynomial at the points formed with triples of
+            corresponding values from ``x``, ``y`` and ``z``.
+
+        """
+        return self._polyvalnd(c, (x, y, z), out)
+
+    def _sorted_last(self, a, axis):
+        a = self._asarray_like(a)
+        if not self.isdtype(a.dtype, "real floating"):
+            a = self.astype(a, self.float64)
+        # NaNs are sorted to the end of each slice
+        return self.sort(self._move_to_last(a, axis), axis=-1)
+
+    def _quantile_sorted(self, a, q, count):
+        """Compute quantiles with linear interpolation from sorted data.
+
+        ``a`` is sorted along the last axis and ``count`` is the number of valid
+        values at the start of each slice. All the slices are processed at once.
+        """
+        q = self._asarray_like(q, a)
+        scalar = q.ndim == 0
+        q = self.reshape(self.astype(q, a.dtype), (-1,) + (1,) * (a.ndim - 1))
+
+        n = self.shape(a)[-1]
+        rank = q * self.astype(count - 1, a.dtype)
+        low = self.floor(rank)
+        weight = rank - low
+        low = self.clip(self.astype(low, self.int64), 0, n - 1)[..., None]
+        high = self.clip(self.astype(self.ceil(rank), self.int64), 0, n - 1)[..., None]
+
+        a = self.broadcast_to(a, tuple(rank.shape) + (n,))
+        a_low = self.take_along_axis(a, low, axis=-1)[..., 0]
+        a_high = self.take_along_axis(a, high, axis=-1)[..., 0]
+        result = a_low + weight * (a_high - a_low)
+        return result[0, ...] if scalar else result
+
+    def percentile(self, a, q, axis=None, weights=None):
+        """Compute percentiles by calling the quantile function.
+
+        When ``weights`` is given, the weighted percentiles are computed with
+        :obj:`weighted_quantile`.
+        """
+        if weights is not None:
+            return self.weighted_quantile(a, self._asarray_like(q, a) / 100, weights, axis=axis)
+        if self.capabilities.percentile:
+            return self.xp.percentile(a, q, axis=axis)
+        return self.quantile(a, self._asarray_like(q, a) / 100, axis=axis)
+
+    def quantile(self, a, q, axis=None, weights=None):
+        if weights is not None:
+            return self.weighted_quantile(a, q, weights, axis=axis)
+        if self.capabilities.percentile:
+            return self.xp.quantile(a, q, axis=axis)
+
+        a = self._sorted_last(a, axis)
+        n = self.shape(a)[-1]
+        result = self._quantile_sorted(a, q, self.full(self.shape(a)[:-1], n, device=self.device(a)))
+        # as in numpy, a slice containing NaNs has a NaN quantile
+        return self.where(self.isnan(a[..., -1]), self.nan, result)
+
+    def nanpercentile(self, a, q, axis=None):
+        """Compute percentiles ignoring NaNs.
+
+        Parameters
+        ----------
+        a: array-like
+            The input array.
+        q: float or array-like
+            The percentile(s) to compute, in the range [0, 100].
+        axis: int, optional
+            The axis along which the percentiles are computed. When None, the
+            percentiles of the flattened array are computed.
+
+        Returns
+        -------
+        array-like
+            The percentiles. If ``q`` is an array, the first dimension of the result
+            corresponds to the percentiles. Slices with only NaNs give NaN.
+
+        """
+        return self.nanquantile(a, self._asarray_like(q, a) / 100, axis=axis)
+
+    def nanquantile(self, a, q, axis=None):
+        """Compute quantiles ignoring NaNs.
+
+        The data is sorted once along ``axis`` and the quantiles of every slice are
+        interpolated from its number of valid values, so all the slices are
+        processed at once.
 
-    def percentile(self, a, q, axis=None):
-        """Compute percentiles by calling the quantile function."""
+        Parameters
+        ----------
+        a: array-like
+            The input array.
+        q: float or array-like
+            The quantile(s) to compute, in the range [0, 1].
+        axis: int, optional
+            The axis along which the quantiles are computed. When None, the quantiles
+            of the flattened array are computed.
+
+        Returns
+        -------
+        array-like
+            The quantiles. If ``q`` is an array, the first dimension of the result
+            corresponds to the quantiles. Slices with only NaNs give NaN.
+
+        """
+        a = self._sorted_last(a, axis)
+        count = self.sum(self.astype(~self.isnan(a), self.int64), axis=-1)
+        result = self._quantile_sorted(a, q, count)
+        return self.where(count == 0, self.nan, result)
+
+    def _move_to_last(self, a, axis):
         if axis is None:
-            axis = 0
-            a = self.reshape(a, (-1,))
+            return self.reshape(a, (-1,))
+        return self.moveaxis(a, axis, -1)
+
+    def weighted_mean(self, a, weights, axis=None):
+        """Compute the weighted mean along the specified axis.
+
+        Parameters
+        ----------
+        a: array-like
+            The input array.
+        weights: array-like
+            The weights, broadcastable to the shape of ``a``.
+        axis: int, optional
+            The axis along which the mean is computed. When None, the mean of the
+            flattened array is computed.
+
+        """
+        a = self._asarray_like(a)
+        weights = self._asarray_like(weights, a)
+        return self.sum(a * weights, axis=axis) / self.sum(self.broadcast_to(weights, a.shape), axis=axis)
+
+    def weighted_quantile(self, a, q, weights, axis=None):
+        """Compute weighted quantiles along the specified axis.
+
+        The quantile is the smallest value whose cumulative weight is at least ``q``
+        times the total weight (the ``inverted_cdf`` method of ``numpy.quantile``).
+
+        Parameters
+        ----------
+        a: array-like
+            The input array.
+        q: float or array-like
+            The quantile(s) to compute, in the range [0, 1].
+        weights: array-like
+            The weights, broadcastable to the shape of ``a``.
+        axis: int, optional
+            The axis along which the quantiles are computed. When None, the quantiles
+            of the flattened array are computed.
+
+        Returns
+        -------
+        array-like
+            The quantiles. If ``q`` is an array, the first dimension of the result
+            corresponds to the quantiles.
 
-        a = self.sort(a, axis=axis)
+        """
+        a = self._asarray_like(a)
+        weights = self.broadcast_to(self._asarray_like(weights, a), a.shape)
+        a = self._move_to_last(a, axis)
+        weights = self._move_to_last(weights, axis)
+
+        order = self.argsort(a, axis=-1)
+        a = self.take_along_axis(a, order, axis=-1)
+        cdf = self.cumulative_sum(self.take_along_axis(weights, order, axis=-1), axis=-1)
+        cdf = cdf / cdf[..., -1:]
+
+        q = self._asarray_like(q, a)
+        scalar = q.ndim == 0
+        q = self.reshape(self.astype(q, cdf.dtype), (-1,) + (1,) * cdf.ndim)
+
+        # the index of the first cumulative weight reaching q in each slice
+        n = self.shape(a)[-1]
+        index = self.sum(self.astype(cdf < q, self.int64), axis=-1)
+        index = self.clip(index, 0, n - 1)[..., None]
+        result = self.take_along_axis(self.broadcast_to(a, index.shape[:-1] + (n,)), index, axis=-1)[..., 0]
+        return result[0, ...] if scalar else result
+
+    def running_mean(self, a, window, axis=-1):
+        """Compute the running mean over a moving window along the specified axis.
+
+        Only the windows fully inside the array are used, so the size of the
+        result along ``axis`` is ``n - window + 1``.
+
+        Parameters
+        ----------
+        a: array-like
+            The input array.
+        window: int
+            The size of the moving window.
+        axis: int, optional
+            The axis along which the running mean is computed.
+
+        """
+        a = self._asarray_like(a)
         n = self.shape(a)[axis]
-        rank = (q / 100) * (n - 1)
-        low = int(self.floor(rank))
-        high = int(self.ceil(rank))
-        weight = rank - low
+        if not 1 <= window <= n:
+            raise ValueError(f"window={window} must be between 1 and the size of the axis ({n})")
 
-        a_low = self.take(a, low, axis=axis)
-        a_high = self.take(a, high, axis=axis)
+        dtype = a.dtype
+        if self.isdtype(dtype, "real floating") and dtype != self.float64:
+            # the window sums are differences of the cumulative sums, which lose the
+            # precision of the data on long series when accumulated in lower precision
+            a = self.astype(a, self.float64)
 
-        return (1 - weight) * a_low + weight * a_high
+        a = self.moveaxis(a, axis, -1)
+        total = self.cumulative_sum(a, axis=-1, include_initial=True)
+        result = (total[..., window:] - total[..., :-window]) / window
+        if result.dtype != dtype and self.isdtype(dtype, "real floating"):
+            result = self.astype(result, dtype)
+        return self.moveaxis(result, -1, axis)
 
-    def quantile(self, a, q, axis=None):
-        return self.percentile(a, q * 100, axis=axis)
+    def cumulative_histogram(self, x, bins=10, range=None, weights=None):
+        """Compute the cumulative histogram of the flattened input.
 
-    def histogram2d(self, x, y, *, bins=10):
+        Parameters
+        ----------
+        x: array-like
+            The input data.
+        bins: int, optional
+            The number of equal-width bins.
+        range: tuple of float, optional
+            The lower and upper range of the bins. When None, the minimum and maximum
+            of the data are used. Values outside the range are ignored.
+        weights: array-like, optional
+            The weight of each value, broadcastable to the shape of ``x``.
+
+        Returns
+        -------
+        counts: array-like
+            The number of values in each bin and all the bins before it (int64), or
+            the sum of their weights when ``weights`` is given.
+        edges: array-like
+            The bin edges (length ``bins + 1``).
+
+        """
+        x = self._asarray_like(x)
+        if weights is not None:
+            weights = self.reshape(self.broadcast_to(self._asarray_like(weights, x), x.shape), (-1,))
+        x = self.reshape(x, (-1,))
+        if not self.isdtype(x.dtype, "real floating"):
+            x = self.astype(x, self.float64)
+
+        if range is None:
+            range = (float(self.min(x)), float(self.max(x))) if self.shape(x)[0] else (0.0, 1.0)
+        lo, hi = range
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        edges = self.linspace(lo, hi, bins + 1, dtype=x.dtype, device=self.device(x))
+
+        # the cumulative counts are the positions of the edges in the sorted data,
+        # the last bin is closed on the right
+        order = self.argsort(x)
+        x = self.take(x, order)
+        positions = self.concat([
+            self.searchsorted(x, edges[:-1], side="left"),
+            self.searchsorted(x, edges[-1:], side="right"),
+        ])
+        if weights is None:
+            return self.astype(positions[1:] - positions[:1], self.int64), edges
+
+        # the cumulative weights are read at the same positions
+        total = self.take(self._cumulative_weights(weights, order), positions)
+        return self.astype(total[1:] - total[:1], weights.dtype), edges
+
+    def _cumulative_weights(self, weights, order):
+        """Return the cumulative sum of ``weights`` taken in ``order``, starting with 0.
+
+        Floating weights are accumulated in float64, since the sums over ranges are
+        differences of the cumulative sums, which cancel the precision of the small
+        sums in lower precision.
+        """
+        weights = self.take(weights, order)
+        if self.isdtype(weights.dtype, "real floating"):
+            weights = self.astype(weights, self.float64)
+        return self.cumulative_sum(weights, include_initial=True)
+
+    def _bincount(self, index, length, weights=None):
+        """Count the occurrences of each value of ``index`` in ``[0, length)``.
+
+        The counts are the differences between the positions of consecutive values
+        in the sorted indices. With ``weights`` the sums of the weights are computed
+        the same way from the cumulative weights.
+        """
+        order = self.argsort(index)
+        index = self.take(index, order)
+        values = self.arange(length + 1, dtype=index.dtype, device=self.device(index))
+        positions = self.searchsorted(index, values, side="left")
+        if weights is None:
+            return positions[1:] - positions[:-1]
+
+        total = self.take(self._cumulative_weights(weights, order), positions)
+        return self.astype(total[1:] - total[:-1], weights.dtype)
+
+    def histogram2d(self, x, y, *, bins=10, weights=None):
         """Compute a 2D histogram.
 
         Parameters
@@ -93,38 +523,91 @@ class UnknownPatchedNamespace:
         bins: int or list of int, optional
             The number of bins for the histogram in each dimension. If bins is an
             int, it is used for both dimensions.
+        weights: array-like, optional
+            The weight of each point. When given, the histogram contains the sum of
+            the weights of the points in each bin.
 
-        """
-        return self.xp.histogramdd(self.xp.stack([x, y]).T, bins=bins)
+        Returns
+        -------
+        H: array-like
+            The histogram.
+        xedges, yedges: array-like
+            The bin edges along each dimension.
 
-    def histogramdd(self, x, *, bins=10):
-        N, D = x.shape
+        """
+        H, edges = self.histogramdd(self.stack([x, y], axis=1), bins=bins, weights=weights)
+        return H, edges[0], edges[1]
 
-        if isinstance(bins, int):
-            bins = [bins] * D
-        elif len(bins) != D:
-            raise ValueError("bins must have length equal to number of dimensions")
+    def histogramdd(self, x, *, bins=10, weights=None):
+        """Compute a multidimensional histogram.
 
-        mins = self.xp.min(x, axis=0)
-        maxs = self.xp.max(x, axis=0)
+        Parameters
+        ----------
+        x: array-like
+            An (N, D) array of N points in D dimensions.
+        bins: int or list of int, optional
+            The number of bins in each dimension.
+        weights: array-like, optional
+            The weight of each point. When given, the histogram contains the sum of
+            the weights of the points in each bin.
 
-        edges = [self.xp.linspace(mins[d], maxs[d], bins[d] + 1) for d in range(D)]
+        Returns
+        -------
+        H: array-like
+            The histogram, allocated on the device of ``x``. The counts are int64,
+            unless ``weights`` is given, in which case they have the dtype of the
+            weights. Backends with a native histogram may return float counts.
+        edges: list of array-like
+            The bin edges along each dimension.
 
-        idx = []
-        for d in range(D):
-            bin_width = edges[d][1] - edges[d][0]
-            i = self.xp.floor((x[:, d] - edges[d][0]) / bin_width).astype(int)
-            i = self.xp.clip(i, 0, bins[d] - 1)
-            idx.append(i)
+        """
+        if self.capabilities.histogram:
+            if weights is None:
+                return self.xp.histogramdd(x, bins=bins)
+            return self.xp.histogramdd(x, bins=bins, weights=weights)
 
-        idx = self.xp.stack(idx, axis=1)
+        x = self._asarray_like(x)
+        if not self.isdtype(x.dtype, "real floating"):
+            x = self.astype(x, self.float64)
+        N, D = self.shape(x)
+        device = self.device(x)
 
-        # TODO: do we need to handle device here?
-        H = self.xp.zeros(bins, dtype=float)
-        for i in range(N):
-            H[tuple(idx[i])] += 1
+        if isinstance(bins, int):
+            bins = [bins] * D
+        elif len(bins) != D:
+            raise ValueError("bins must have length equal to number of dimensions")
 
-        return H, edges
+        # the range of all the dimensions is computed with a single reduction
+        # and stays on the device of the input
+        if N == 0:
+            mins = self.zeros(D, dtype=x.dtype, device=device)
+            maxs = self.ones(D, dtype=x.dtype, device=device)
+        else:
+            mins = self.min(x, axis=0)
+            maxs = self.max(x, axis=0)
+        # as in numpy, an empty range is extended by 0.5 on both sides
+        flat = maxs <= mins
+        mins = self.where(flat, mins - 0.5, mins)
+        maxs = self.where(flat, maxs + 0.5, maxs)
+
+        n = self.asarray(bins, dtype=self.int64, device=device)
+        widths = (maxs - mins) / self.astype(n, x.dtype)
+        edges = [mins[d] + widths[d] * self.arange(bins[d] + 1, dtype=x.dtype, device=device) for d in range(D)]
+
+        # the index of each point in the flattened histogram, for all the
+        # dimensions at once
+        index = self.astype(self.floor((x - mins) / widths), self.int64)
+        index = self.maximum(self.minimum(index, n - 1), self.zeros_like(n))
+        strides = [math.prod(bins[d + 1 :]) for d in range(D)]
+        index = self.sum(index * self.asarray(strides, dtype=self.int64, device=device), axis=1)
+
+        if weights is not None:
+            weights = self._asarray_like(weights, x)
+        # the counts are int64, the sums of the weights keep the weights dtype
+        H = self._bincount(index, math.prod(bins), weights=weights)
+        if weights is None:
+            H = self.astype(H, self.int64)
+        return self.reshape(H, tuple(bins)), edges
 
     def size(self, x):
         """Return the size of an array."""
@@ -174,8 +657,81 @@ class UnknownPatchedNamespace:
             result = result | nan_mask
         return result
 
-    def allclose(self, x, y, *, rtol=1e-5, atol=1e-8, equal_nan=False):
-        return self.xp.all(self.isclose(x, y, rtol=rtol, atol=atol, equal_nan=equal_nan))
+    def _iter_blocks(self, x, y, block_size):
+        x, y = self.broadcast_arrays(self._asarray_like(x), self._asarray_like(y))
+        shape = tuple(self.shape(x))
+        if len(shape) == 0 or 0 in shape:
+            yield x, y
+            return
+
+        # blocks are basic slices, so they are views even when the inputs are broadcast.
+        # They are taken along the first axis whose trailing dimensions fit in a block,
+        # one index at a time along the axes before it
+        axis = len(shape) - 1
+        inner = 1
+        while axis > 0 and inner * shape[axis] <= block_size:
+            inner *= shape[axis]
+            axis -= 1
+
+        rows = max(1, block_size // inner)
+        for lead in itertools.product(*(range(n) for n in shape[:axis])):
+            for start in range(0, shape[axis], rows):
+                stop = min(start + rows, shape[axis])
+                index = tuple(slice(i, i + 1) for i in lead) + (slice(start, stop), ...)
+                yield x[index], y[index]
+
+    def allclose(self, x, y, *, rtol=1e-5, atol=1e-8, equal_nan=False, report=False, block_size=None):
+        """Check if all the elements of two arrays are close.
+
+        The arrays are compared block by block, so the temporary arrays are bounded by
+        the block size. Unless ``report`` is True, the comparison stops at the first
+        block containing elements that are not close.
+
+        Parameters
+        ----------
+        x, y: array-like
+            The arrays to compare. They must be broadcastable to the same shape.
+        rtol, atol: float
+            The relative and absolute tolerances, see :obj:`isclose`.
+        equal_nan: bool
+            Whether to consider NaNs at the same position as equal.
+        report: bool
+            If True, all the blocks are compared and a :class:`CloseReport` is returned
+            with the number of mismatches and the maximum absolute and relative errors.
+        block_size: int, optional
+            Maximum number of elements compared at once. Defaults to
+            ``ALLCLOSE_BLOCK_SIZE``.
+
+        Returns
+        -------
+        bool or CloseReport
+
+        """
+        if block_size is None:
+            block_size = ALLCLOSE_BLOCK_SIZE
+
+        result = CloseReport()
+        for bx, by in self._iter_blocks(x, y, block_size):
+            close = self.isclose(bx, by, rtol=rtol, atol=atol, equal_nan=equal_nan)
+            if not report:
+                if not bool(self.all(close)):
+                    return False
+                continue
+
+            result.size += math.prod(self.shape(close))
+            result.mismatches += int(self.sum(self.astype(~close, self.int64)))
+
+            err = self.abs(bx - by)
+            finite = self.isfinite(err)
+            if bool(self.any(finite)):
+                zeros = self.zeros_like(err)
+                result.max_abs_error = max(result.max_abs_error, float(self.max(self.where(finite, err, zeros))))
+                ay = self.abs(by) + zeros
+                nonzero = finite & (ay > 0)
+                rel = self.where(nonzero, err, zeros) / self.where(nonzero, ay, zeros + 1)
+                result.max_rel_error = max(result.max_rel_error, float(self.max(rel)))
+
+        return result if report else True
 
     def deg2rad(self, x):
         from earthkit.utils.constants import radian
@@ -6,6 +6,14 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
-from earthkit.utils.array.testing.testing import NAMESPACE_DEVICES
+import typing as T
+
+from earthkit.utils._lazy import lazy_attributes
+
+if T.TYPE_CHECKING:
+    from earthkit.utils.array.testing.testing import NAMESPACE_DEVICES
+
+# the devices are only enumerated when accessed
+__getattr__, __dir__ = lazy_attributes(__name__, {"NAMESPACE_DEVICES": "testing"})
 
 __all__ = ["NAMESPACE_DEVICES"]
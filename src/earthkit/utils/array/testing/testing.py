@@ -6,45 +6,148 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+"""Array backends available for testing.
+
+The backends are probed lazily, the first time one of ``NO_TORCH``, ``NO_CUPY``,
+``NO_JAX``, ``NO_XARRAY``, ``NO_DASK``, ``ARRAY_NAMES`` or ``NAMESPACE_DEVICES`` is
+accessed, and the results are cached for the process. Only the availability of cupy
+requires importing it and allocating an array on the GPU, the other backends are
+looked up without being imported.
+
+When the ``EARTHKIT_UTILS_PROBE_CACHE`` environment variable is set to a directory,
+the results of the probes are also stored on disk, keyed by the Python executable,
+the versions of the backends and the visible CUDA devices.
+"""
+
+import functools
+import hashlib
+import json
 import logging
+import os
+import sys
+import threading
 from importlib import import_module
-
-from earthkit.utils.array.namespace import _NAMESPACES
+from importlib.util import find_spec
 
 LOG = logging.getLogger(__name__)
 
+PROBE_CACHE_ENV = "EARTHKIT_UTILS_PROBE_CACHE"
+
+# the modules required by each backend
+_BACKEND_MODULES = {
+    "torch": ("torch",),
+    "cupy": ("cupy",),
+    "jax": ("jax", "jaxlib"),
+    "xarray": ("xarray",),
+    "dask": ("dask",),
+}
+
+_NO_FLAGS = {f"NO_{name.upper()}": name for name in _BACKEND_MODULES}
+
+_PROBES = {}
+_PROBES_LOCK = threading.Lock()
+
 
 def _modules_installed(*modules):
     for module in modules:
         try:
-            import_module(module)
-        except ImportError:
+            if find_spec(module) is None:
+                return False
+        except (ImportError, ValueError):
+            return False
+    return True
+
+
+def _probe(name):
+    if not _modules_installed(*_BACKEND_MODULES[name]):
+        return False
+    if name == "cupy":
+        # cupy can be installed without a usable GPU
+        try:
+            cp = import_module("cupy")
+            cp.ones(2)
+        except Exception:
             return False
     return True
 
 
-NO_TORCH = not _modules_installed("torch")
-NO_CUPY = not _modules_installed("cupy")
-NO_JAX = not _modules_installed("jax")
-NO_XARRAY = not _modules_installed("xarray")
-if not NO_CUPY:
+def _environment_key():
+    from importlib.metadata import PackageNotFoundError, version
+
+    items = [sys.executable, sys.version, os.environ.get("CUDA_VISIBLE_DEVICES", "")]
+    for name in sorted(_BACKEND_MODULES):
+        try:
+            items.append(f"{name}={version(name)}")
+        except PackageNotFoundError:
+            items.append(f"{name}=")
+    return hashlib.sha256("\n".join(items).encode()).hexdigest()[:16]
+
+
+def _cache_path():
+    directory = os.environ.get(PROBE_CACHE_ENV)
+    if not directory:
+        return None
+    return os.path.join(directory, f"probes-{_environment_key()}.json")
+
+
+def _load_probes(path):
     try:
-        import cupy as cp
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_probes(path, probes):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}"
+        with open(tmp, "w") as f:
+            json.dump(probes, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        LOG.warning(f"Failed to write the backend probe cache {path}: {e}")
+
+
+def backend_available(name):
+    """Return True if the array backend ``name`` is available for testing.
+
+    The result is cached for the process, and on disk when the
+    ``EARTHKIT_UTILS_PROBE_CACHE`` environment variable is set.
+    """
+    try:
+        return _PROBES[name]
+    except KeyError:
+        pass
+
+    with _PROBES_LOCK:
+        if name not in _PROBES:
+            path = _cache_path()
+            cached = _load_probes(path) if path else {}
+            if name in cached:
+                _PROBES[name] = bool(cached[name])
+            else:
+                _PROBES[name] = _probe(name)
+                if path:
+                    cached[name] = _PROBES[name]
+                    _save_probes(path, cached)
+        return _PROBES[name]
 
-        a = cp.ones(2)
-    except Exception:
-        NO_CUPY = True
 
-ARRAY_NAMES = ["numpy"]
-if not NO_TORCH:
-    ARRAY_NAMES.append("torch")
-if not NO_CUPY:
-    ARRAY_NAMES.append("cupy")
-# if not NO_JAX:
-#     ARRAY_NAMES.append("jax")
+@functools.cache
+def _array_names():
+    names = ["numpy"]
+    for name in ("torch", "cupy"):
+        if backend_available(name):
+            names.append(name)
+    # if backend_available("jax"):
+    #     names.append("jax")
+    return tuple(names)
 
 
 def _get_namespace_devices(names):
+    from earthkit.utils.array.namespace import _NAMESPACES
+
     devices = []
     namespaces = []
     for name in names:
@@ -58,4 +161,31 @@ def _get_namespace_devices(names):
     return list(zip(namespaces, devices))
 
 
-NAMESPACE_DEVICES = _get_namespace_devices(ARRAY_NAMES)
+@functools.cache
+def _namespace_devices():
+    return tuple(_get_namespace_devices(_array_names()))
+
+
+def get_array_names():
+    """Return the names of the array backends to test."""
+    return list(_array_names())
+
+
+def get_namespace_devices():
+    """Return the (namespace, device) pairs to test, enumerated on the first call."""
+    return list(_namespace_devices())
+
+
+def __getattr__(name):
+    # the probes only run when the constants are accessed
+    if name in _NO_FLAGS:
+        return not backend_available(_NO_FLAGS[name])
+    if name == "ARRAY_NAMES":
+        return get_array_names()
+    if name == "NAMESPACE_DEVICES":
+        return get_namespace_devices()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_NO_FLAGS) | {"ARRAY_NAMES", "NAMESPACE_DEVICES"})
@@ -0,0 +1,278 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+"""Tracing of the device to host copies made by the array converters.
+
+A device to host copy is *explicit* when it is requested by :func:`earthkit.utils.array.convert`
+with a host target, i.e. the numpy namespace or the "cpu" device. All the other copies,
+e.g. the fallback of a conversion through numpy, are *implicit*::
+
+    from earthkit.utils.array.transfer import trace_transfers
+
+    with trace_transfers() as ledger:
+        run_pipeline()
+    print(ledger.summary())
+
+    # raise ImplicitTransferError on the first implicit copy
+    with trace_transfers(strict=True):
+        run_pipeline()
+
+The copies are also emitted as ``transfer`` events to the sinks of
+:mod:`earthkit.utils.instrumentation`.
+"""
+
+import contextlib
+import contextvars
+import os
+import threading
+import time
+import traceback
+from collections import defaultdict
+
+from earthkit.utils import instrumentation as _instrumentation
+
+# the default number of frames kept in the stack of a transfer
+TRANSFER_STACK_DEPTH = 8
+
+# True when at least one ledger is active in any thread, checked by the converters
+ENABLED = False
+
+# the number of active ledgers in all the threads
+_ACTIVE = 0
+_LOCK = threading.Lock()
+
+# the ledgers of the current context, so a block only affects the code it runs
+_LEDGERS = contextvars.ContextVar("earthkit_utils_transfer_ledgers", default=())
+_EXPLICIT = contextvars.ContextVar("earthkit_utils_transfer_explicit", default=False)
+
+# the frames of the array package are left out of the stacks
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class ImplicitTransferError(RuntimeError):
+    """Raised on an implicit device to host copy inside a strict :func:`trace_transfers` block."""
+
+
+class Transfer:
+    """A device to host copy.
+
+    Parameters
+    ----------
+    source: str
+        The name of the source array namespace.
+    target: str
+        The name of the target array namespace.
+    device: str
+        The device of the source array.
+    nbytes: int
+        The number of bytes of the source array, None when unknown.
+    duration: float
+        The duration of the copy in seconds.
+    implicit: bool
+        True when the copy was not requested explicitly.
+    stack: list of str
+        The formatted innermost frames of the call stack, without the frames of
+        :mod:`earthkit.utils.array`.
+    """
+
+    __slots__ = ("source", "target", "device", "nbytes", "duration", "implicit", "stack")
+
+    def __init__(self, source, target, device, nbytes, duration, implicit, stack):
+        self.source = source
+        self.target = target
+        self.device = device
+        self.nbytes = nbytes
+        self.duration = duration
+        self.implicit = implicit
+        self.stack = stack
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.source!r} -> {self.target!r}, device={self.device!r}, "
+            f"nbytes={self.nbytes}, duration={self.duration:.6f}, implicit={self.implicit})"
+        )
+
+
+class TransferLedger:
+    """Record of the device to host copies made in a :func:`trace_transfers` block.
+
+    Parameters
+    ----------
+    strict: bool, optional
+        If True, an implicit copy raises :class:`ImplicitTransferError` instead of being
+        made.
+    stack_depth: int, optional
+        The number of frames kept in the stack of each transfer. Defaults to
+        :obj:`TRANSFER_STACK_DEPTH`.
+    """
+
+    def __init__(self, strict=False, stack_depth=None):
+        self.strict = strict
+        self.stack_depth = TRANSFER_STACK_DEPTH if stack_depth is None else stack_depth
+        self.transfers = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.transfers)
+
+    def __iter__(self):
+        return iter(list(self.transfers))
+
+    def _append(self, transfer):
+        with self._lock:
+            self.transfers.append(transfer)
+
+    @property
+    def nbytes(self):
+        """The total number of bytes copied."""
+        return sum(t.nbytes or 0 for t in self.transfers)
+
+    @property
+    def implicit(self):
+        """The implicit transfers."""
+        return [t for t in self.transfers if t.implicit]
+
+    def summary(self):
+        """Return the number of transfers, bytes and time keyed by (source, target, device)."""
+        result = defaultdict(lambda: {"count": 0, "nbytes": 0, "time": 0.0, "implicit": 0})
+        with self._lock:
+            for t in self.transfers:
+                s = result[(t.source, t.target, t.device)]
+                s["count"] += 1
+                s["nbytes"] += t.nbytes or 0
+                s["time"] += t.duration
+                s["implicit"] += int(t.implicit)
+        return dict(result)
+
+    def clear(self):
+        with self._lock:
+            self.transfers.clear()
+
+
+def _update(increment):
+    global ENABLED, _ACTIVE
+    with _LOCK:
+        _ACTIVE += increment
+        ENABLED = _ACTIVE > 0
+
+
+@contextlib.contextmanager
+def trace_transfers(strict=False, stack_depth=None):
+    """Record the device to host copies made inside the block.
+
+    Parameters
+    ----------
+    strict: bool, optional
+        If True, an implicit device to host copy raises :class:`ImplicitTransferError`.
+    stack_depth: int, optional
+        The number of frames kept in the stack of each transfer.
+
+    Yields
+    ------
+    TransferLedger
+        The ledger collecting the transfers.
+
+    Notes
+    -----
+    The ledger, and its strictness, are scoped to the current thread (more precisely
+    the current :mod:`contextvars` context): the copies made by other threads are not
+    recorded. Threads started with a copy of the context, like the workers of
+    :func:`earthkit.utils.array.convert_tiled`, are recorded.
+    """
+    ledger = TransferLedger(strict=strict, stack_depth=stack_depth)
+    token = _LEDGERS.set(_LEDGERS.get() + (ledger,))
+    _update(1)
+    try:
+        yield ledger
+    finally:
+        _LEDGERS.reset(token)
+        _update(-1)
+
+
+@contextlib.contextmanager
+def _explicit(value=True):
+    """Mark the device to host copies made by the current thread in the block as explicit."""
+    token = _EXPLICIT.set(value)
+    try:
+        yield
+    finally:
+        _EXPLICIT.reset(token)
+
+
+def _implicit():
+    return _explicit(False)
+
+
+def _nbytes(array):
+    nbytes = getattr(array, "nbytes", None)
+    if nbytes is None and hasattr(array, "element_size"):
+        # torch
+        nbytes = array.element_size() * array.numel()
+    return nbytes
+
+
+def _device(array):
+    device = getattr(array, "device", None)
+    return None if device is None else str(device)
+
+
+def _is_host(device):
+    return device is None or "cpu" in device.lower()
+
+
+def _to_host(array, copy, source, target="numpy"):
+    """Return ``copy(array)``, tracing it when ``array`` is on a device.
+
+    Parameters
+    ----------
+    array: array
+        The array to copy.
+    copy: callable
+        Makes the copy, e.g. ``lambda x: x.cpu().numpy()``.
+    source: str
+        The name of the source array namespace.
+    target: str, optional
+        The name of the target array namespace.
+    """
+    if not (ENABLED or _instrumentation.ENABLED):
+        return copy(array)
+
+    device = _device(array)
+    if _is_host(device):
+        return copy(array)
+
+    implicit = not _EXPLICIT.get()
+    ledgers = _LEDGERS.get()
+    if implicit and any(ledger.strict for ledger in ledgers):
+        raise ImplicitTransferError(
+            f"Implicit device to host copy of a {source} array on device={device} to {target}. Use "
+            "earthkit.utils.array.convert() to copy it explicitly"
+        )
+
+    start = time.perf_counter()
+    result = copy(array)
+    duration = time.perf_counter() - start
+
+    nbytes = _nbytes(array)
+    if ledgers:
+        depth = max(ledger.stack_depth for ledger in ledgers)
+        frames = traceback.extract_stack()
+        while frames and frames[-1].filename.startswith(_PACKAGE_DIR):
+            frames.pop()
+        stack = traceback.format_list(frames[-depth:]) if depth > 0 else []
+        for ledger in ledgers:
+            frames = stack[len(stack) - ledger.stack_depth :] if ledger.stack_depth > 0 else []
+            ledger._append(Transfer(source, target, device, nbytes, duration, implicit, frames))
+
+    _instrumentation.record(
+        "transfer", duration, source=source, target=target, device=device, nbytes=nbytes, implicit=implicit
+    )
+    return result
+
+
+__all__ = ["ImplicitTransferError", "Transfer", "TransferLedger", "trace_transfers"]
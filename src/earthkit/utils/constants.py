@@ -1,7 +1,7 @@
-import numpy as np
+import math
 
-degree = 180.0 / np.pi
+degree = 180.0 / math.pi
 r"""Factor for converting radians to degrees."""
 
-radian = np.pi / 180.0
+radian = math.pi / 180.0
 r"""Factor for converting degrees to radians."""
@@ -8,17 +8,45 @@
 
 """Function decorators and wrappers for use in the downstream EarthKit packages."""
 
-from earthkit.utils.decorators._dispatch import dispatch
-from earthkit.utils.decorators._experimental import ExperimentalWarning, experimental
-from earthkit.utils.decorators._format_handlers import format_handler
-from earthkit.utils.decorators._thread_handlers import thread_safe_cached_property
-from earthkit.utils.decorators._xarray_ufunc import xarray_ufunc
+import typing as T
+
+from earthkit.utils._lazy import lazy_attributes
+
+if T.TYPE_CHECKING:
+    from earthkit.utils.decorators._async_handlers import async_cached_property
+    from earthkit.utils.decorators._dispatch import dispatch
+    from earthkit.utils.decorators._experimental import ExperimentalWarning, experimental
+    from earthkit.utils.decorators._format_handlers import format_handler
+    from earthkit.utils.decorators._thread_handlers import (
+        thread_safe_cached_property,
+        thread_safe_slotted_cached_property,
+    )
+    from earthkit.utils.decorators._xarray_ufunc import xarray_pipeline, xarray_ufunc
+
+# the submodules are only imported when one of their names is accessed
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ExperimentalWarning": "_experimental",
+        "experimental": "_experimental",
+        "thread_safe_cached_property": "_thread_handlers",
+        "thread_safe_slotted_cached_property": "_thread_handlers",
+        "async_cached_property": "_async_handlers",
+        "format_handler": "_format_handlers",
+        "dispatch": "_dispatch",
+        "xarray_ufunc": "_xarray_ufunc",
+        "xarray_pipeline": "_xarray_ufunc",
+    },
+)
 
 __all__ = [
     "ExperimentalWarning",
     "experimental",
     "thread_safe_cached_property",
+    "thread_safe_slotted_cached_property",
+    "async_cached_property",
     "format_handler",
     "dispatch",
     "xarray_ufunc",
+    "xarray_pipeline",
 ]
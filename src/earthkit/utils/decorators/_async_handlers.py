@@ -0,0 +1,85 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import asyncio
+import inspect
+
+
+class async_cached_property:
+    """A cached property decorator for coroutine methods.
+
+    Accessing the property returns an awaitable. The first await runs the underlying
+    coroutine and stores its result as the hidden ``name`` attribute of the instance,
+    subsequent awaits return the cached result. Concurrent awaiters on the same event
+    loop share the single in-flight computation instead of starting new ones.
+
+    If the computation raises, every awaiter receives the exception and nothing is
+    cached, so the next await runs the coroutine again. Cancelling one awaiter does not
+    cancel the shared computation.
+
+    Parameters
+    ----------
+    method: coroutine function
+        The property method to be decorated.
+
+    Examples
+    --------
+    >>> class Catalog:
+    ...     @async_cached_property
+    ...     async def metadata(self):
+    ...         return await load_metadata()
+    ...
+    >>> metadata = await Catalog().metadata
+
+    """
+
+    def __init__(self, method):
+        if not inspect.iscoroutinefunction(method):
+            raise TypeError(f"{method.__qualname__!r} is not a coroutine function")
+        self.method = method
+        self.name = f"_c_{method.__name__}"
+        self.pending = f"_p_{method.__name__}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        # not all objects have __dict__ (e.g. class defines slots)
+        try:
+            cache = instance.__dict__
+        except AttributeError:
+            msg = f"No '__dict__' is available on {type(instance).__name__!r}"
+            raise TypeError(msg) from None
+
+        return self._get(instance, cache)
+
+    async def _get(self, instance, cache):
+        if self.name in cache:
+            return cache[self.name]
+
+        loop = asyncio.get_running_loop()
+        task = cache.get(self.pending)
+        # an in-flight computation can only be shared within its own event loop
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._compute(instance, cache))
+            cache[self.pending] = task
+
+        return await asyncio.shield(task)
+
+    async def _compute(self, instance, cache):
+        try:
+            value = await self.method(instance)
+            cache[self.name] = value
+            return value
+        finally:
+            if cache.get(self.pending) is asyncio.current_task():
+                del cache[self.pending]
+
+    def invalidate(self, instance):
+        """Drop the value cached on ``instance``, so that the next await recomputes it."""
+        instance.__dict__.pop(self.name, None)
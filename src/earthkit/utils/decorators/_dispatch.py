@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable
 from functools import wraps
@@ -17,6 +18,8 @@ from importlib import import_module
 from inspect import signature
 from typing import TYPE_CHECKING, Any
 
+from earthkit.utils import instrumentation as _instrumentation
+
 if TYPE_CHECKING:
     import xarray as xr  # noqa: F401
     from earthkit.data import FieldList  # noqa: F401
@@ -199,6 +202,7 @@ def dispatch(
 
         @wraps(_func)
         def wrapper(*args, **kwargs):
+            start = time.perf_counter() if _instrumentation.ENABLED else None
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
 
@@ -214,6 +218,13 @@ def dispatch(
                     LOG.debug(f"Dispatcher {dispatcher.__class__.__name__} failed to match due to error: {e}")
                     continue
                 if _matched:
+                    if start is not None:
+                        _instrumentation.record(
+                            "dispatch",
+                            time.perf_counter() - start,
+                            function=_func.__qualname__,
+                            dispatcher=type(dispatcher).__name__,
+                        )
                     return dispatcher.dispatch(_func.__name__, _module, *args, **kwargs)
             raise TypeError(
                 f"No dispatcher matched for function {_func.__name__} with argument {param_name} "
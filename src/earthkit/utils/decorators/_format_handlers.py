@@ -8,9 +8,14 @@
 
 import inspect
 import logging
+import threading
+import time
 import types
 import typing as T
-from functools import wraps
+import weakref
+from functools import partial, wraps
+
+from earthkit.utils import instrumentation as _instrumentation
 
 LOG = logging.getLogger(__name__)
 
@@ -24,6 +29,61 @@ except AttributeError:
 
 EMPTY_TYPES = [inspect._empty]
 
+# Marks a (key, type) pair for which no transformation succeeded
+_NO_TRANSFORM = object()
+
+
+class _TransformMemo:
+    """Memo of transformation results keyed weakly on the source object.
+
+    Entries are keyed on the identity of the source object and the target type. An
+    entry is dropped when the source object is garbage-collected, so a result that holds a
+    reference to its own source keeps the entry alive. Objects that cannot be weakly
+    referenced are transformed without being memoised.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def transform(self, transform, value, target_type):
+        key = id(value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is value and target_type in entry[1]:
+                return entry[1][target_type]
+
+        result = transform(value, target_type)
+
+        try:
+            ref = weakref.ref(value, partial(self._remove, key))
+        except TypeError:
+            return result
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0]() is not value:
+                entry = (ref, {})
+                self._entries[key] = entry
+            entry[1][target_type] = result
+        return result
+
+    def _remove(self, key, ref):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+
+_TRANSFORM_MEMO = _TransformMemo()
+
 
 # Consider moving these to earthkit-utils
 def _ensure_iterable(input_item):
@@ -43,6 +103,7 @@ def _ensure_tuple(input_item):
 def format_handler(
     kwarg_types: T.Dict[str, T.Any] = {},
     convert_types: T.Union[None, T.Tuple[T.Any], T.Dict[str, T.Tuple[T.Any]]] = None,
+    memoize: bool = False,
 ) -> T.Callable:
     """Transform the inputs to a function to match the requirements.
 
@@ -55,6 +116,12 @@ def format_handler(
         Data types to try to convert, in cases where the function is flexible and can handle multiple
         types which are not specified by the type-setting. For example, numpy functions can often handle
         numpy, pandas and xarray data objects. If a dict, applies per-argument.
+    memoize : bool
+        If True, the result of transforming an input object is memoised and reused when the same
+        object is transformed to the same type again, by this or any other function decorated with
+        ``memoize=True``. The memo is keyed weakly on the identity of the input object and is
+        dropped when it is garbage-collected. The input object must not be modified in place
+        while it is memoised. Default is False.
 
     Returns
     -------
@@ -66,59 +133,112 @@ def format_handler(
         convert_types = {}
 
     def decorator(function: T.Callable) -> T.Callable:
-        def _wrapper(_kwarg_types, _convert_types, *args, **kwargs):
-            _kwarg_types = {**_kwarg_types}
-            signature = inspect.signature(function)
-            mapping = signature_mapping(signature, _kwarg_types)
-
-            # Store positional arg names for extraction later
-            arg_names = []
-            for arg, name in zip(args, signature.parameters):
-                arg_names.append(name)
-                kwargs[name] = arg
-
-            # # Split args into multiple
-            # if len(args) < len(expected_args):
-
-            convert_kwargs = [k for k in kwargs if k in mapping]
-
-            # Filter for convert_types
-            if _convert_types:
-                if not isinstance(_convert_types, dict):
-                    _convert_types = {key: _convert_types for key in convert_kwargs}
-
-                convert_kwargs = [
-                    k for k in convert_kwargs if isinstance(kwargs[k], _ensure_tuple(_convert_types.get(k, ())))
-                ]
-
-            # Transform args/kwargs
-            try:
-                from earthkit.data.translators import transform
-            except ImportError as e:
-                LOG.debug(
-                    "earthkit.data is required for the format_handler decorator to perform data "
-                    f"transformations, error: {e}"
+        # Everything that only depends on the function is resolved once here
+        # so that the per-call overhead is limited to the type checks
+        signature = inspect.signature(function)
+        mapping = signature_mapping(signature, kwarg_types)
+        param_names = list(signature.parameters)
+        # Parameters annotated with typing.Any accept any value and are never transformed
+        types_allowed = {
+            key: _ensure_iterable(value)
+            for key, value in mapping.items()
+            if not any(t is T.Any for t in _ensure_iterable(value))
+        }
+        # Only actual classes can be used with isinstance, other annotations
+        # (e.g. strings or parametrised generics) are never considered a match
+        # (on Python 3.10, isinstance(list[int], type) is True, hence the get_origin check)
+        classes_allowed = {
+            key: tuple(t for t in value if isinstance(t, type) and T.get_origin(t) is None)
+            for key, value in types_allowed.items()
+        }
+
+        if not convert_types:
+            filter_types = None
+        elif isinstance(convert_types, dict):
+            filter_types = {key: _ensure_tuple(convert_types.get(key, ())) for key in mapping}
+        else:
+            filter_types = {key: _ensure_tuple(convert_types) for key in mapping}
+
+        # The translator is only looked up when a transformation is first needed,
+        # so that decorating a function does not import earthkit.data
+        translator = {}
+
+        # Maps (key, type(value)) to the target type that the last transformation
+        # succeeded with, or to _NO_TRANSFORM if none of the target types worked
+        transform_cache = {}
+
+        def _get_transform():
+            if "transform" not in translator:
+                try:
+                    from earthkit.data.translators import transform
+                except ImportError as e:
+                    LOG.debug(
+                        "earthkit.data is required for the format_handler decorator to perform data "
+                        f"transformations, error: {e}"
+                    )
+                    transform = None
+                translator["transform"] = transform
+            return translator["transform"]
+
+        def _needs_transform(key, value):
+            if key not in types_allowed:
+                return False
+            if filter_types is not None and not isinstance(value, filter_types[key]):
+                return False
+            return not isinstance(value, classes_allowed[key])
+
+        def _transform(key, value):
+            transform = _get_transform()
+            if transform is None:
+                LOG.warning(
+                    "input object type does not match the expected function type(s) and "
+                    "earthkit.data is not available for transformation. Proceeding without "
+                    "transformation."
                 )
-                transform = None
-
-            for key in convert_kwargs:
-                value = kwargs[key]
-                types_allowed = _ensure_iterable(mapping[key])
-                if type(value) not in types_allowed:
-                    if transform is None:
-                        LOG.warning(
-                            "input object type does not match the expected function type(s) and "
-                            "earthkit.data is not available for transformation. Proceeding without "
-                            "transformation."
-                        )
+                return value
+
+            cache_key = (key, type(value))
+            cached_type = transform_cache.get(cache_key)
+            if cached_type is _NO_TRANSFORM:
+                LOG.debug(f"Skipping transformation for key {key}, no target type succeeded previously")
+                return value
+
+            target_types = list(types_allowed[key])
+            if cached_type is not None:
+                target_types.remove(cached_type)
+                target_types.insert(0, cached_type)
+
+            for target_type in target_types:
+                try:
+                    if memoize:
+                        result = _TRANSFORM_MEMO.transform(transform, value, target_type)
                     else:
-                        for target_type in types_allowed:
-                            try:
-                                kwargs[key] = transform(value, target_type)
-                            except Exception as e:
-                                LOG.debug(f"Transformation failed for key {key} to type {target_type}: {e}")
-                                continue
-                            break
+                        result = transform(value, target_type)
+                except Exception as e:
+                    LOG.debug(f"Transformation failed for key {key} to type {target_type}: {e}")
+                    continue
+                transform_cache[cache_key] = target_type
+                return result
+
+            transform_cache[cache_key] = _NO_TRANSFORM
+            return value
+
+        def _wrapper(*args, **kwargs):
+            start = time.perf_counter() if _instrumentation.ENABLED else None
+            transformed = False
+
+            # Positional args are matched to the parameter names in order
+            for i, (name, value) in enumerate(zip(param_names, args)):
+                if _needs_transform(name, value):
+                    if not transformed:
+                        args = list(args)
+                        transformed = True
+                    args[i] = _transform(name, value)
+
+            for name, value in kwargs.items():
+                if _needs_transform(name, value):
+                    kwargs[name] = _transform(name, value)
+                    transformed = True
 
             # TODO: check if this is needed anymore
             # # Expand Wrapper objects
@@ -129,16 +249,22 @@ def format_handler(
             #         except Exception:
             #             pass
 
-            # Extract positional args again
-            args = [kwargs.pop(name) for name in arg_names]
-            LOG.debug("ek-data %s %s", args, kwargs)
+            if transformed:
+                LOG.debug("ek-data %s %s", args, kwargs)
+            if start is not None:
+                _instrumentation.record(
+                    "format_handler",
+                    time.perf_counter() - start,
+                    function=function.__qualname__,
+                    transformed=transformed,
+                )
             return function(*args, **kwargs)
 
         @wraps(function)
         def wrapper(*args, _auto_inputs_transform=True, **kwargs):
             if not _auto_inputs_transform:
                 return function(*args, **kwargs)
-            return _wrapper(kwarg_types, convert_types, *args, **kwargs)
+            return _wrapper(*args, **kwargs)
 
         return wrapper
 
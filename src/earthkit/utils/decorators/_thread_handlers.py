@@ -6,7 +6,21 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import logging
 import threading
+import time
+import types
+import weakref
+from functools import partial
+
+LOG = logging.getLogger(__name__)
+
+# Each property stripes its instances over 2**_LOCK_STRIPE_BITS locks
+_LOCK_STRIPE_BITS = 6
+_LOCK_STRIPES = 1 << _LOCK_STRIPE_BITS
+# Fibonacci hashing constant (2**64 / golden ratio)
+_FIB_HASH = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
 
 
 class thread_safe_cached_property:
@@ -18,19 +32,61 @@ class thread_safe_cached_property:
     Parameters
     ----------
     method: property method
-        The property method to be decorated.
+        The property method to be decorated. When used with arguments
+        (``@thread_safe_cached_property(ttl=...)``), *method* is ``None``.
+    ttl: float, optional
+        Number of seconds after which a cached value expires. When ``None`` (default)
+        the value is cached until it is invalidated.
+    stale_while_revalidate: bool, optional
+        If ``True``, an expired value is still returned while it is recomputed in a
+        background thread. If the recomputation fails the expired value is kept. Only
+        valid together with ``ttl``.
 
     The :obj:`__get__` method of the decorator only runs on lookups. On first call
     it gets the underlying property's value and stores it as the hidden ``name`` attribute
     of the instance it was called on. Subsequent calls return the cached value, i.e. the
     hidden ``name`` attribute.
 
+    Reading an already cached value does not take any lock. The computation itself is
+    guarded by one of a fixed set of locks chosen by the identity of the instance, so
+    instances using different locks compute the property concurrently.
+
+    The cached value can be dropped with :obj:`invalidate`, e.g.
+    ``type(obj).data.invalidate(obj)``, so that the next lookup recomputes it.
+
     """
 
-    def __init__(self, method):
+    def __init__(self, method=None, *, ttl=None, stale_while_revalidate=False):
+        if stale_while_revalidate and ttl is None:
+            raise ValueError("stale_while_revalidate requires ttl to be set")
+
+        self.method = None
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        # reentrant, so that computing the property on one instance can access it
+        # on another instance sharing the same lock
+        self.locks = tuple(threading.RLock() for _ in range(_LOCK_STRIPES))
+        # ids of the instances being recomputed in the background
+        self.refreshing = set()
+        self.refreshing_lock = threading.Lock()
+
+        if method is not None:
+            self._set_method(method)
+
+    def _set_method(self, method):
         self.method = method
         self.name = f"_c_{method.__name__}"
-        self.lock = threading.Lock()
+
+    def __call__(self, method):
+        if self.method is not None:
+            raise TypeError(f"{type(self).__name__} is already bound to {self.method.__qualname__!r}")
+        self._set_method(method)
+        return self
+
+    def _lock(self, instance):
+        # id() values are aligned and evenly spaced, so they are scrambled
+        # before selecting a lock to spread instances over all the stripes
+        return self.locks[((id(instance) * _FIB_HASH) & _MASK_64) >> (64 - _LOCK_STRIPE_BITS)]
 
     def __get__(self, instance, owner=None):
         if instance is None:
@@ -43,14 +99,196 @@ class thread_safe_cached_property:
             msg = f"No '__dict__' is available on {type(instance).__name__!r}"
             raise TypeError(msg) from None
 
+        if self.ttl is not None:
+            return self._get_expiring(instance, cache)
+
         # avoid using hasattr/getattr as they may be overridden in the instance
         # and may have side effects (infinite recursion etc.)
         if self.name in cache:
             return cache[self.name]
 
-        with self.lock:
+        with self._lock(instance):
             if self.name in cache:
                 return cache[self.name]
             value = self.method(instance)
             cache[self.name] = value
             return value
+
+    def _get_expiring(self, instance, cache):
+        # with a ttl the cache holds a (value, expiry time) tuple
+        entry = cache.get(self.name)
+        if entry is not None:
+            if time.monotonic() < entry[1]:
+                return entry[0]
+            if self.stale_while_revalidate:
+                self._revalidate(instance, cache, entry)
+                return entry[0]
+
+        with self._lock(instance):
+            entry = cache.get(self.name)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
+            value = self.method(instance)
+            cache[self.name] = (value, time.monotonic() + self.ttl)
+            return value
+
+    def _revalidate(self, instance, cache, entry):
+        key = id(instance)
+        with self.refreshing_lock:
+            if key in self.refreshing:
+                return
+            self.refreshing.add(key)
+
+        def _run():
+            try:
+                with self._lock(instance):
+                    # skip if already recomputed or invalidated in the meantime
+                    if cache.get(self.name) is entry:
+                        value = self.method(instance)
+                        cache[self.name] = (value, time.monotonic() + self.ttl)
+            except Exception:
+                LOG.exception(f"Failed to recompute {self.method.__qualname__}, keeping the expired value")
+            finally:
+                with self.refreshing_lock:
+                    self.refreshing.discard(key)
+
+        threading.Thread(target=_run, name=f"revalidate-{self.name}", daemon=True).start()
+
+    def invalidate(self, instance):
+        """Drop the value cached on ``instance``, so that the next lookup recomputes it."""
+        with self._lock(instance):
+            instance.__dict__.pop(self.name, None)
+
+
+class thread_safe_slotted_cached_property(thread_safe_cached_property):
+    """A thread-safe cached property decorator for classes defining ``__slots__``.
+
+    It provides the same guarantees as :class:`thread_safe_cached_property` but does
+    not require the instance to have a ``__dict__``. The value is stored in the slot
+    named ``_c_<method name>`` when the class declares it, e.g.::
+
+        class Meta:
+            __slots__ = ("path", "_c_size")
+
+            @thread_safe_slotted_cached_property
+            def size(self):
+                return os.path.getsize(self.path)
+
+    Otherwise, the value is stored in a side table keyed weakly on the instance,
+    which requires the class to declare a ``__weakref__`` slot. The entry is dropped
+    when the instance is garbage-collected. Expiring values (``ttl``) are only
+    supported on instances with a ``__dict__``, a ``TypeError`` is raised on the
+    lookup otherwise.
+
+    Parameters
+    ----------
+    method: property method
+        The property method to be decorated. When used with arguments
+        (``@thread_safe_slotted_cached_property(ttl=...)``), *method* is ``None``.
+    ttl: float, optional
+        See :class:`thread_safe_cached_property`.
+    stale_while_revalidate: bool, optional
+        See :class:`thread_safe_cached_property`.
+
+    """
+
+    def __init__(self, method=None, *, ttl=None, stale_while_revalidate=False):
+        super().__init__(method, ttl=ttl, stale_while_revalidate=stale_while_revalidate)
+        self.slots = {}
+        self.table = {}
+        self.table_lock = threading.RLock()
+
+    def _slot(self, owner):
+        try:
+            return self.slots[owner]
+        except KeyError:
+            pass
+
+        slot = None
+        for cls in owner.__mro__:
+            attr = cls.__dict__.get(self.name)
+            if attr is not None:
+                if isinstance(attr, types.MemberDescriptorType):
+                    slot = attr
+                break
+        self.slots[owner] = slot
+        return slot
+
+    def _remove(self, key, ref):
+        with self.table_lock:
+            entry = self.table.get(key)
+            if entry is not None and entry[0] is ref:
+                del self.table[key]
+
+    def _get_from_table(self, instance):
+        entry = self.table.get(id(instance))
+        if entry is not None and entry[0]() is instance:
+            return entry
+        return None
+
+    def invalidate(self, instance):
+        """Drop the value cached on ``instance``, so that the next lookup recomputes it."""
+        if type(instance).__dictoffset__ != 0:
+            return super().invalidate(instance)
+
+        with self._lock(instance):
+            slot = self._slot(type(instance))
+            if slot is not None:
+                try:
+                    slot.__delete__(instance)
+                except AttributeError:
+                    pass
+            else:
+                with self.table_lock:
+                    entry = self._get_from_table(instance)
+                    if entry is not None:
+                        del self.table[id(instance)]
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        # avoid hasattr for the same reasons as in the base class
+        if type(instance).__dictoffset__ != 0:
+            return super().__get__(instance, owner)
+
+        if self.ttl is not None:
+            msg = f"ttl requires a '__dict__', which is not available on {type(instance).__name__!r}"
+            raise TypeError(msg)
+
+        slot = self._slot(type(instance))
+        if slot is not None:
+            try:
+                return slot.__get__(instance, owner)
+            except AttributeError:
+                pass
+
+            with self._lock(instance):
+                try:
+                    return slot.__get__(instance, owner)
+                except AttributeError:
+                    pass
+                value = self.method(instance)
+                slot.__set__(instance, value)
+                return value
+
+        entry = self._get_from_table(instance)
+        if entry is not None:
+            return entry[1]
+
+        with self._lock(instance):
+            entry = self._get_from_table(instance)
+            if entry is not None:
+                return entry[1]
+
+            key = id(instance)
+            try:
+                ref = weakref.ref(instance, partial(self._remove, key))
+            except TypeError:
+                msg = f"Neither a {self.name!r} slot nor '__weakref__' is available on {type(instance).__name__!r}"
+                raise TypeError(msg) from None
+
+            value = self.method(instance)
+            with self.table_lock:
+                self.table[key] = (ref, value)
+            return value
@@ -29,7 +29,124 @@ def _infer_output_count(func) -> int:
     return 1
 
 
+def _input_dtypes(args) -> list:
+    dtypes = []
+    for x in args:
+        if hasattr(x, "data_vars"):
+            dtypes.extend(v.dtype for v in x.data_vars.values())
+        elif hasattr(x, "dtype"):
+            dtypes.append(x.dtype)
+    return dtypes
+
+
+def _infer_output_dtypes(args, output_count: int) -> list:
+    """Infer the output dtypes from the promoted dtype of the inputs.
+
+    Floating point and complex inputs keep their precision, e.g. float32 inputs
+    produce float32 outputs. Other inputs (e.g. integers) produce float64 outputs.
+    """
+    import numpy as np
+
+    try:
+        dtype = np.result_type(*_input_dtypes(args))
+    except (TypeError, ValueError):
+        # no inputs with a dtype, or dtypes numpy cannot interpret
+        dtype = np.dtype(float)
+
+    if dtype.kind not in "fc":
+        dtype = np.dtype(float)
+    return [dtype] * output_count
+
+
+def _on_device(func, device, array_namespace):
+    """Wrap ``func`` to run on the given device and/or array namespace.
+
+    The array arguments are converted with :func:`earthkit.utils.array.convert` before
+    calling ``func`` and the outputs are converted back to the namespace and device of
+    the first array argument.
+    """
+    from functools import wraps
+
+    from earthkit.utils.array import array_namespace as array_namespace_func
+    from earthkit.utils.array import convert
+
+    def _is_array(x):
+        import array_api_compat
+
+        return array_api_compat.is_array_api_obj(x)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        source_xp = source_device = None
+        converted = []
+        for x in args:
+            if _is_array(x):
+                if source_xp is None:
+                    source_xp = array_namespace_func(x)
+                    source_device = source_xp.device(x)
+                x = convert(x, device=device, array_namespace=array_namespace)
+            converted.append(x)
+
+        result = func(*converted, **kwargs)
+        if source_xp is None:
+            return result
+
+        def _back(x):
+            if _is_array(x):
+                return convert(x, device=source_device, array_namespace=source_xp)
+            return x
+
+        if isinstance(result, tuple):
+            return tuple(_back(x) for x in result)
+        return _back(result)
+
+    return wrapper
+
+
 def xarray_ufunc(func, *args, **kwargs):
+    """Apply an array function to xarray objects.
+
+    Thin wrapper around :func:`xarray.apply_ufunc` with defaults suited to the
+    EarthKit array functions.
+
+    Parameters
+    ----------
+    func: callable
+        Function operating on arrays. The number of outputs is inferred from its
+        ``tuple`` return annotation.
+    *args: xarray.DataArray or xarray.Dataset
+        The inputs passed to ``func``.
+    **kwargs:
+        Keyword arguments passed to ``func``. The ``xarray_ufunc_kwargs`` keyword is
+        reserved for a dict of options to :func:`xarray.apply_ufunc`, which override
+        the defaults below.
+
+    Notes
+    -----
+    The defaults are:
+
+    - ``dask="parallelized"`` and ``keep_attrs=True``. When ``func`` is written against
+      the array API (e.g. using ``array_namespace``) it can work on dask arrays directly,
+      and passing ``dask="allowed"`` avoids wrapping every chunk in a separate call.
+    - ``output_dtypes`` is the promoted dtype of the inputs, so float32 inputs produce
+      float32 outputs. Non floating point inputs produce float64 outputs. Passing
+      ``output_dtypes=None`` lets dask infer the dtypes from a trial call on small arrays.
+    - With multiple outputs and all inputs having the same dims, the outputs have the
+      dims of the inputs and are computed chunk by chunk. When the dims differ, all the
+      dims are treated as core dims and the outputs have the dims of the first input.
+
+    The ``output_sizes`` and ``allow_rechunk`` hints can be given directly in
+    ``xarray_ufunc_kwargs`` and are forwarded in ``dask_gufunc_kwargs``.
+
+    ``xarray_ufunc_kwargs`` also accepts ``device`` and ``array_namespace`` to run ``func``
+    on another device or array backend, e.g. ``{"array_namespace": "torch", "device":
+    "cuda"}``. The array inputs (each chunk for dask backed inputs) are converted with
+    :func:`earthkit.utils.array.convert` before calling ``func``, and the outputs are
+    converted back to the namespace and device of the first array input. This requires
+    ``func`` to receive the actual arrays, i.e. combining them with ``dask="allowed"``
+    raises a :class:`ValueError`.
+
+    """
     import xarray as xr
 
     xarray_ufunc_kwargs = kwargs.pop("xarray_ufunc_kwargs", {})
@@ -39,17 +156,44 @@ def xarray_ufunc(func, *args, **kwargs):
     }
     merged.update(xarray_ufunc_kwargs)
 
+    device = merged.pop("device", None)
+    array_namespace = merged.pop("array_namespace", None)
+    if (device is not None or array_namespace is not None) and merged["dask"] == "allowed":
+        raise ValueError(
+            'xarray_ufunc: "device" and "array_namespace" cannot be used with dask="allowed", '
+            'as func would receive the dask arrays. Use dask="parallelized" instead'
+        )
+
+    dask_gufunc_kwargs = dict(merged.pop("dask_gufunc_kwargs", None) or {})
+    for key in ("output_sizes", "allow_rechunk"):
+        if key in merged:
+            dask_gufunc_kwargs[key] = merged.pop(key)
+    if dask_gufunc_kwargs:
+        merged["dask_gufunc_kwargs"] = dask_gufunc_kwargs
+
     if "output_dtypes" not in merged:
         output_count = _infer_output_count(func)
-        merged["output_dtypes"] = [float] * output_count
+        merged["output_dtypes"] = _infer_output_dtypes(args, output_count)
+    elif merged["output_dtypes"] is None:
+        output_count = _infer_output_count(func)
+    else:
+        output_count = len(merged["output_dtypes"])
 
-    if "output_core_dims" not in merged and len(merged["output_dtypes"]) > 1:
-        output_core_dims = [args[0].dims for _ in merged["output_dtypes"]]
-        merged["output_core_dims"] = output_core_dims
+    if output_count > 1:
+        input_dims = [getattr(x, "dims", ()) for x in args]
+        if (
+            "input_core_dims" not in merged
+            and "output_core_dims" not in merged
+            and all(dims == input_dims[0] for dims in input_dims)
+        ):
+            # no core dims needed, the outputs are broadcast like the inputs
+            merged["output_core_dims"] = [() for _ in range(output_count)]
+        else:
+            merged.setdefault("output_core_dims", [input_dims[0] for _ in range(output_count)])
+            merged.setdefault("input_core_dims", input_dims)
 
-    if "input_core_dims" not in merged and len(merged["output_dtypes"]) > 1:
-        input_core_dims = [x.dims for x in args]
-        merged["input_core_dims"] = input_core_dims
+    if device is not None or array_namespace is not None:
+        func = _on_device(func, device, array_namespace)
 
     return xr.apply_ufunc(
         func,
@@ -57,3 +201,67 @@ def xarray_ufunc(func, *args, **kwargs):
         kwargs=kwargs,
         **merged,
     )
+
+
+def _compose(funcs):
+    import inspect
+
+    first, *rest = funcs
+
+    def pipeline(*args, **kwargs):
+        result = first(*args, **kwargs)
+        for func in rest:
+            result = func(*result) if isinstance(result, tuple) else func(result)
+        return result
+
+    pipeline.__name__ = "_".join(["pipeline"] + [getattr(f, "__name__", "func") for f in funcs])
+    pipeline.__qualname__ = pipeline.__name__
+
+    # the number of outputs is determined by the last function
+    try:
+        pipeline.__annotations__ = {"return": inspect.signature(funcs[-1]).return_annotation}
+    except (ValueError, TypeError):
+        pass
+    return pipeline
+
+
+def xarray_pipeline(funcs):
+    """Compose array functions into a single :func:`xarray_ufunc` call.
+
+    Applying the returned function is equivalent to chaining :func:`xarray_ufunc` calls
+    for each function in ``funcs``, but :func:`xarray.apply_ufunc` is called only once.
+    On dask backed inputs this creates a single blockwise layer and no intermediate
+    DataArrays.
+
+    Parameters
+    ----------
+    funcs: list of callable
+        Array functions applied in order. The output of a function is passed to the next
+        one, a ``tuple`` output being unpacked into positional arguments. The number of
+        outputs of the pipeline is inferred from the return annotation of the last function.
+
+    Returns
+    -------
+    callable
+        Function taking the same arguments as :func:`xarray_ufunc` (without ``func``).
+        Its keyword arguments, except ``xarray_ufunc_kwargs``, are passed to the first
+        function; use :func:`functools.partial` to pass arguments to the others.
+
+    Examples
+    --------
+    >>> pipeline = xarray_pipeline([to_kelvin, saturation_vapour_pressure])
+    >>> es = pipeline(t2m_dataarray)
+
+    """
+    funcs = list(funcs)
+    if not funcs:
+        raise ValueError("xarray_pipeline requires at least one function")
+
+    composed = _compose(funcs)
+
+    def apply(*args, **kwargs):
+        return xarray_ufunc(composed, *args, **kwargs)
+
+    apply.__name__ = composed.__name__
+    apply.__qualname__ = composed.__name__
+    return apply
@@ -0,0 +1,286 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+"""Opt-in counters and timers for the hot paths of earthkit.utils.
+
+Instrumentation is disabled by default. The instrumented functions only check the
+module-level :obj:`ENABLED` flag, so the cost is negligible when it is disabled.
+Collection is enabled by registering at least one sink, usually with the
+:func:`instrument` context manager, which collects the events of the current thread::
+
+    from earthkit.utils.instrumentation import MemorySink, instrument
+
+    sink = MemorySink()
+    with instrument(sink):
+        run_pipeline()
+    print(sink.summary())
+
+Sinks registered with :func:`add_sink` collect the events of all the threads.
+
+The following events are emitted:
+
+- ``array_namespace``: resolution of an array namespace (``namespace``)
+- ``convert``: array conversion (``source``, ``target``, ``device``, ``nbytes``,
+  ``copy``)
+- ``transfer``: device to host copy, see :mod:`earthkit.utils.array.transfer`
+  (``source``, ``target``, ``device``, ``nbytes``, ``implicit``)
+- ``units.from_any``: parsing of units (``cache_hit``)
+- ``units.pint_fallback``: units not understood by pint (``units``)
+- ``units.convert_array``: unit conversion of an array (``source``, ``target``)
+- ``dispatch``: routing of a call by :func:`earthkit.utils.decorators.dispatch`
+  (``function``, ``dispatcher``)
+- ``format_handler``: call of a function decorated with
+  :func:`earthkit.utils.decorators.format_handler` (``function``, ``transformed``)
+"""
+
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict
+
+LOG = logging.getLogger(__name__)
+
+# True when a sink is registered or an instrument() block is active in any thread,
+# checked by the instrumented code
+ENABLED = False
+
+# the sinks registered with add_sink(), for all the threads
+_SINKS = []
+# the number of active instrument() blocks in all the threads
+_ACTIVE = 0
+_LOCK = threading.Lock()
+
+# the sinks of the instrument() blocks of the current context
+_SCOPED = contextvars.ContextVar("earthkit_utils_instrumentation_sinks", default=())
+
+
+class Event:
+    """An instrumentation event.
+
+    Parameters
+    ----------
+    name: str
+        The name of the event.
+    duration: float, optional
+        The duration in seconds, None for counter-only events.
+    attributes: dict, optional
+        Additional information about the event.
+    """
+
+    __slots__ = ("name", "duration", "attributes")
+
+    def __init__(self, name, duration=None, attributes=None):
+        self.name = name
+        self.duration = duration
+        self.attributes = attributes if attributes is not None else {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name!r}, duration={self.duration}, attributes={self.attributes})"
+
+
+class LoggingSink:
+    """Write each event to a logger.
+
+    Parameters
+    ----------
+    logger: logging.Logger, optional
+        The logger to use. Defaults to the logger of this module.
+    level: int, optional
+        The logging level of the messages.
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        self.logger = logger if logger is not None else LOG
+        self.level = level
+
+    def emit(self, event):
+        if event.duration is None:
+            self.logger.log(self.level, "%s %s", event.name, event.attributes)
+        else:
+            self.logger.log(self.level, "%s %.6fs %s", event.name, event.duration, event.attributes)
+
+
+class CallbackSink:
+    """Pass each event to a callable, e.g. to forward it to OpenTelemetry.
+
+    Parameters
+    ----------
+    callback: callable
+        Called as ``callback(name, duration, attributes)``.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def emit(self, event):
+        self.callback(event.name, event.duration, event.attributes)
+
+
+class MemorySink:
+    """Aggregate the events in memory.
+
+    For each key the number of events, the total duration and the sum of the numeric
+    attributes (e.g. ``nbytes``) are accumulated.
+
+    Parameters
+    ----------
+    key: callable, optional
+        Computes the aggregation key of an event. Defaults to the event name. For
+        example ``lambda e: (e.name, e.attributes.get("source"), e.attributes.get("target"))``
+        aggregates the conversions by pair of namespaces.
+    keep_events: bool, optional
+        If True, the events are also stored in :attr:`events`.
+    """
+
+    def __init__(self, key=None, keep_events=False):
+        self.key = key
+        self.keep_events = keep_events
+        self.events = []
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: defaultdict(float))
+
+    def emit(self, event):
+        key = event.name if self.key is None else self.key(event)
+        with self._lock:
+            stats = self._stats[key]
+            stats["count"] += 1
+            if event.duration is not None:
+                stats["time"] += event.duration
+            for name, value in event.attributes.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    stats[name] += value
+                elif isinstance(value, bool):
+                    # e.g. the number of cache hits or copies
+                    stats[name] += int(value)
+            if self.keep_events:
+                self.events.append(event)
+
+    def count(self, key):
+        """Return the number of events aggregated under ``key``."""
+        with self._lock:
+            return int(self._stats[key]["count"]) if key in self._stats else 0
+
+    def summary(self):
+        """Return the aggregated statistics as a dict keyed by the aggregation key."""
+        with self._lock:
+            return {k: {n: (int(v) if n == "count" else v) for n, v in s.items()} for k, s in self._stats.items()}
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+            self.events.clear()
+
+
+def _update(increment=0):
+    global ENABLED, _ACTIVE
+    _ACTIVE += increment
+    ENABLED = bool(_SINKS) or _ACTIVE > 0
+
+
+def _as_sink(sink):
+    if not hasattr(sink, "emit"):
+        if not callable(sink):
+            raise TypeError(f"Invalid sink {sink!r}, it must have an emit() method or be callable")
+        sink = CallbackSink(sink)
+    return sink
+
+
+def add_sink(sink):
+    """Register a sink for all the threads and enable the instrumentation.
+
+    ``sink`` is an object with an ``emit(event)`` method, or a callable that is
+    wrapped into a :class:`CallbackSink`. Returns the registered sink.
+    """
+    sink = _as_sink(sink)
+    with _LOCK:
+        _SINKS.append(sink)
+        _update()
+    return sink
+
+
+def remove_sink(sink):
+    """Unregister a sink. The instrumentation is disabled when no sink is left."""
+    with _LOCK:
+        try:
+            _SINKS.remove(sink)
+        except ValueError:
+            pass
+        _update()
+
+
+@contextlib.contextmanager
+def instrument(*sinks):
+    """Collect the events emitted inside the block with the given sinks.
+
+    When no sink is given a :class:`MemorySink` is created. The sinks are yielded,
+    as a single object when there is only one. A sink can also be a callable, see
+    :func:`add_sink`.
+
+    Notes
+    -----
+    The sinks are scoped to the current thread (more precisely the current
+    :mod:`contextvars` context): the events emitted by other threads are not
+    collected. Threads started with a copy of the context, like the workers of
+    :func:`earthkit.utils.array.convert_tiled`, are collected. Use :func:`add_sink`
+    to collect the events of all the threads.
+    """
+    if not sinks:
+        sinks = (MemorySink(),)
+    sinks = tuple(_as_sink(s) for s in sinks)
+    token = _SCOPED.set(_SCOPED.get() + sinks)
+    with _LOCK:
+        _update(1)
+    try:
+        yield sinks[0] if len(sinks) == 1 else sinks
+    finally:
+        _SCOPED.reset(token)
+        with _LOCK:
+            _update(-1)
+
+
+def record(name, duration=None, **attributes):
+    """Emit an event to the sinks registered for all the threads and for the current context.
+
+    A failing sink is logged and does not affect the instrumented code.
+    """
+    if not ENABLED:
+        return
+    event = Event(name, duration, attributes)
+    for sink in tuple(_SINKS) + _SCOPED.get():
+        try:
+            sink.emit(event)
+        except Exception:
+            LOG.exception(f"Instrumentation sink {sink!r} failed")
+
+
+@contextlib.contextmanager
+def timer(name, **attributes):
+    """Time the block and emit an event with its duration.
+
+    The attributes are yielded as a dict, so they can be completed in the block.
+    """
+    start = time.perf_counter()
+    try:
+        yield attributes
+    finally:
+        record(name, time.perf_counter() - start, **attributes)
+
+
+__all__ = [
+    "CallbackSink",
+    "Event",
+    "LoggingSink",
+    "MemorySink",
+    "add_sink",
+    "instrument",
+    "record",
+    "remove_sink",
+    "timer",
+]
@@ -6,17 +6,38 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
-from earthkit.utils.units.convert import (
-    UnitLike,
-    UnitSpec,
-    are_compatible,
-    are_equal,
-    convert_array,
-    convert_dataarray,
-    convert_dataset,
-    convert_units,
+import typing as T
+
+from earthkit.utils._lazy import lazy_attributes
+
+if T.TYPE_CHECKING:
+    from earthkit.utils.units.convert import (
+        UnitLike,
+        UnitSpec,
+        are_compatible,
+        are_equal,
+        convert_array,
+        convert_dataarray,
+        convert_dataset,
+        convert_units,
+    )
+    from earthkit.utils.units.units import Units
+
+# pint is only imported when one of these names is accessed
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "UnitLike": "convert",
+        "UnitSpec": "convert",
+        "are_compatible": "convert",
+        "are_equal": "convert",
+        "convert_array": "convert",
+        "convert_dataarray": "convert",
+        "convert_dataset": "convert",
+        "convert_units": "convert",
+        "Units": "units",
+    },
 )
-from earthkit.utils.units.units import Units
 
 __all__ = [
     "UnitLike",
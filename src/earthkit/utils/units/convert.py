@@ -12,7 +12,9 @@ from typing import TYPE_CHECKING, Any, TypeAlias, Union
 
 import pint
 
-from .units import Q_, StrUnits, Units
+from earthkit.utils import instrumentation as _instrumentation
+
+from .units import StrUnits, Units, _registry
 
 LOG = logging.getLogger(__name__)
 
@@ -91,7 +93,10 @@ def convert_array(
         return data
 
     try:
-        return Q_(data, source_pint).to(target_pint).magnitude
+        if _instrumentation.ENABLED:
+            with _instrumentation.timer("units.convert_array", source=str(source_pint), target=str(target_pint)):
+                return _registry().Quantity(data, source_pint).to(target_pint).magnitude
+        return _registry().Quantity(data, source_pint).to(target_pint).magnitude
     except pint.errors.DimensionalityError:
         LOG.warning("Cannot convert incompatible units: %s -> %s", source_units, target_units)
         return data
@@ -179,7 +184,7 @@ def are_compatible(unit_1: UnitLike | None, unit_2: UnitLike | None) -> bool:
     unit_2_pint = unit_2_parsed.to_pint()
 
     try:
-        Q_(1, unit_1_pint).to(unit_2_pint)
+        _registry().Quantity(1, unit_1_pint).to(unit_2_pint)
     except pint.errors.DimensionalityError:
         return False
     return True
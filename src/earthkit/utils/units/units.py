@@ -7,21 +7,44 @@
 # nor does it submit to any jurisdiction.
 
 
+import functools
 import re
+import threading
 from abc import ABCMeta, abstractmethod
 from typing import Any
 
 import pint
 from pint import UnitRegistry
 
-ureg: UnitRegistry = UnitRegistry()
-Q_: type[pint.Quantity] = ureg.Quantity
+from earthkit.utils import instrumentation as _instrumentation
+
+_REGISTRY = None
+_REGISTRY_LOCK = threading.Lock()
 
 UNITS_PATTERN_1 = re.compile(r"(?<=[a-zA-Z0-9])\s+(?=[a-zA-Z])")
 UNITS_PATTERN_2 = re.compile(r"([a-zA-Z])(-?\d+)")
 UNIT_STR_ALIASES: dict[str, str] = {"(0 - 1)": "percent"}
 
 
+def _registry() -> UnitRegistry:
+    """Return the pint unit registry, created the first time it is needed."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = UnitRegistry()
+    return _REGISTRY
+
+
+def __getattr__(name):
+    # creating the registry is slow, so ureg and Q_ are only created on first access
+    if name == "ureg":
+        return _registry()
+    if name == "Q_":
+        return _registry().Quantity
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _prepare_str(units: str | None = None) -> str:
     """Convert a unit string to a Pint-compatible string.
 
@@ -88,13 +111,21 @@ class Units(metaclass=ABCMeta):
 
     @staticmethod
     def from_any(units):
+        """Create units from a string, a pint unit or units.
+
+        The strings are parsed once and the result is cached, so repeated calls with
+        the same string return the same (immutable) object.
+        """
         if isinstance(units, str) or units is None:
-            units = _prepare_str(units)
-            # TODO: consider the range of exceptions that we accept here.
-            try:
-                return PintUnits(ureg(units).units)
-            except (pint.errors.UndefinedUnitError, AssertionError, AttributeError):
-                return StrUnits(units)
+            if not _instrumentation.ENABLED:
+                return _from_str(units)
+            misses = _from_str.cache_info().misses
+            result = _from_str(units)
+            _instrumentation.record("units.from_any", cache_hit=_from_str.cache_info().misses == misses)
+            if isinstance(result, StrUnits):
+                # recorded on every call, not only when the string is parsed
+                _instrumentation.record("units.pint_fallback", units=str(result))
+            return result
         elif isinstance(units, pint.Unit):
             return PintUnits(units)
         elif isinstance(units, Units):
@@ -104,6 +135,17 @@ class Units(metaclass=ABCMeta):
             raise ValueError(f"Unsupported type for units: {type(units)}")
 
 
+@functools.lru_cache(maxsize=1024)
+def _from_str(units):
+    # parsing with pint is slow and the same units are parsed repeatedly
+    units = _prepare_str(units)
+    # TODO: consider the range of exceptions that we accept here.
+    try:
+        return PintUnits(_registry()(units).units)
+    except (pint.errors.UndefinedUnitError, AssertionError, AttributeError):
+        return StrUnits(units)
+
+
 class StrUnits(Units):
     def __init__(self, units: str) -> None:
         self._units = units
@@ -158,7 +200,7 @@ class PintUnits(Units):
 
     @staticmethod
     def _to_pint(units: str) -> pint.Unit:
-        return ureg(units).units
+        return _registry()(units).units
 
     def __getstate__(self) -> dict:
         return {"units": str(self)}
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import types
+
+import array_api_compat
+import pytest
+
+from earthkit.utils.array import Backend, Capabilities, array_namespace
+from earthkit.utils.array.array_namespace import _get_array_name
+from earthkit.utils.array.backends import BackendRegistry
+from earthkit.utils.array.converter import FromUnknownConverter
+from earthkit.utils.array.namespace import _NUMPY_NAMESPACE, UnknownPatchedNamespace
+
+
+def _module(name):
+    return types.SimpleNamespace(__name__=name)
+
+
+@pytest.mark.parametrize(
+    "module_name,expected",
+    [
+        ("numpy", "numpy"),
+        ("array_api_compat.numpy", "numpy"),
+        ("array_api_compat.torch", "torch"),
+        ("array_api_compat.cupy", "cupy"),
+        ("jax.numpy", "jax"),
+        ("torch", "torch"),
+        ("cupy.random", "cupy"),
+        ("array_api_compat.dask.array", "dask"),
+        # previously misclassified by substring matching
+        ("array_api_strict", "array_api_strict"),
+        ("mynumpy", "mynumpy"),
+    ],
+)
+def test_array_backends_get_array_name(module_name, expected):
+    assert _get_array_name(_module(module_name)) == expected
+
+
+def test_array_backends_patched_namespace_name():
+    assert _get_array_name(_NUMPY_NAMESPACE) == "numpy"
+    assert _get_array_name(UnknownPatchedNamespace(array_api_compat.numpy)) == "numpy"
+
+
+def test_array_backends_capabilities():
+    assert _NUMPY_NAMESPACE.capabilities.percentile
+    assert _NUMPY_NAMESPACE.capabilities.inplace
+    assert UnknownPatchedNamespace(_module("other")).capabilities == Capabilities()
+    assert Capabilities(dlpack=True) != Capabilities()
+
+
+class _OtherNamespace(UnknownPatchedNamespace):
+    capabilities = Capabilities(percentile=True)
+
+
+def test_array_backends_register():
+    registry = BackendRegistry()
+    registry._entry_points_loaded = True
+
+    backend = Backend("other", ["other_array"], _OtherNamespace)
+    registry.register(backend, aliases=["other2"])
+
+    assert registry.get("other") is backend
+    assert registry.get("other2") is backend
+    assert registry.from_module_name("other_array.linalg") is backend
+    assert registry.from_module_name("other_arrays") is None
+    assert registry.capabilities(_module("other_array")) == Capabilities(percentile=True)
+    assert backend.converter is FromUnknownConverter
+
+    # the namespace is created on first use with the namespace module
+    xp = _module("other_array")
+    ns = backend.namespace(xp)
+    assert isinstance(ns, _OtherNamespace)
+    assert ns.xp is xp
+    assert backend.namespace() is ns
+
+
+def test_array_backends_entry_points(monkeypatch):
+    import importlib.metadata
+
+    backend = Backend("from_entry_point", ["ep_array"], _OtherNamespace)
+
+    class _EntryPoint:
+        name = "from_entry_point"
+
+        def load(self):
+            return backend
+
+    class _BrokenEntryPoint:
+        name = "broken"
+
+        def load(self):
+            raise ImportError("broken")
+
+    def _entry_points(group):
+        assert group == "earthkit.utils.array.backends"
+        return [_BrokenEntryPoint(), _EntryPoint()]
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", _entry_points)
+
+    registry = BackendRegistry()
+    assert registry.from_module_name("ep_array") is backend
+    assert registry.get("from_entry_point") is backend
+
+
+def test_array_backends_unknown_namespace_fast_path():
+    import numpy as np
+
+    xp = UnknownPatchedNamespace(array_api_compat.numpy, capabilities=Capabilities(percentile=True, histogram=True))
+    a = np.arange(10.0)
+    assert xp.allclose(xp.percentile(a, 30), np.percentile(a, 30))
+    assert xp.allclose(xp.quantile(a, 0.3), np.quantile(a, 0.3))
+
+    h, _ = xp.histogramdd(np.stack([a, a]).T, bins=3)
+    assert h.sum() == 10
+
+
+def test_array_backends_unknown_namespace_reused():
+    xps = pytest.importorskip("array_api_strict")
+
+    x = xps.ones(4)
+    xp = array_namespace(x)
+    assert isinstance(xp, UnknownPatchedNamespace)
+    assert _get_array_name(xp) == "array_api_strict"
+    assert array_namespace(x) is xp
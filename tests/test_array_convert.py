@@ -12,8 +12,14 @@
 import pytest
 
 from earthkit.utils.array import array_namespace, convert
-from earthkit.utils.array.namespace import _CUPY_NAMESPACE, _JAX_NAMESPACE, _NUMPY_NAMESPACE, _TORCH_NAMESPACE
-from earthkit.utils.array.testing.testing import NO_CUPY, NO_JAX, NO_TORCH
+from earthkit.utils.array.namespace import (
+    _CUPY_NAMESPACE,
+    _DASK_NAMESPACE,
+    _JAX_NAMESPACE,
+    _NUMPY_NAMESPACE,
+    _TORCH_NAMESPACE,
+)
+from earthkit.utils.array.testing.testing import NO_CUPY, NO_DASK, NO_JAX, NO_TORCH
 
 # NUMPY
 
@@ -210,3 +216,251 @@ def test_array_convert_jax_to_jax():
         res = convert(x, array_namespace="jax", device=tpu_device)
         assert array_namespace(res) is _JAX_NAMESPACE
         assert xp.device(res) == tpu_device
+
+
+# DASK
+
+
+@pytest.mark.skipif(NO_DASK, reason="No dask installed")
+def test_array_convert_dask_to_numpy():
+    import dask.array as da
+
+    x = da.arange(10.0, chunks=3)
+    _to_numpy_checker(x)
+
+    res = convert(x, array_namespace="numpy")
+    assert _NUMPY_NAMESPACE.allclose(res, _NUMPY_NAMESPACE.arange(10.0))
+
+
+@pytest.mark.skipif(NO_DASK, reason="No dask installed")
+def test_array_convert_numpy_to_dask():
+    xp = _NUMPY_NAMESPACE
+    x = xp.arange(10.0)
+
+    res = convert(x, array_namespace="dask")
+    assert array_namespace(res) is _DASK_NAMESPACE
+    assert xp.allclose(res.compute(), x)
+
+    from earthkit.utils.array.converter import FromNumpyConverter
+
+    res = FromNumpyConverter(_DASK_NAMESPACE).to(x, "dask", chunks=4)
+    assert res.chunks == ((4, 4, 2),)
+
+
+@pytest.mark.skipif(NO_DASK, reason="No dask installed")
+def test_array_convert_dask_to_dask():
+    import dask.array as da
+
+    from earthkit.utils.array.converter import FromDaskConverter
+
+    x = da.arange(10.0, chunks=3)
+    res = convert(x, array_namespace="dask")
+    assert res is x
+    res = convert(x, array_namespace="dask", device="cpu")
+    assert res.chunks == x.chunks
+
+    res = FromDaskConverter(_DASK_NAMESPACE).to(x, "dask", chunks=5)
+    assert res.chunks == ((5, 5),)
+
+
+@pytest.mark.skipif(NO_DASK, reason="No dask installed")
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_array_convert_dask_to_torch():
+    import dask.array as da
+
+    x = da.arange(10.0, chunks=3)
+    _to_torch_checker(x)
+
+
+# MEMORY-MAPPED NUMPY
+
+
+def _sparse_memmap(path, shape, mode, dtype="float32"):
+    import numpy as np
+
+    # the file is sparse, so it does not use disk space until written
+    x = np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+    x[0, :4] = [1.0, 2.0, 3.0, 4.0]
+    x[-1, -1] = 5.0
+    x.flush()
+    del x
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_array_convert_memmap_readonly_to_torch(tmp_path, monkeypatch):
+    import torch
+
+    from earthkit.utils.array.converter import _memmap
+
+    # 256 MB, in non-native byte order so it cannot be wrapped
+    x = _sparse_memmap(tmp_path / "data.bin", (8192, 8192), "r", dtype=">f4")
+    assert _memmap.is_memmap(x)
+    assert _memmap.is_memmap(x[10:20])
+
+    tiles = []
+    iter_tiles = _memmap.iter_tiles
+
+    def _iter_tiles(array, tile_bytes=None):
+        for index, tile in iter_tiles(array, tile_bytes):
+            tiles.append(tile.nbytes)
+            yield index, tile
+
+    monkeypatch.setattr(_memmap, "MEMMAP_TILE_BYTES", 16 * 1024**2)
+    monkeypatch.setattr("earthkit.utils.array.converter.numpy.iter_tiles", _iter_tiles)
+
+    res = convert(x, array_namespace="torch", device="cpu")
+    assert array_namespace(res) is _TORCH_NAMESPACE
+    assert res.shape == (8192, 8192)
+    assert res.dtype == torch.float32
+    assert res[0, :4].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert res[-1, -1].item() == 5.0
+    assert float(res.sum()) == 15.0
+
+    # the host copies are bounded by the tile size
+    assert len(tiles) == 16
+    assert max(tiles) == 16 * 1024**2
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_array_convert_memmap_writable_to_torch(tmp_path):
+    x = _sparse_memmap(tmp_path / "data.bin", (1024, 1024), "r+")
+
+    # no copy is made on cpu
+    res = convert(x, array_namespace="torch")
+    assert res.data_ptr() == x.ctypes.data
+    res = convert(x, array_namespace="torch", device="cpu")
+    assert res.data_ptr() == x.ctypes.data
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_array_convert_memmap_readonly_to_torch_cpu(tmp_path, monkeypatch):
+    import numpy as np
+
+    def _iter_tiles(array, tile_bytes=None):
+        raise AssertionError("read-only memory-mapped array copied to cpu")
+
+    monkeypatch.setattr("earthkit.utils.array.converter.numpy.iter_tiles", _iter_tiles)
+
+    path = tmp_path / "data.npy"
+    np.save(path, np.arange(20.0).reshape(4, 5))
+    x = np.load(path, mmap_mode="r")
+
+    for source in (x, x[1:3, 1::2]):
+        res = convert(source, array_namespace="torch", device="cpu")
+        assert res.tolist() == source.tolist()
+
+        # the writes are private to the tensor, the file is not modified
+        res[0, 0] = -1.0
+        assert np.array_equal(np.load(path), np.arange(20.0).reshape(4, 5))
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_array_convert_non_native_to_torch():
+    import numpy as np
+
+    x = np.arange(6, dtype=">f8").reshape(2, 3)
+    x.flags.writeable = False
+    res = convert(x, array_namespace="torch")
+    assert res.tolist() == x.tolist()
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_array_convert_read_only_0d_to_torch():
+    import numpy as np
+    import torch
+
+    res = convert(np.broadcast_to(np.array(1.5), ()), array_namespace="torch")
+    assert res.shape == ()
+    assert res.dtype == torch.float64
+    assert res.item() == 1.5
+
+    res = convert(np.array(2.5, dtype=">f4"), array_namespace="torch", device="cpu")
+    assert res.shape == ()
+    assert res.dtype == torch.float32
+    assert res.item() == 2.5
+
+
+# TILED
+
+
+def test_array_convert_tiled_numpy():
+    from earthkit.utils.array import convert_tiled
+
+    xp = _NUMPY_NAMESPACE
+    x = xp.reshape(xp.arange(35.0), (5, 7))
+
+    shapes = []
+
+    def _fn(tile):
+        shapes.append(tuple(tile.shape))
+        return tile * 2
+
+    res = convert_tiled(x, (2, 3), _fn, array_namespace="numpy", device="cpu")
+    assert array_namespace(res) is _NUMPY_NAMESPACE
+    assert xp.all(res == x * 2)
+    assert len(shapes) == 9
+    assert max(shapes) == (2, 3)
+
+    # trailing dimensions are not tiled
+    res = convert_tiled(x, (2,), array_namespace="numpy")
+    assert xp.all(res == x)
+
+    # the result dtype follows fn
+    res = convert_tiled(x, (3, 3), lambda t: t > 10, collect="device")
+    assert res.dtype == xp.bool
+    assert xp.all(res == (x > 10))
+
+
+def test_array_convert_tiled_invalid():
+    from earthkit.utils.array import convert_tiled
+
+    x = _NUMPY_NAMESPACE.zeros((4, 4))
+    with pytest.raises(ValueError):
+        convert_tiled(x, (2, 2, 2))
+    with pytest.raises(ValueError):
+        convert_tiled(x, (0, 2))
+    with pytest.raises(ValueError):
+        convert_tiled(x, (2, 2), collect="nowhere")
+
+
+@pytest.mark.parametrize("collect", ["host", "device"])
+def test_array_convert_tiled_no_inplace(monkeypatch, collect):
+    from earthkit.utils.array import Capabilities, convert_tiled
+
+    xp = _NUMPY_NAMESPACE
+    x = xp.reshape(xp.arange(35.0), (5, 7))
+
+    # the result is assembled by concatenation, like for a jax array
+    def _empty(*args, **kwargs):
+        raise AssertionError("in-place assembly of the tiles")
+
+    monkeypatch.setattr(xp, "capabilities", Capabilities())
+    monkeypatch.setattr(xp, "empty", _empty, raising=False)
+
+    res = convert_tiled(x, (2, 3), lambda t: t * 2, collect=collect)
+    assert res.shape == (5, 7)
+    assert xp.all(res == x * 2)
+
+    res = convert_tiled(x, (2,), collect=collect)
+    assert xp.all(res == x)
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_array_convert_tiled_numpy_to_torch():
+    from earthkit.utils.array import convert_tiled
+
+    xp = _NUMPY_NAMESPACE
+    x = xp.reshape(xp.arange(24.0), (4, 6))
+
+    def _fn(tile):
+        assert array_namespace(tile) is _TORCH_NAMESPACE
+        return tile + 1
+
+    res = convert_tiled(x, (3, 4), _fn, array_namespace="torch")
+    assert array_namespace(res) is _NUMPY_NAMESPACE
+    assert xp.all(res == x + 1)
+
+    res = convert_tiled(x, (3, 4), _fn, array_namespace="torch", collect="device")
+    assert array_namespace(res) is _TORCH_NAMESPACE
+    assert res.tolist() == (x + 1).tolist()
@@ -9,18 +9,21 @@
 # nor does it submit to any jurisdiction.
 #
 
+import warnings
+
 import array_api_compat
 import pytest
 
 from earthkit.utils.array import array_namespace
 from earthkit.utils.array.namespace import (
     _CUPY_NAMESPACE,
+    _DASK_NAMESPACE,
     _JAX_NAMESPACE,
     _NUMPY_NAMESPACE,
     _TORCH_NAMESPACE,
     UnknownPatchedNamespace,
 )
-from earthkit.utils.array.testing.testing import NO_CUPY, NO_JAX, NO_TORCH
+from earthkit.utils.array.testing.testing import NAMESPACE_DEVICES, NO_CUPY, NO_DASK, NO_JAX, NO_TORCH
 
 
 def test_array_namespace_numpy():
@@ -238,6 +241,541 @@ def test_patched_namespace_jax():
     # TODO: test histogramdd and histogram2d
 
 
+@pytest.mark.skipif(NO_DASK, reason="No dask installed")
+def test_array_namespace_dask():
+    xp = array_namespace("dask")
+    assert xp._earthkit_array_namespace_name == "dask"
+    assert xp is _DASK_NAMESPACE
+
+    import dask.array as da
+
+    assert array_namespace(da) is _DASK_NAMESPACE
+
+    v = da.ones(10, chunks=3)
+    assert array_namespace(v) is _DASK_NAMESPACE
+    assert xp.allclose(xp.mean(v), 1.0)
+
+
+@pytest.mark.skipif(NO_DASK, reason="No dask installed")
+def test_patched_namespace_dask():
+    import dask.array as da
+    import numpy as np
+
+    xp = array_namespace("dask")
+
+    arr = da.asarray([1.0, 2.0, 3.0], chunks=2)
+
+    # test polyval
+    res = np.asarray([6.0, 17.0, 34.0])
+    assert np.allclose(xp.polyval(arr, arr).compute(), res)
+
+    # test percentile and quantile
+    # exact along an axis, approximate on the flattened array
+    assert np.allclose(xp.percentile(arr, 50, axis=0).compute(), 2)
+    assert np.allclose(xp.quantile(arr, 0.5, axis=0).compute(), 2)
+    assert np.allclose(xp.percentile(arr.rechunk(-1), 50).compute(), 2)
+
+    data = np.random.default_rng(0).random((6, 20))
+    a = da.from_array(data, chunks=(2, 5))
+    for axis in (0, 1):
+        r = xp.percentile(a, 30, axis=axis)
+        assert r.shape == np.percentile(data, 30, axis=axis).shape
+        assert np.allclose(r.compute(), np.percentile(data, 30, axis=axis))
+
+        q = np.asarray([10, 50, 90])
+        r = xp.percentile(a, q, axis=axis)
+        assert np.allclose(r.compute(), np.percentile(data, q, axis=axis))
+
+    # chunk-parallel approximation of the flattened percentiles
+    data_flat = np.random.default_rng(2).random(100000)
+    r = xp.percentile(da.from_array(data_flat, chunks=10000), [10, 90])
+    assert np.allclose(r.compute(), np.percentile(data_flat, [10, 90]), atol=0.02)
+
+    # test nanpercentile and nanquantile
+    data_nan = np.where(data > 0.8, np.nan, data)
+    for axis in [None, 0, 1]:
+        r = xp.nanpercentile(da.from_array(data_nan, chunks=(2, 3)), [10, 90], axis=axis)
+        assert np.allclose(r.compute(), np.nanpercentile(data_nan, [10, 90], axis=axis))
+        r = xp.nanquantile(da.from_array(data_nan, chunks=(2, 3)), 0.5, axis=axis)
+        assert np.allclose(r.compute(), np.nanquantile(data_nan, 0.5, axis=axis))
+
+    # test histogramdd and histogram2d
+    sample = np.random.default_rng(1).random((1000, 2))
+    H, edges = xp.histogramdd(da.from_array(sample, chunks=(100, 1)), bins=[4, 5])
+    H_ref, edges_ref = np.histogramdd(sample, bins=[4, 5])
+    assert isinstance(H, da.Array)
+    assert np.allclose(H.compute(), H_ref)
+    for e, e_ref in zip(edges, edges_ref):
+        assert np.allclose(np.asarray(e), e_ref)
+
+    H, _, _ = xp.histogram2d(da.from_array(sample[:, 0], chunks=100), da.from_array(sample[:, 1], chunks=100), bins=3)
+    H_ref, _, _ = np.histogram2d(sample[:, 0], sample[:, 1], bins=3)
+    assert np.allclose(H.compute(), H_ref)
+
+    # test weights
+    w = np.random.default_rng(3).random(1000)
+    H, _ = xp.histogramdd(da.from_array(sample, chunks=(100, 1)), bins=[4, 5], weights=da.from_array(w, chunks=300))
+    assert np.allclose(H.compute(), np.histogramdd(sample, bins=[4, 5], weights=w)[0])
+    weights = np.random.default_rng(4).random(data.shape)
+    for axis in [None, 1]:
+        r = xp.quantile(da.from_array(data, chunks=(2, 3)), [0.2, 0.7], axis=axis, weights=weights)
+        ref = np.quantile(data, [0.2, 0.7], axis=axis, weights=weights, method="inverted_cdf")
+        assert np.allclose(r.compute(), ref)
+
+    assert xp.allclose(xp.rad2deg(arr), np.rad2deg([1.0, 2.0, 3.0]))
+    assert xp.allclose(xp.deg2rad(arr), np.deg2rad([1.0, 2.0, 3.0]))
+
+
+def _stat_namespaces():
+    return NAMESPACE_DEVICES + [(UnknownPatchedNamespace(array_api_compat.numpy), "cpu")]
+
+
+@pytest.mark.parametrize("xp, device", NAMESPACE_DEVICES)
+def test_patched_namespace_polyval(xp, device):
+    import numpy as np
+    from numpy.polynomial import polynomial as P
+
+    rng = np.random.default_rng(0)
+    x, y, z = rng.random((3, 4, 5))
+    c = rng.random((9, 3))
+
+    def _to_xp(a):
+        return xp.asarray(a, device=device)
+
+    def _check(r, ref):
+        assert xp.device(r) == device
+        assert np.allclose(_NUMPY_NAMESPACE.asarray(xp.to_device(r, "cpu")), ref)
+
+    # one polynomial per column
+    _check(xp.polyval(_to_xp(x), _to_xp(c)), P.polyval(x, c))
+    _check(xp.polyval(_to_xp(x[:, :3]), _to_xp(c), tensor=False), P.polyval(x[:, :3], c, tensor=False))
+    _check(xp.polyval(_to_xp(x), [1.0, 2.0, 3.0]), P.polyval(x, [1.0, 2.0, 3.0]))
+
+    # in-place evaluation
+    out = xp.empty((3, 4, 5), dtype=xp.float64, device=device)
+    r = xp.polyval(_to_xp(x), _to_xp(c), out=out)
+    assert r is out
+    _check(out, P.polyval(x, c))
+
+    c2 = rng.random((3, 4))
+    _check(xp.polyval2d(_to_xp(x), _to_xp(y), _to_xp(c2)), P.polyval2d(x, y, c2))
+    c3 = rng.random((2, 3, 4))
+    _check(xp.polyval3d(_to_xp(x), _to_xp(y), _to_xp(z), _to_xp(c3)), P.polyval3d(x, y, z, c3))
+
+    with pytest.raises(ValueError):
+        xp.polyval2d(_to_xp(x), _to_xp(y[:2]), _to_xp(c2))
+
+
+def test_numpy_namespace_polyval_scalar():
+    import numpy as np
+    from numpy.polynomial import polynomial as P
+
+    xp = _NUMPY_NAMESPACE
+    # scalar results are numpy scalars, as with numpy.polynomial
+    for r, ref in [
+        (xp.polyval(2.0, [1.0, 2.0, 3.0]), P.polyval(2.0, [1.0, 2.0, 3.0])),
+        (xp.polyval2d(2.0, 1.0, np.ones((2, 2))), P.polyval2d(2.0, 1.0, np.ones((2, 2)))),
+    ]:
+        assert type(r) is type(ref) is np.float64
+        assert r == ref
+
+    out = np.empty(())
+    assert xp.polyval(2.0, [1.0, 2.0, 3.0], out=out) is out
+    assert isinstance(xp.polyval(np.asarray([2.0]), [1.0, 2.0, 3.0]), np.ndarray)
+
+
+@pytest.mark.parametrize("xp, device", _stat_namespaces())
+def test_patched_namespace_polyval_integer(xp, device):
+    import numpy as np
+    from numpy.polynomial import polynomial as P
+
+    # integer inputs are promoted to floating point, so large values do not overflow int64
+    x = xp.asarray([2, 4_000_000_000], device=device)
+    for c in ([1, 2, 3], xp.asarray([1, 2, 3], device=device)):
+        r = xp.polyval(x, c)
+        assert xp.isdtype(r.dtype, "real floating")
+        assert np.allclose(_NUMPY_NAMESPACE.asarray(xp.to_device(r, "cpu")), P.polyval([2, 4_000_000_000], [1, 2, 3]))
+
+    r = xp.polyval(xp.asarray([True, False], device=device), [1, 2])
+    assert xp.isdtype(r.dtype, "real floating")
+
+
+def test_numpy_namespace_polyval_integer():
+    import numpy as np
+    from numpy.polynomial import polynomial as P
+
+    r = _NUMPY_NAMESPACE.polyval(2, [1, 2, 3])
+    assert type(r) is type(P.polyval(2, [1, 2, 3])) is np.float64
+    assert r == 17.0
+
+
+def test_generic_namespace_polyval_out():
+    import numpy as np
+
+    # namespaces without in-place updates do not support out
+    xp = UnknownPatchedNamespace(array_api_compat.numpy)
+    x = np.asarray([1.0, 2.0, 3.0])
+    assert np.allclose(xp.polyval(x, x), [6.0, 17.0, 34.0])
+    with pytest.raises(ValueError):
+        xp.polyval(x, x, out=np.empty(3))
+
+
+@pytest.mark.parametrize("xp, device", NAMESPACE_DEVICES)
+def test_patched_namespace_allclose_blocks(xp, device):
+    import numpy as np
+
+    x = np.reshape(np.arange(1000.0), (100, 10))
+    y = x.copy()
+    y[97, 3] += 1.0
+    y[98, 0] = np.nan
+    x, y = xp.asarray(x, device=device), xp.asarray(y, device=device)
+
+    assert xp.allclose(x, x, block_size=64) is True
+    assert xp.allclose(x, y, block_size=64) is False
+    assert xp.allclose(x, y) is False
+    # broadcast inputs
+    assert xp.allclose(x[:, :1], x[:, :1] + 0 * x, block_size=64) is True
+
+    r = xp.allclose(x, y, report=True, block_size=64)
+    assert not r
+    assert r.mismatches == 2
+    assert r.size == 1000
+    assert r.max_abs_error == 1.0
+    assert np.isclose(r.max_rel_error, 1.0 / 974.0)
+
+    r = xp.allclose(x, x, report=True)
+    assert r
+    assert r.mismatches == 0
+    assert r.max_abs_error == 0.0
+
+
+def test_generic_namespace_allclose_strict():
+    xps = pytest.importorskip("array_api_strict")
+
+    xp = UnknownPatchedNamespace(xps)
+    x = xps.reshape(xps.arange(60.0), (3, 4, 5))
+    y = xps.where(x == 37.0, x + 1.0, x)
+
+    for block_size in (1, 7, 20, 1000):
+        assert xp.allclose(x, x, block_size=block_size) is True
+        assert xp.allclose(x, y, block_size=block_size) is False
+        r = xp.allclose(x, y, report=True, block_size=block_size)
+        assert (r.mismatches, r.size, r.max_abs_error) == (1, 60, 1.0)
+
+    # broadcast inputs
+    assert xp.allclose(x[:, :1, :], x[:, :1, :] + 0 * x, block_size=7) is True
+
+
+def test_generic_namespace_allclose_early_exit(monkeypatch):
+    import numpy as np
+
+    xp = UnknownPatchedNamespace(array_api_compat.numpy)
+    x = np.zeros((100, 10))
+    y = x.copy()
+    y[5, 0] = 1.0
+
+    shapes = []
+    isclose = xp.isclose
+
+    def _isclose(bx, by, **kwargs):
+        shapes.append(bx.shape)
+        return isclose(bx, by, **kwargs)
+
+    monkeypatch.setattr(xp, "isclose", _isclose)
+
+    assert not xp.allclose(x, y, block_size=30)
+    assert shapes == [(3, 10), (3, 10)]
+
+    shapes.clear()
+    assert xp.allclose(x, x, block_size=30)
+    assert len(shapes) == 34
+
+    # a row larger than the block is split
+    shapes.clear()
+    assert xp.allclose(x, x, block_size=4)
+    assert shapes[:3] == [(1, 4), (1, 4), (1, 2)]
+    assert len(shapes) == 300
+
+    assert xp.allclose(np.asarray(1.0), 1.0)
+    assert xp.allclose(np.zeros((0, 3)), np.zeros((0, 3)))
+
+
+@pytest.mark.parametrize("xp, device", _stat_namespaces())
+def test_patched_namespace_statistics(xp, device):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    a = rng.random((6, 50))
+    w = rng.random((6, 50)) + 0.1
+
+    def _to_xp(v):
+        return xp.asarray(v, device=device)
+
+    def _to_np(v):
+        return _NUMPY_NAMESPACE.asarray(xp.to_device(v, "cpu"))
+
+    # weighted mean
+    r = xp.weighted_mean(_to_xp(a), _to_xp(w), axis=1)
+    assert np.allclose(_to_np(r), np.average(a, axis=1, weights=w))
+    r = xp.weighted_mean(_to_xp(a), _to_xp(w[0]), axis=1)
+    assert np.allclose(_to_np(r), np.average(a, axis=1, weights=np.broadcast_to(w[0], a.shape)))
+    assert np.isclose(float(xp.weighted_mean(_to_xp(a), _to_xp(w))), np.average(a, weights=w))
+
+    # weighted quantile
+    for axis in [None, 0, 1]:
+        r = xp.weighted_quantile(_to_xp(a), 0.3, _to_xp(w), axis=axis)
+        assert np.allclose(_to_np(r), np.quantile(a, 0.3, axis=axis, weights=w, method="inverted_cdf"))
+        q = [0.0, 0.1, 0.5, 1.0]
+        r = xp.weighted_quantile(_to_xp(a), _to_xp(q), _to_xp(w), axis=axis)
+        assert np.allclose(_to_np(r), np.quantile(a, q, axis=axis, weights=w, method="inverted_cdf"))
+
+    # running mean
+    r = xp.running_mean(_to_xp(a), 5, axis=1)
+    assert np.allclose(_to_np(r), np.lib.stride_tricks.sliding_window_view(a, 5, axis=1).mean(axis=-1))
+    r = xp.running_mean(_to_xp(a), 6, axis=0)
+    assert np.allclose(_to_np(r), a.mean(axis=0, keepdims=True))
+    with pytest.raises(ValueError):
+        xp.running_mean(_to_xp(a), 7, axis=0)
+
+    # cumulative histogram
+    for range_ in [None, (0.2, 0.7)]:
+        counts, edges = xp.cumulative_histogram(_to_xp(a), bins=7, range=range_)
+        ref_counts, ref_edges = np.histogram(a, bins=7, range=range_)
+        assert np.array_equal(_to_np(counts), np.cumsum(ref_counts))
+        assert np.allclose(_to_np(edges), ref_edges)
+
+    # values on the edges
+    v = [0.0, 1.0, 1.0, 2.0, 3.0, 3.0]
+    counts, _ = xp.cumulative_histogram(_to_xp(v), bins=3)
+    assert np.array_equal(_to_np(counts), [1, 3, 6])
+
+
+def test_generic_namespace_weighted_quantile_strict():
+    import numpy as np
+
+    xps = pytest.importorskip("array_api_strict")
+    xp = UnknownPatchedNamespace(xps)
+
+    rng = np.random.default_rng(0)
+    a = rng.random((6, 50))
+    w = rng.random((6, 50)) + 0.1
+    for axis in [None, 0, 1]:
+        r = xp.weighted_quantile(xps.asarray(a), 0.3, xps.asarray(w), axis=axis)
+        assert np.allclose(np.asarray(r), np.quantile(a, 0.3, axis=axis, weights=w, method="inverted_cdf"))
+        q = [0.0, 0.1, 0.5, 1.0]
+        r = xp.weighted_quantile(xps.asarray(a), xps.asarray(q), xps.asarray(w), axis=axis)
+        assert np.allclose(np.asarray(r), np.quantile(a, q, axis=axis, weights=w, method="inverted_cdf"))
+
+
+@pytest.mark.parametrize("xp, device", _stat_namespaces())
+def test_patched_namespace_running_mean_float32(xp, device):
+    import numpy as np
+
+    # long float32 series, the window sums must not lose the precision of the data
+    rng = np.random.default_rng(0)
+    a = (280.0 + 10.0 * rng.standard_normal(2_000_000)).astype(np.float32)
+    ref = np.convolve(a.astype(np.float64), np.ones(5) / 5, mode="valid")
+
+    r = xp.running_mean(xp.asarray(a, device=device), 5)
+    assert r.dtype == xp.float32
+    r = _NUMPY_NAMESPACE.asarray(xp.to_device(r, "cpu"))
+    assert np.max(np.abs(r - ref)) < 1e-3
+
+
+@pytest.mark.parametrize("xp, device", _stat_namespaces())
+def test_patched_namespace_nanpercentile(xp, device):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    a = rng.random((6, 50))
+    a[a < 0.2] = np.nan
+    # a slice with only NaNs
+    a[2] = np.nan
+
+    def _to_np(v):
+        return _NUMPY_NAMESPACE.asarray(xp.to_device(v, "cpu"))
+
+    x = xp.asarray(a, device=device)
+    # numpy warns about the all-NaN slice
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for axis in [None, 0, 1]:
+            r = xp.nanpercentile(x, 30.0, axis=axis)
+            assert np.allclose(_to_np(r), np.nanpercentile(a, 30.0, axis=axis), equal_nan=True)
+            q = [0.0, 0.1, 0.5, 1.0]
+            r = xp.nanquantile(x, xp.asarray(q, device=device), axis=axis)
+            assert np.allclose(_to_np(r), np.nanquantile(a, q, axis=axis), equal_nan=True)
+
+
+def test_generic_namespace_quantile_strict():
+    import numpy as np
+
+    xps = pytest.importorskip("array_api_strict")
+    xp = UnknownPatchedNamespace(xps)
+
+    rng = np.random.default_rng(0)
+    a = rng.random((6, 50))
+    a_nan = np.where(a < 0.2, np.nan, a)
+    x, x_nan = xps.asarray(a), xps.asarray(a_nan)
+
+    def _to_xp(q):
+        # scalar q are passed as Python floats
+        return float(q) if np.ndim(q) == 0 else xps.asarray(q)
+
+    for axis in [None, 0, 1]:
+        for q in [0.3, np.asarray([0.0, 0.5, 1.0])]:
+            r = xp.quantile(x, _to_xp(q), axis=axis)
+            assert np.allclose(np.asarray(r), np.quantile(a, q, axis=axis))
+            r = xp.nanquantile(x_nan, _to_xp(q), axis=axis)
+            assert np.allclose(np.asarray(r), np.nanquantile(a_nan, q, axis=axis))
+            r = xp.percentile(x, _to_xp(100 * q), axis=axis)
+            assert np.allclose(np.asarray(r), np.percentile(a, 100 * q, axis=axis))
+            r = xp.nanpercentile(x_nan, _to_xp(100 * q), axis=axis)
+            assert np.allclose(np.asarray(r), np.nanpercentile(a_nan, 100 * q, axis=axis))
+
+
+def test_generic_namespace_percentile_nan():
+    import numpy as np
+
+    xp = UnknownPatchedNamespace(array_api_compat.numpy)
+    a = np.reshape(np.arange(12.0), (3, 4))
+    a[1, 2] = np.nan
+
+    # as in numpy, slices with NaNs give NaN
+    r = xp.percentile(a, 50, axis=1)
+    assert np.allclose(r, np.percentile(a, 50, axis=1), equal_nan=True)
+    r = xp.quantile(a, np.asarray([0.25, 0.75]), axis=0)
+    assert np.allclose(r, np.quantile(a, [0.25, 0.75], axis=0), equal_nan=True)
+    assert np.isclose(xp.percentile(np.arange(5), 50), 2.0)
+
+
+@pytest.mark.parametrize("xp, device", _stat_namespaces())
+def test_patched_namespace_weights(xp, device):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    sample = rng.random((500, 2))
+    w = rng.random(500)
+    a = rng.random((6, 40))
+    aw = rng.random((6, 40)) + 0.1
+
+    def _to_xp(v):
+        return xp.asarray(v, device=device)
+
+    def _to_np(v):
+        return _NUMPY_NAMESPACE.asarray(xp.to_device(v, "cpu"))
+
+    H, _ = xp.histogramdd(_to_xp(sample), bins=[3, 4], weights=_to_xp(w))
+    assert np.allclose(_to_np(H), np.histogramdd(sample, bins=[3, 4], weights=w)[0])
+    H, _ = xp.histogramdd(_to_xp(sample), bins=[3, 4])
+    assert np.allclose(_to_np(H), np.histogramdd(sample, bins=[3, 4])[0])
+
+    r = xp.histogram2d(_to_xp(sample[:, 0]), _to_xp(sample[:, 1]), bins=5, weights=_to_xp(w))
+    if xp._earthkit_array_namespace_name == "torch":
+        H, (xedges, yedges) = r
+    else:
+        H, xedges, yedges = r
+    H_ref, xedges_ref, yedges_ref = np.histogram2d(sample[:, 0], sample[:, 1], bins=5, weights=w)
+    assert np.allclose(_to_np(H), H_ref)
+    assert np.allclose(_to_np(xedges), xedges_ref)
+    assert np.allclose(_to_np(yedges), yedges_ref)
+
+    for axis in [None, 1]:
+        r = xp.quantile(_to_xp(a), 0.4, axis=axis, weights=_to_xp(aw))
+        assert np.allclose(_to_np(r), np.quantile(a, 0.4, axis=axis, weights=aw, method="inverted_cdf"))
+        r = xp.percentile(_to_xp(a), _to_xp([10.0, 60.0]), axis=axis, weights=_to_xp(aw))
+        assert np.allclose(_to_np(r), np.percentile(a, [10, 60], axis=axis, weights=aw, method="inverted_cdf"))
+
+    counts, _ = xp.cumulative_histogram(_to_xp(a), bins=5, weights=_to_xp(aw))
+    assert np.allclose(_to_np(counts), np.cumsum(np.histogram(a, bins=5, weights=aw)[0]))
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_torch_namespace_histogram2d():
+    import torch
+
+    xp = _TORCH_NAMESPACE
+    x = torch.tensor([0.0, 0.2, 0.8, 1.0])
+    y = torch.tensor([0.0, 1.0, 0.2, 1.0])
+
+    # (hist, bin_edges) as returned by torch.histogramdd
+    r = xp.histogram2d(x, y, bins=2)
+    assert len(r) == 2
+    H, edges = r
+    assert H.tolist() == [[1.0, 1.0], [1.0, 1.0]]
+    assert len(edges) == 2
+    assert edges[0].tolist() == [0.0, 0.5, 1.0]
+    assert edges[1].tolist() == [0.0, 0.5, 1.0]
+
+    H, _ = xp.histogram2d(x, y, bins=2, weights=torch.tensor([1.0, 2.0, 3.0, 4.0]))
+    assert H.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+
+@pytest.mark.parametrize("xp, device", NAMESPACE_DEVICES)
+def test_generic_namespace_histogramdd(xp, device):
+    import numpy as np
+
+    # the generic implementation on the underlying namespace
+    generic_xp = UnknownPatchedNamespace(xp.xp)
+
+    rng = np.random.default_rng(0)
+    sample = rng.random((1000, 3))
+    # a dimension with an empty range
+    sample[:, 2] = 1.0
+    w = rng.random(1000).astype("float32")
+
+    x = xp.asarray(sample, device=device)
+    H, edges = generic_xp.histogramdd(x, bins=[3, 4, 2])
+    H_ref, edges_ref = np.histogramdd(sample, bins=[3, 4, 2])
+    assert xp.device(H) == device
+    assert H.dtype == xp.int64
+    assert np.array_equal(_NUMPY_NAMESPACE.asarray(xp.to_device(H, "cpu")), H_ref)
+    for e, e_ref in zip(edges, edges_ref):
+        assert xp.device(e) == device
+        assert np.allclose(_NUMPY_NAMESPACE.asarray(xp.to_device(e, "cpu")), e_ref)
+
+    H, _ = generic_xp.histogramdd(x, bins=[3, 4, 2], weights=xp.asarray(w, device=device))
+    assert xp.device(H) == device
+    assert H.dtype == xp.float32
+    H_ref, _ = np.histogramdd(sample, bins=[3, 4, 2], weights=w)
+    assert np.allclose(_NUMPY_NAMESPACE.asarray(xp.to_device(H, "cpu")), H_ref, atol=1e-4)
+
+    # integer input and no points
+    H, _ = generic_xp.histogramdd(xp.asarray(np.reshape(np.arange(10), (5, 2)), device=device), bins=2)
+    assert H.dtype == xp.int64
+    assert np.array_equal(_NUMPY_NAMESPACE.asarray(xp.to_device(H, "cpu")), [[2, 0], [0, 3]])
+    H, _ = generic_xp.histogramdd(xp.zeros((0, 2), device=device), bins=2)
+    assert int(xp.sum(H)) == 0
+
+
+@pytest.mark.parametrize("xp, device", NAMESPACE_DEVICES)
+def test_generic_namespace_weighted_histogram_float32(xp, device):
+    import numpy as np
+
+    # the bin sums of many float32 weights must not suffer from cancellation
+    generic_xp = UnknownPatchedNamespace(xp.xp)
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    sample = rng.random((n, 2))
+    # cos-lat weights
+    w = np.cos(np.deg2rad(rng.uniform(-90.0, 90.0, n))).astype("float32")
+    x, xw = xp.asarray(sample, device=device), xp.asarray(w, device=device)
+
+    def _rel_error(r, ref):
+        r = _NUMPY_NAMESPACE.asarray(xp.to_device(r, "cpu"))
+        return np.max(np.abs(r - ref) / ref)
+
+    H, _ = generic_xp.histogramdd(x, bins=[40, 25], weights=xw)
+    assert H.dtype == xp.float32
+    H_ref, _ = np.histogramdd(sample, bins=[40, 25], weights=w.astype("float64"))
+    assert _rel_error(H, H_ref) < 1e-6
+
+    counts, _ = generic_xp.cumulative_histogram(x[:, 0], bins=1000, weights=xw)
+    assert counts.dtype == xp.float32
+    counts_ref = np.cumsum(np.histogram(sample[:, 0], bins=1000, weights=w.astype("float64"))[0])
+    assert _rel_error(counts, counts_ref) < 1e-6
+
+
 if __name__ == "__main__":
     from earthkit.utils.testing import main
 
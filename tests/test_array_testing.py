@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import subprocess
+import sys
+
+import pytest
+
+from earthkit.utils.array.testing import testing
+
+
+@pytest.fixture
+def probes(monkeypatch, tmp_path):
+    """Count the probes, with an empty in-process cache and an on-disk cache in tmp_path."""
+    calls = []
+
+    def _probe(name):
+        calls.append(name)
+        return name == "dask"
+
+    monkeypatch.setattr(testing, "_PROBES", {})
+    monkeypatch.setattr(testing, "_probe", _probe)
+    monkeypatch.setenv(testing.PROBE_CACHE_ENV, str(tmp_path))
+    return calls
+
+
+def test_array_testing_import_is_lazy():
+    code = (
+        "import sys; import earthkit.utils.array.testing.testing as t; "
+        "print(sorted(m for m in ('torch', 'cupy', 'jax', 'xarray', 'dask') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_array_testing_probes_cached(probes, tmp_path):
+    assert testing.NO_TORCH
+    assert testing.NO_TORCH
+    assert not testing.NO_DASK
+    assert probes == ["torch", "dask"]
+    assert len(list(tmp_path.glob("probes-*.json"))) == 1
+
+    # a new process only reads the on-disk cache
+    testing._PROBES.clear()
+    assert testing.NO_TORCH
+    assert not testing.NO_DASK
+    assert probes == ["torch", "dask"]
+
+
+def test_array_testing_probes_no_disk_cache(probes, monkeypatch, tmp_path):
+    monkeypatch.delenv(testing.PROBE_CACHE_ENV)
+    assert not testing.backend_available("cupy")
+    testing._PROBES.clear()
+    assert not testing.backend_available("cupy")
+    assert probes == ["cupy", "cupy"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_array_testing_constants():
+    assert testing.ARRAY_NAMES[0] == "numpy"
+    assert testing.ARRAY_NAMES == testing.get_array_names()
+    assert len(testing.NAMESPACE_DEVICES) >= 1
+    assert {xp._earthkit_array_namespace_name for xp, _ in testing.NAMESPACE_DEVICES} == set(testing.ARRAY_NAMES)
+    assert "NO_CUPY" in dir(testing)
+
+    with pytest.raises(AttributeError):
+        testing.NO_NUMPY
+
+
+if __name__ == "__main__":
+    from earthkit.utils.testing import main
+
+    main(__file__)
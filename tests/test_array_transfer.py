@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import numpy as np
+import pytest
+
+from earthkit.utils import instrumentation
+from earthkit.utils.array import convert, transfer
+from earthkit.utils.array.converter import FromCupyConverter, FromTorchConverter
+from earthkit.utils.array.testing.testing import NO_DASK, NO_TORCH
+from earthkit.utils.array.transfer import ImplicitTransferError, trace_transfers
+
+
+class _FakeDeviceArray:
+    """Array tagged with a fake device, copied to the host like torch and cupy arrays."""
+
+    def __init__(self, data, device="cuda:0"):
+        self.data = data
+        self.device = device
+        self.nbytes = data.nbytes
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.data.copy()
+
+    def get(self):
+        return self.data.copy()
+
+
+@pytest.fixture
+def fake_device(monkeypatch):
+    """Tag all the arrays as being on a cuda device."""
+    monkeypatch.setattr(transfer, "_device", lambda array: "cuda:0")
+
+
+def test_transfer_disabled_by_default():
+    assert not transfer.ENABLED
+    with trace_transfers() as ledger:
+        assert transfer.ENABLED
+    assert not transfer.ENABLED
+
+    FromTorchConverter(None).to_numpy(_FakeDeviceArray(np.ones(4)))
+    assert len(ledger) == 0
+
+
+@pytest.mark.parametrize("converter,source", [(FromTorchConverter, "torch"), (FromCupyConverter, "cupy")])
+def test_transfer_ledger_converters(converter, source):
+    x = _FakeDeviceArray(np.ones(100, dtype=np.float32))
+    with trace_transfers(stack_depth=2) as ledger:
+        r = converter(None).to_numpy(x)
+        converter(None).to_numpy(_FakeDeviceArray(np.ones(4), device="cpu"))
+
+    assert np.array_equal(r, np.ones(100))
+    (t,) = ledger
+    assert (t.source, t.target, t.device, t.nbytes) == (source, "numpy", "cuda:0", 400)
+    assert t.implicit
+    assert t.duration >= 0
+    assert len(t.stack) == 2
+    assert "test_transfer_ledger_converters" in t.stack[-1]
+    assert ledger.nbytes == 400
+    summary = ledger.summary()
+    assert summary == {(source, "numpy", "cuda:0"): {"count": 1, "nbytes": 400, "time": t.duration, "implicit": 1}}
+
+    ledger.clear()
+    assert len(ledger) == 0
+
+
+def test_transfer_strict():
+    x = _FakeDeviceArray(np.ones(4))
+    with trace_transfers(strict=True) as ledger:
+        with pytest.raises(ImplicitTransferError):
+            FromTorchConverter(None).to_numpy(x)
+        # explicit copies are allowed
+        with transfer._explicit():
+            FromCupyConverter(None).to_numpy(x)
+
+    assert len(ledger) == 1
+    assert not ledger.transfers[0].implicit
+    assert ledger.implicit == []
+
+
+def test_transfer_scoped_to_thread():
+    import threading
+
+    x = _FakeDeviceArray(np.ones(4))
+    errors = []
+
+    def _other_thread():
+        try:
+            FromTorchConverter(None).to_numpy(x)
+        except Exception as e:
+            errors.append(e)
+
+    with trace_transfers(strict=True) as ledger:
+        # a strict block does not affect the copies made by other threads
+        thread = threading.Thread(target=_other_thread)
+        thread.start()
+        thread.join()
+        with pytest.raises(ImplicitTransferError):
+            FromTorchConverter(None).to_numpy(x)
+
+    assert errors == []
+    assert len(ledger) == 0
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_transfer_convert_tiled(fake_device):
+    import torch
+
+    from earthkit.utils.array import convert_tiled
+
+    x = torch.ones((4, 3), dtype=torch.float64)
+    # the tiles are converted in a worker thread running in the context of the block
+    with trace_transfers(strict=True) as ledger:
+        r = convert_tiled(x, (1,), array_namespace="numpy", collect="device")
+
+    assert r.shape == (4, 3)
+    assert len(ledger) == 4
+    assert ledger.nbytes == 96
+    assert ledger.implicit == []
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_transfer_convert(fake_device):
+    import torch
+
+    x = torch.ones(10, dtype=torch.float64)
+    with trace_transfers(strict=True) as ledger:
+        convert(x, array_namespace="numpy")
+        convert(x, device="cpu")
+
+    assert len(ledger) == 2
+    assert [t.implicit for t in ledger] == [False, False]
+    assert [(t.source, t.target) for t in ledger] == [("torch", "numpy"), ("torch", "torch")]
+    assert ledger.nbytes == 160
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+@pytest.mark.skipif(NO_DASK, reason="No dask installed")
+def test_transfer_convert_implicit(fake_device):
+    import torch
+
+    x = torch.ones(10)
+    with trace_transfers() as ledger:
+        convert(x, array_namespace="dask")
+    (t,) = ledger
+    assert t.implicit
+
+    with trace_transfers(strict=True):
+        with pytest.raises(ImplicitTransferError):
+            convert(x, array_namespace="dask")
+
+
+def test_transfer_instrumentation():
+    with instrumentation.instrument(instrumentation.MemorySink(keep_events=True)) as sink:
+        FromCupyConverter(None).to_numpy(_FakeDeviceArray(np.ones(8)))
+
+    (event,) = sink.events
+    assert event.name == "transfer"
+    assert event.attributes == {"source": "cupy", "target": "numpy", "device": "cuda:0", "nbytes": 64, "implicit": True}
+
+
+if __name__ == "__main__":
+    from earthkit.utils.testing import main
+
+    main(__file__)
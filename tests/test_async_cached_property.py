@@ -0,0 +1,105 @@
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import asyncio
+
+import pytest
+
+from earthkit.utils.decorators import async_cached_property
+
+
+class _A:
+    def __init__(self, fail=0):
+        self.count = 0
+        self.fail = fail
+
+    @async_cached_property
+    async def data(self):
+        self.count += 1
+        await asyncio.sleep(0.1)
+        if self.count <= self.fail:
+            raise RuntimeError("failed")
+        return self.count
+
+
+def test_async_cached_property_1():
+    async def main():
+        a = _A()
+        assert await a.data == 1
+        assert await a.data == 1
+        assert a.count == 1
+
+    asyncio.run(main())
+
+
+def test_async_cached_property_concurrent():
+    async def main():
+        a = _A()
+        b = _A()
+        res = await asyncio.gather(*[a.data for _ in range(10)], *[b.data for _ in range(10)])
+        assert res == [1] * 20
+        assert a.count == 1
+        assert b.count == 1
+
+    asyncio.run(main())
+
+
+def test_async_cached_property_error_not_cached():
+    async def main():
+        a = _A(fail=1)
+        res = await asyncio.gather(*[a.data for _ in range(5)], return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in res)
+        assert a.count == 1
+
+        assert await a.data == 2
+        assert await a.data == 2
+
+    asyncio.run(main())
+
+
+def test_async_cached_property_cancel_one_awaiter():
+    async def main():
+        a = _A()
+        first = asyncio.ensure_future(a.data)
+        second = asyncio.ensure_future(a.data)
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == 1
+        assert a.count == 1
+
+    asyncio.run(main())
+
+
+def test_async_cached_property_invalidate():
+    async def main():
+        a = _A()
+        assert await a.data == 1
+        _A.data.invalidate(a)
+        assert await a.data == 2
+
+    asyncio.run(main())
+
+
+def test_async_cached_property_separate_loops():
+    a = _A()
+
+    async def main():
+        return await a.data
+
+    assert asyncio.run(main()) == 1
+    assert asyncio.run(main()) == 1
+
+
+def test_async_cached_property_not_coroutine():
+    with pytest.raises(TypeError):
+
+        class _B:
+            @async_cached_property
+            def data(self):
+                return 1
@@ -162,3 +162,176 @@ def test_format_handler_no_earthkit_data(caplog, monkeypatch):
         or "input object type does not match the expected function type" in record.getMessage()
         for record in caplog.records
     )
+
+
+def test_format_handler_signature_resolved_once(monkeypatch):
+    """The signature is inspected at decoration time, not on every call."""
+    import inspect
+
+    @format_handler()
+    def _numpy_handler(data: np.ndarray):
+        return data
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("inspect.signature called on the call path")
+
+    monkeypatch.setattr(inspect, "signature", _fail)
+
+    assert _numpy_handler(TEST_NUMPY) is TEST_NUMPY
+    assert isinstance(_numpy_handler(TEST_DATAARRAY), np.ndarray)
+    assert isinstance(_numpy_handler(data=TEST_DATAARRAY), np.ndarray)
+
+
+def test_format_handler_translator_imported_once(monkeypatch):
+    import builtins
+
+    original_import = builtins.__import__
+    calls = []
+
+    def _mock_import(name, *args, **kwargs):
+        if name == "earthkit.data.translators":
+            calls.append(name)
+            raise ImportError("earthkit.data not found")
+        return original_import(name, *args, **kwargs)
+
+    @format_handler()
+    def _handler(data: xr.DataArray):
+        return data
+
+    monkeypatch.setattr(builtins, "__import__", _mock_import)
+
+    # no transformation needed, so no import attempted
+    _handler(TEST_DATAARRAY)
+    assert calls == []
+
+    for _ in range(3):
+        assert _handler(TEST_NUMPY) is TEST_NUMPY
+    assert len(calls) == 1
+
+
+def test_format_handler_subclass_not_transformed(monkeypatch):
+    """Instances of subclasses of an accepted type are passed through unchanged."""
+
+    class _SubArray(np.ndarray):
+        pass
+
+    sub = TEST_NUMPY.view(_SubArray)
+
+    @format_handler()
+    def _numpy_handler(data: np.ndarray):
+        return data
+
+    assert _numpy_handler(sub) is sub
+
+
+def test_format_handler_generic_annotation():
+    """Parametrised generics are not used in isinstance checks (a TypeError on Python 3.10)."""
+
+    @format_handler()
+    def _handler(data: list[int], n: dict[str, int] | None = None):
+        return data
+
+    assert _handler([1, 2]) == [1, 2]
+    assert _handler([1, 2], n={"a": 1}) == [1, 2]
+
+
+def test_format_handler_any_annotation():
+    """Parameters annotated with typing.Any accept any value (Any is a class on Python >= 3.11)."""
+    import typing as T
+
+    @format_handler()
+    def _handler(data: T.Any, other: T.Optional[T.Any] = None):
+        return data, other
+
+    assert _handler(TEST_NUMPY) == (TEST_NUMPY, None)
+    assert _handler(TEST_DATAARRAY, other=1) == (TEST_DATAARRAY, 1)
+
+
+def _counting_transform(monkeypatch, fail_types=()):
+    import earthkit.data.translators
+
+    original = earthkit.data.translators.transform
+    calls = []
+
+    def _transform(value, target_type):
+        calls.append((type(value), target_type))
+        if target_type in fail_types:
+            raise ValueError(f"cannot transform to {target_type}")
+        return original(value, target_type)
+
+    monkeypatch.setattr(earthkit.data.translators, "transform", _transform)
+    return calls
+
+
+def test_format_handler_transform_cache_success(monkeypatch):
+    calls = _counting_transform(monkeypatch, fail_types=(xr.Dataset,))
+
+    @format_handler()
+    def _handler(data: xr.Dataset | xr.DataArray):
+        return data
+
+    assert isinstance(_handler(TEST_NUMPY), xr.DataArray)
+    assert calls == [(np.ndarray, xr.Dataset), (np.ndarray, xr.DataArray)]
+
+    # the successful target type is tried directly on subsequent calls
+    calls.clear()
+    assert isinstance(_handler(TEST_NUMPY), xr.DataArray)
+    assert isinstance(_handler(data=TEST_NUMPY), xr.DataArray)
+    assert calls == [(np.ndarray, xr.DataArray)] * 2
+
+
+def test_format_handler_transform_cache_failure(monkeypatch):
+    calls = _counting_transform(monkeypatch, fail_types=(xr.DataArray,))
+
+    @format_handler()
+    def _handler(data: xr.DataArray):
+        return data
+
+    assert _handler(TEST_NUMPY) is TEST_NUMPY
+    assert len(calls) == 1
+
+    # failing pairs are not retried
+    assert _handler(TEST_NUMPY) is TEST_NUMPY
+    assert len(calls) == 1
+
+
+def test_format_handler_memoize(monkeypatch):
+    import gc
+
+    from earthkit.utils.decorators._format_handlers import _TRANSFORM_MEMO
+
+    _TRANSFORM_MEMO.clear()
+    calls = _counting_transform(monkeypatch)
+
+    @format_handler(memoize=True)
+    def _handler_1(data: np.ndarray):
+        return data
+
+    @format_handler(memoize=True)
+    def _handler_2(data: np.ndarray):
+        return data
+
+    ds = xr.Dataset({"test": TEST_DATAARRAY.copy()})
+    res_1 = _handler_1(ds)
+    res_2 = _handler_2(ds)
+    assert isinstance(res_1, np.ndarray)
+    assert res_2 is res_1
+    assert len(calls) == 1
+    assert len(_TRANSFORM_MEMO) == 1
+
+    # the memo entry is dropped with the source object
+    del ds
+    gc.collect()
+    assert len(_TRANSFORM_MEMO) == 0
+
+
+def test_format_handler_memoize_disabled(monkeypatch):
+    calls = _counting_transform(monkeypatch)
+
+    @format_handler()
+    def _handler(data: np.ndarray):
+        return data
+
+    _handler(TEST_DATASET)
+    _handler(TEST_DATASET)
+    assert len(calls) == 2
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import subprocess
+import sys
+
+import pytest
+
+# maximum cumulative import time in seconds, generous to avoid failures on slow machines
+IMPORT_TIME_BUDGET = {
+    "earthkit.utils": 0.1,
+    "earthkit.utils.array": 0.3,
+    "earthkit.utils.constants": 0.1,
+    "earthkit.utils.decorators": 0.1,
+    "earthkit.utils.units": 0.1,
+}
+
+# modules that must only be imported when they are used
+HEAVY_MODULES = ["array_api_compat", "asyncio", "cupy", "dask", "jax", "numpy", "pint", "torch", "xarray"]
+
+
+def _import_times(module):
+    """Return the cumulative import time in seconds of each module imported by ``module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative) / 1e6
+        except ValueError:
+            # the header line
+            pass
+    return times
+
+
+@pytest.mark.parametrize("module,budget", IMPORT_TIME_BUDGET.items())
+def test_import_time_budget(module, budget):
+    times = _import_times(module)
+    assert module in times
+    assert times[module] < budget, f"import {module} took {times[module]:.3f}s, budget={budget}s"
+
+
+@pytest.mark.parametrize("module", IMPORT_TIME_BUDGET.keys())
+def test_import_is_lazy(module):
+    times = _import_times(module)
+    loaded = [name for name in HEAVY_MODULES if name in times]
+    assert loaded == [], f"import {module} imported {loaded}"
+
+
+def test_lazy_attributes():
+    import earthkit.utils
+    import earthkit.utils.decorators
+    import earthkit.utils.units
+
+    assert "units" in dir(earthkit.utils)
+    assert earthkit.utils.units.Units is earthkit.utils.units.units.Units
+    assert "format_handler" in dir(earthkit.utils.decorators)
+    assert callable(earthkit.utils.decorators.format_handler)
+
+    with pytest.raises(AttributeError):
+        earthkit.utils.missing
+    with pytest.raises(AttributeError):
+        earthkit.utils.units.missing
+
+
+if __name__ == "__main__":
+    from earthkit.utils.testing import main
+
+    main(__file__)
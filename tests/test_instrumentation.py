@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2026 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import logging
+import types
+
+import numpy as np
+import pytest
+
+from earthkit.utils import instrumentation
+from earthkit.utils.array import array_namespace, convert
+from earthkit.utils.array.testing.testing import NO_TORCH
+from earthkit.utils.decorators import _dispatch as dispatch_module
+from earthkit.utils.decorators import dispatch, format_handler
+from earthkit.utils.instrumentation import CallbackSink, LoggingSink, MemorySink, instrument
+from earthkit.utils.units import Units, convert_array
+
+
+def test_instrumentation_disabled_by_default():
+    assert not instrumentation.ENABLED
+
+    sink = MemorySink()
+    with instrument(sink) as s:
+        assert s is sink
+        assert instrumentation.ENABLED
+    assert not instrumentation.ENABLED
+
+    # nothing is recorded outside the block
+    array_namespace(np.ones(2))
+    assert sink.summary() == {}
+
+
+def test_instrumentation_memory_sink():
+    with instrument() as sink:
+        instrumentation.record("a", 0.5, nbytes=10, copy=True, label="x")
+        instrumentation.record("a", 0.25, nbytes=5, copy=False)
+        instrumentation.record("b")
+        with instrumentation.timer("c", n=1) as attributes:
+            attributes["n"] = 2
+
+    summary = sink.summary()
+    assert summary["a"] == {"count": 2, "time": 0.75, "nbytes": 15, "copy": 1}
+    assert summary["b"] == {"count": 1}
+    assert summary["c"]["n"] == 2
+    assert summary["c"]["time"] > 0
+    assert sink.count("a") == 2
+    assert sink.count("missing") == 0
+
+    sink.clear()
+    assert sink.summary() == {}
+
+
+def test_instrumentation_sinks(caplog):
+    events = []
+    memory = MemorySink(key=lambda e: (e.name, e.attributes.get("k")), keep_events=True)
+
+    def _failing(name, duration, attributes):
+        raise RuntimeError("failing sink")
+
+    with caplog.at_level(logging.DEBUG, logger="earthkit.utils.instrumentation"):
+        with instrument(memory, LoggingSink(), lambda *args: events.append(args), _failing) as sinks:
+            assert len(sinks) == 4
+            assert isinstance(sinks[2], CallbackSink)
+            instrumentation.record("a", k=1)
+            instrumentation.record("a", 0.5, k=2)
+
+    assert events == [("a", None, {"k": 1}), ("a", 0.5, {"k": 2})]
+    assert memory.count(("a", 1)) == 1
+    assert memory.count(("a", 2)) == 1
+    assert [e.attributes["k"] for e in memory.events] == [1, 2]
+    assert "a 0.500000s {'k': 2}" in caplog.text
+    # a failing sink does not break the other sinks
+    assert "failing sink" in caplog.text
+
+    with pytest.raises(TypeError):
+        instrumentation.add_sink(1)
+
+
+def test_instrumentation_scoped_to_thread():
+    import threading
+
+    def _other_thread():
+        instrumentation.record("other")
+
+    with instrument() as sink:
+        # the events of other threads are not collected by the block
+        thread = threading.Thread(target=_other_thread)
+        thread.start()
+        thread.join()
+        instrumentation.record("this")
+
+    assert sink.summary() == {"this": {"count": 1}}
+
+    # unless the sink is registered for all the threads
+    sink = instrumentation.add_sink(MemorySink())
+    try:
+        assert instrumentation.ENABLED
+        thread = threading.Thread(target=_other_thread)
+        thread.start()
+        thread.join()
+    finally:
+        instrumentation.remove_sink(sink)
+    assert not instrumentation.ENABLED
+    assert sink.summary() == {"other": {"count": 1}}
+
+
+def test_instrumentation_array_namespace():
+    with instrument() as sink:
+        array_namespace(np.ones(2))
+        array_namespace("numpy")
+
+    assert sink.count("array_namespace") == 2
+
+
+@pytest.mark.skipif(NO_TORCH, reason="No torch installed")
+def test_instrumentation_convert():
+    x = np.ones(100, dtype=np.float32)
+
+    with instrument(MemorySink(key=lambda e: (e.name, e.attributes.get("source"), e.attributes.get("target")))) as sink:
+        y = convert(x, array_namespace="torch")
+        convert(y, array_namespace="numpy")
+        convert(x, array_namespace="numpy")
+        convert(x.astype(">f4"), array_namespace="torch")
+
+    summary = sink.summary()
+    numpy_torch = summary[("convert", "numpy", "torch")]
+    assert numpy_torch["count"] == 2
+    assert numpy_torch["nbytes"] == 800
+    # the non-native byte order array is copied
+    assert numpy_torch["copy"] == 1
+    assert summary[("convert", "torch", "numpy")]["copy"] == 0
+    assert summary[("convert", "numpy", "numpy")]["copy"] == 0
+
+
+def test_instrumentation_units():
+    from earthkit.utils.units.units import _from_str
+
+    _from_str.cache_clear()
+    with instrument(MemorySink(keep_events=True)) as sink:
+        Units.from_any("m s-1")
+        Units.from_any("m s-1")
+        Units.from_any("not_a_pint_unit")
+        Units.from_any("not_a_pint_unit")
+        convert_array(np.ones(3), target_units="km", source_units="m")
+
+    hits = [e.attributes["cache_hit"] for e in sink.events if e.name == "units.from_any"]
+    assert hits[:4] == [False, True, False, True]
+    # the fallback is also recorded when the units are cached
+    assert sink.count("units.pint_fallback") == 2
+    assert sink.count("units.convert_array") == 1
+
+
+def test_instrumentation_decorators(monkeypatch):
+    def _impl(data):
+        return data
+
+    def _dispatched(data):
+        return dispatch(_dispatched)(data)
+
+    monkeypatch.setattr(dispatch_module, "import_module", lambda name: types.SimpleNamespace(_dispatched=_impl))
+
+    @format_handler()
+    def _handled(data: np.ndarray):
+        return data
+
+    with instrument(MemorySink(keep_events=True)) as sink:
+        _dispatched(np.ones(2))
+        _handled(np.ones(2))
+
+    (event,) = [e for e in sink.events if e.name == "dispatch"]
+    assert event.attributes["dispatcher"] == "ArrayDispatcher"
+    (event,) = [e for e in sink.events if e.name == "format_handler"]
+    assert event.attributes["transformed"] is False
+    assert event.attributes["function"].endswith("_handled")
+
+
+if __name__ == "__main__":
+    from earthkit.utils.testing import main
+
+    main(__file__)
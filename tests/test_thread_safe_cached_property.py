@@ -7,10 +7,13 @@
 # nor does it submit to any jurisdiction.
 #
 
+import sys
 import threading
 import time
 
-from earthkit.utils.decorators import thread_safe_cached_property
+import pytest
+
+from earthkit.utils.decorators import thread_safe_cached_property, thread_safe_slotted_cached_property
 
 
 class _A:
@@ -219,3 +222,396 @@ def test_thread_cached_property_wrapped_2(reraise):
 
     assert w1.compute(1) == 2
     assert w2.compute(1) == 3
+
+
+class _Blocking:
+    def __init__(self, started, release):
+        self.started = started
+        self.release = release
+
+    @thread_safe_cached_property
+    def data(self):
+        self.started.set()
+        assert self.release.wait(5), "computation was not released"
+        return 1
+
+
+def test_thread_cached_property_instances_concurrent(reraise):
+    """Computing the property on one instance does not block other instances."""
+    started = threading.Event()
+    release = threading.Event()
+    a = _Blocking(started, release)
+
+    descriptor = _Blocking.__dict__["data"]
+    others = [_Blocking(threading.Event(), threading.Event()) for _ in range(16)]
+    b = next(x for x in others if descriptor._lock(x) is not descriptor._lock(a))
+    b.release.set()
+
+    def worker():
+        with reraise:
+            assert a.data == 1
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert started.wait(5)
+
+    # a is still being computed in the other thread
+    result = []
+    thread_b = threading.Thread(target=lambda: result.append(b.data))
+    thread_b.start()
+    thread_b.join(5)
+    assert result == [1]
+
+    release.set()
+    thread.join()
+    assert a.data == 1
+
+
+def test_thread_cached_property_nested_same_lock():
+    """Accessing the property of another instance sharing the same lock does not deadlock."""
+
+    class _Nested:
+        def __init__(self, other=None):
+            self.other = other
+
+        @thread_safe_cached_property
+        def data(self):
+            return 1 if self.other is None else self.other.data + 1
+
+    descriptor = _Nested.__dict__["data"]
+    inner = _Nested()
+    candidates = [_Nested(inner) for _ in range(1000)]
+    outer = next(x for x in candidates if descriptor._lock(x) is descriptor._lock(inner))
+    assert outer.data == 2
+
+
+class _Slotted:
+    __slots__ = ("count", "_c_data")
+
+    def __init__(self, count=0):
+        self.count = count
+
+    @thread_safe_slotted_cached_property
+    def data(self):
+        """Property data."""
+        time.sleep(1)
+        self.count += 1
+        return self.count
+
+
+class _WeakSlotted:
+    __slots__ = ("count", "__weakref__")
+
+    def __init__(self, count=0):
+        self.count = count
+
+    @thread_safe_slotted_cached_property
+    def data(self):
+        """Property data."""
+        time.sleep(1)
+        self.count += 1
+        return self.count
+
+
+class _Plain:
+    def __init__(self, count=0):
+        self.count = count
+
+    @thread_safe_cached_property
+    def data(self):
+        """Property data."""
+        self.count += 1
+        return self.count
+
+
+def test_thread_cached_property_slots_raises():
+    class _NoDict:
+        __slots__ = ("count",)
+
+        @thread_safe_cached_property
+        def data(self):
+            return 1
+
+    with pytest.raises(TypeError):
+        _NoDict().data
+
+
+@pytest.mark.parametrize("cls", [_Slotted, _WeakSlotted])
+def test_thread_slotted_cached_property(reraise, cls):
+    a = cls(0)
+    b = cls(1)
+
+    def worker(n):
+        with reraise:
+            assert a.data == 1, f"a, thread {n} failed"
+            assert b.data == 2, f"b, thread {n} failed"
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert a.data == 1
+    assert b.data == 2
+    assert a.count == 1
+    assert b.count == 2
+
+
+def test_thread_slotted_cached_property_uses_slot():
+    class _Slot:
+        __slots__ = ("_c_data", "__weakref__")
+
+        @thread_safe_slotted_cached_property
+        def data(self):
+            return 42
+
+    a = _Slot()
+    assert a.data == 42
+    assert a._c_data == 42
+    assert not _Slot.__dict__["data"].table
+
+
+def test_thread_slotted_cached_property_side_table():
+    import gc
+
+    class _Weak:
+        __slots__ = ("__weakref__",)
+
+        @thread_safe_slotted_cached_property
+        def data(self):
+            return object()
+
+    descriptor = _Weak.__dict__["data"]
+    a = _Weak()
+    value = a.data
+    assert a.data is value
+    assert len(descriptor.table) == 1
+
+    del a
+    gc.collect()
+    assert len(descriptor.table) == 0
+
+
+def test_thread_slotted_cached_property_no_storage():
+    class _NoStorage:
+        __slots__ = ("count",)
+
+        @thread_safe_slotted_cached_property
+        def data(self):
+            return 1
+
+    with pytest.raises(TypeError):
+        _NoStorage().data
+
+
+def test_thread_slotted_cached_property_with_dict():
+    class _Dict:
+        @thread_safe_slotted_cached_property
+        def data(self):
+            return 1
+
+    a = _Dict()
+    assert a.data == 1
+    assert a.__dict__["_c_data"] == 1
+
+
+def test_thread_slotted_cached_property_ttl():
+    class _Dict:
+        def __init__(self):
+            self.count = 0
+
+        @thread_safe_slotted_cached_property(ttl=0.1)
+        def data(self):
+            self.count += 1
+            return self.count
+
+    class _Slot:
+        __slots__ = ("_c_data",)
+
+        @thread_safe_slotted_cached_property(ttl=0.1)
+        def data(self):
+            return 1
+
+    a = _Dict()
+    assert a.data == 1
+    assert a.data == 1
+    time.sleep(0.2)
+    assert a.data == 2
+
+    with pytest.raises(TypeError, match="ttl"):
+        _Slot().data
+
+    with pytest.raises(ValueError):
+        thread_safe_slotted_cached_property(stale_while_revalidate=True)
+
+
+def test_thread_slotted_cached_property_memory():
+    """Slotted instances holding a cached value are smaller than dict based ones."""
+    plain = _Plain()
+    plain.data
+    plain_size = sys.getsizeof(plain) + sys.getsizeof(plain.__dict__)
+
+    slotted = _Slotted()
+    slotted._c_data = 1
+    assert slotted.data == 1
+    slotted_size = sys.getsizeof(slotted)
+
+    assert slotted_size < plain_size
+
+
+class _Expiring:
+    def __init__(self):
+        self.count = 0
+
+    @thread_safe_cached_property(ttl=0.2)
+    def data(self):
+        self.count += 1
+        return self.count
+
+
+def test_thread_cached_property_parametrised():
+    assert _Expiring.data.method.__name__ == "data"
+    assert _Expiring.data.name == "_c_data"
+
+
+def test_thread_cached_property_invalid_args():
+    with pytest.raises(ValueError):
+        thread_safe_cached_property(stale_while_revalidate=True)
+
+    with pytest.raises(TypeError):
+        _A.data(lambda self: 1)
+
+
+def test_thread_cached_property_invalidate():
+    a = _A(0)
+    a.__dict__["_c_data"] = 5
+    assert a.data == 5
+
+    _A.data.invalidate(a)
+    assert a.data == 1
+    assert a.count == 1
+
+    # invalidating a value not yet computed is a no-op
+    _A.data.invalidate(_A(0))
+
+
+def test_thread_cached_property_ttl():
+    a = _Expiring()
+    assert a.data == 1
+    assert a.data == 1
+    time.sleep(0.3)
+    assert a.data == 2
+    assert a.count == 2
+
+
+def test_thread_cached_property_ttl_threads(reraise):
+    class _Slow:
+        def __init__(self):
+            self.count = 0
+
+        @thread_safe_cached_property(ttl=60)
+        def data(self):
+            time.sleep(0.5)
+            self.count += 1
+            return self.count
+
+    a = _Slow()
+
+    def worker(n):
+        with reraise:
+            assert a.data == 1, f"Thread {n} failed"
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert a.count == 1
+
+
+def test_thread_cached_property_stale_while_revalidate():
+    release = threading.Event()
+
+    class _Revalidated:
+        def __init__(self):
+            self.count = 0
+
+        @thread_safe_cached_property(ttl=0.1, stale_while_revalidate=True)
+        def data(self):
+            if self.count > 0:
+                assert release.wait(5)
+            self.count += 1
+            return self.count
+
+    a = _Revalidated()
+    assert a.data == 1
+    time.sleep(0.2)
+
+    # the expired value is served while being recomputed in the background
+    assert a.data == 1
+    assert a.data == 1
+    release.set()
+
+    deadline = time.monotonic() + 5
+    while a.data != 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert a.data == 2
+    assert a.count == 2
+
+
+def test_thread_cached_property_stale_while_revalidate_error():
+    class _Failing:
+        def __init__(self):
+            self.count = 0
+
+        @thread_safe_cached_property(ttl=0.1, stale_while_revalidate=True)
+        def data(self):
+            self.count += 1
+            if self.count > 1:
+                raise RuntimeError("failed")
+            return self.count
+
+    a = _Failing()
+    assert a.data == 1
+    time.sleep(0.2)
+    assert a.data == 1
+
+    deadline = time.monotonic() + 5
+    while a.count < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # errors are not cached, the expired value is kept
+    assert a.data == 1
+
+
+@pytest.mark.parametrize("cls", ["slot", "weakref"])
+def test_thread_slotted_cached_property_invalidate(cls):
+    class _Slot:
+        __slots__ = ("count", "_c_data")
+
+        def __init__(self):
+            self.count = 0
+
+        @thread_safe_slotted_cached_property
+        def data(self):
+            self.count += 1
+            return self.count
+
+    class _Weak:
+        __slots__ = ("count", "__weakref__")
+
+        def __init__(self):
+            self.count = 0
+
+        @thread_safe_slotted_cached_property
+        def data(self):
+            self.count += 1
+            return self.count
+
+    klass = _Slot if cls == "slot" else _Weak
+    a = klass()
+    assert a.data == 1
+    klass.data.invalidate(a)
+    assert a.data == 2
+    klass.data.invalidate(klass())
@@ -15,7 +15,12 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from earthkit.utils.decorators._xarray_ufunc import _infer_output_count, xarray_ufunc
+from earthkit.utils.decorators._xarray_ufunc import (
+    _infer_output_count,
+    _infer_output_dtypes,
+    xarray_pipeline,
+    xarray_ufunc,
+)
 
 # Test data
 TEST_NUMPY_ARRAY = np.array([1, 2, 3, 4, 5])
@@ -177,3 +182,241 @@ class TestXarrayUfunc:
             with patch.object(builtins, "__import__", side_effect=_mock_import):
                 with pytest.raises(ImportError):
                     xarray_ufunc(add_one, TEST_NUMPY_ARRAY)
+
+
+class TestInferOutputDtypes:
+    """Test the _infer_output_dtypes helper function."""
+
+    @pytest.mark.parametrize(
+        "dtypes,expected",
+        [
+            ([np.float32], np.float32),
+            ([np.float32, np.float32], np.float32),
+            ([np.float32, np.float64], np.float64),
+            ([np.int64], np.float64),
+            ([np.bool_], np.float64),
+            ([np.complex64], np.complex64),
+        ],
+    )
+    def test_dtypes(self, dtypes, expected):
+        args = [xr.DataArray(np.zeros(3, dtype=dtype), dims=["x"]) for dtype in dtypes]
+        assert _infer_output_dtypes(args, 2) == [np.dtype(expected)] * 2
+
+    def test_no_dtype(self):
+        assert _infer_output_dtypes([1, "a"], 1) == [np.dtype(float)]
+
+    def test_dataset(self):
+        ds = xr.Dataset({"a": ("x", np.zeros(3, dtype=np.float32))})
+        assert _infer_output_dtypes([ds], 1) == [np.dtype(np.float32)]
+
+
+class TestXarrayUfuncDask:
+    """Test xarray_ufunc with dask backed inputs."""
+
+    @pytest.fixture
+    def chunked(self):
+        pytest.importorskip("dask")
+        data = np.arange(20, dtype=np.float32).reshape(4, 5)
+        return xr.DataArray(data, dims=["x", "y"]).chunk({"x": 2, "y": 2})
+
+    def test_keeps_float32(self, chunked):
+        def add_one(x):
+            return x + 1
+
+        result = xarray_ufunc(add_one, chunked)
+        assert result.dtype == np.float32
+        assert result.chunks == chunked.chunks
+        np.testing.assert_array_equal(result.values, chunked.values + 1)
+
+    def test_multiple_outputs_chunked(self, chunked):
+        def split_data(x) -> Tuple[float, float]:
+            return x / 2, x * 2
+
+        half, double = xarray_ufunc(split_data, chunked)
+        for result in (half, double):
+            assert result.dims == chunked.dims
+            assert result.dtype == np.float32
+            assert result.chunks == chunked.chunks
+        np.testing.assert_array_equal(half.values, chunked.values / 2)
+        np.testing.assert_array_equal(double.values, chunked.values * 2)
+
+    def test_multiple_outputs_different_dims(self):
+        def split_data(x, y) -> Tuple[float, float]:
+            return x / 2, x * 2
+
+        x = xr.DataArray(np.ones((2, 3)), dims=["a", "b"])
+        y = xr.DataArray(np.ones(3), dims=["b"])
+        half, double = xarray_ufunc(split_data, x, y)
+        assert half.dims == ("a", "b")
+        np.testing.assert_array_equal(double.values, x.values * 2)
+
+    def test_output_dtypes_trial(self, chunked):
+        def is_positive(x):
+            return x > 0
+
+        result = xarray_ufunc(is_positive, chunked, xarray_ufunc_kwargs={"output_dtypes": None})
+        assert result.dtype == np.bool_
+
+    def test_dask_allowed(self, chunked):
+        import dask.array as da
+
+        calls = []
+
+        def add_one(x):
+            calls.append(type(x))
+            return x + 1
+
+        result = xarray_ufunc(add_one, chunked, xarray_ufunc_kwargs={"dask": "allowed"})
+        assert calls == [da.Array]
+        np.testing.assert_array_equal(result.values, chunked.values + 1)
+
+    def test_rechunk_hints(self, chunked):
+        def total(x):
+            return x.sum(axis=-1)
+
+        result = xarray_ufunc(
+            total,
+            chunked,
+            xarray_ufunc_kwargs={
+                "input_core_dims": [["y"]],
+                "allow_rechunk": True,
+            },
+        )
+        np.testing.assert_array_equal(result.values, chunked.values.sum(axis=-1))
+
+    def test_output_sizes_hint(self, chunked):
+        def expand(x):
+            return np.repeat(x[..., None], 3, axis=-1)
+
+        result = xarray_ufunc(
+            expand,
+            chunked,
+            xarray_ufunc_kwargs={"output_core_dims": [["z"]], "output_sizes": {"z": 3}},
+        )
+        assert result.sizes["z"] == 3
+        np.testing.assert_array_equal(result.values[..., 1], chunked.values)
+
+
+class TestXarrayPipeline:
+    """Test the xarray_pipeline function."""
+
+    def test_pipeline(self):
+        def add_one(x):
+            return x + 1
+
+        def double(x):
+            return x * 2
+
+        data = TEST_XARRAY_DATAARRAY.copy()
+        data.attrs["units"] = "K"
+
+        result = xarray_pipeline([add_one, double, add_one])(data)
+        assert isinstance(result, xr.DataArray)
+        assert result.attrs["units"] == "K"
+        np.testing.assert_array_equal(result.values, (TEST_NUMPY_ARRAY + 1) * 2 + 1)
+
+    def test_pipeline_kwargs_and_tuples(self):
+        def split(x, factor) -> Tuple[float, float]:
+            return x * factor, x
+
+        def combine(x, y) -> Tuple[float, float]:
+            return x + y, x - y
+
+        total, diff = xarray_pipeline([split, combine])(TEST_XARRAY_DATAARRAY, factor=3)
+        np.testing.assert_array_equal(total.values, TEST_NUMPY_ARRAY * 4)
+        np.testing.assert_array_equal(diff.values, TEST_NUMPY_ARRAY * 2)
+
+    def test_pipeline_single_layer(self):
+        pytest.importorskip("dask")
+
+        def add_one(x):
+            return x + 1
+
+        def double(x):
+            return x * 2
+
+        chunked = TEST_XARRAY_DATAARRAY.astype(np.float32).chunk({"x": 2})
+        chained = xarray_ufunc(double, xarray_ufunc(add_one, chunked))
+        fused = xarray_pipeline([add_one, double])(chunked)
+
+        assert len(fused.data.dask.layers) < len(chained.data.dask.layers)
+        assert fused.dtype == np.float32
+        np.testing.assert_array_equal(fused.values, chained.values)
+
+    def test_pipeline_empty(self):
+        with pytest.raises(ValueError):
+            xarray_pipeline([])
+
+
+class TestXarrayUfuncDevice:
+    """Test xarray_ufunc running func on another device or array namespace."""
+
+    def test_numpy_cpu(self):
+        calls = []
+
+        def add_one(x, factor=1):
+            calls.append(type(x))
+            return (x + 1) * factor
+
+        result = xarray_ufunc(
+            add_one,
+            TEST_XARRAY_DATAARRAY,
+            factor=2,
+            xarray_ufunc_kwargs={"array_namespace": "numpy", "device": "cpu"},
+        )
+        assert calls == [np.ndarray]
+        np.testing.assert_array_equal(result.values, (TEST_NUMPY_ARRAY + 1) * 2)
+
+    def test_stub_device(self, monkeypatch):
+        """The device is passed to convert and the result is moved back."""
+        import earthkit.utils.array
+
+        original = earthkit.utils.array.convert
+        devices = []
+
+        def _convert(array, *, device=None, array_namespace=None, **kwargs):
+            devices.append(device)
+            return original(array, array_namespace=array_namespace)
+
+        monkeypatch.setattr(earthkit.utils.array, "convert", _convert)
+
+        def split(x, y) -> Tuple[float, float]:
+            return x + y, x - y
+
+        total, diff = xarray_ufunc(
+            split, TEST_XARRAY_DATAARRAY, TEST_XARRAY_DATAARRAY, xarray_ufunc_kwargs={"device": "stub:0"}
+        )
+        assert devices == ["stub:0", "stub:0", "cpu", "cpu"]
+        np.testing.assert_array_equal(total.values, TEST_NUMPY_ARRAY * 2)
+        np.testing.assert_array_equal(diff.values, TEST_NUMPY_ARRAY * 0)
+
+    def test_torch_chunked(self):
+        torch = pytest.importorskip("torch")
+        pytest.importorskip("dask")
+
+        calls = []
+
+        def add_one(x):
+            calls.append(type(x))
+            return x + 1
+
+        chunked = TEST_XARRAY_DATAARRAY.astype(np.float32).chunk({"x": 2})
+        result = xarray_ufunc(add_one, chunked, xarray_ufunc_kwargs={"array_namespace": "torch", "device": "cpu"})
+
+        values = result.values
+        assert isinstance(values, np.ndarray)
+        assert result.dtype == np.float32
+        assert set(calls) == {torch.Tensor}
+        np.testing.assert_array_equal(values, TEST_NUMPY_ARRAY + 1)
+
+    @pytest.mark.parametrize("option", [{"device": "cpu"}, {"array_namespace": "numpy"}])
+    def test_dask_allowed(self, option):
+        calls = []
+
+        def add_one(x):
+            calls.append(type(x))
+            return x + 1
+
+        with pytest.raises(ValueError, match="dask"):
+            xarray_ufunc(add_one, TEST_XARRAY_DATAARRAY, xarray_ufunc_kwargs={"dask": "allowed", **option})
+        assert calls == []